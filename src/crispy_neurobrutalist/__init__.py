@@ -10,6 +10,7 @@ __author__ = "Jhonatan Rian"
 __email__ = "jhonatanrian@zohomail.com"
 __license__ = "CC-BY-NC-4.0"
 
+from crispy_neurobrutalist.dispatch import register_widget_template
 from crispy_neurobrutalist.layout import (
     Alert,
     Button,
@@ -20,7 +21,10 @@ from crispy_neurobrutalist.layout import (
     Reset,
     Submit,
 )
+from crispy_neurobrutalist.lazy_choices import register_lazy_form
 from crispy_neurobrutalist.neurobrutalist import CSSContainer
+from crispy_neurobrutalist.streaming import iter_crispy_form
+from crispy_neurobrutalist.tailwind import merge_classes
 
 __all__ = [
     "Alert",
@@ -32,6 +36,10 @@ __all__ = [
     "InlineRadios",
     "Reset",
     "Submit",
+    "iter_crispy_form",
+    "merge_classes",
+    "register_lazy_form",
+    "register_widget_template",
     "__version__",
 ]
 
@@ -29,3 +29,8 @@ class CrispyNeurobrutalistConfig(AppConfig):
                 UserWarning,
                 stacklevel=2,
             )
+
+        from crispy_neurobrutalist.warmup import warm_up, warm_up_enabled
+
+        if warm_up_enabled():
+            warm_up()
@@ -0,0 +1,25 @@
+"""
+Benchmark suite for the neobrutalist template pack.
+
+Renders synthetic forms (N fields per widget type; unbound, bound and with errors),
+formsets of N rows and large selects through ``{{ form|crispy }}``, and reports the
+mean/p95 render latency, peak traced allocations and output bytes per field.
+Results can be saved as JSON and compared against a baseline to catch regressions.
+``stress()`` renders one shared form from several threads and reports the throughput.
+Run it with ``python -m crispy_neurobrutalist.bench --help``.
+"""
+
+from crispy_neurobrutalist.bench.runner import BenchResult, compare, measure, run_benchmarks
+from crispy_neurobrutalist.bench.scenarios import Scenario, build_scenarios
+from crispy_neurobrutalist.bench.threads import ThreadResult, stress
+
+__all__ = [
+    "BenchResult",
+    "Scenario",
+    "ThreadResult",
+    "build_scenarios",
+    "compare",
+    "measure",
+    "run_benchmarks",
+    "stress",
+]
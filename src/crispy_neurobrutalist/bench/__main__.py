@@ -0,0 +1,110 @@
+"""
+Command line entry point of the benchmark suite::
+
+    python -m crispy_neurobrutalist.bench --save baseline.json
+    python -m crispy_neurobrutalist.bench --baseline baseline.json --threshold 0.15
+    python -m crispy_neurobrutalist.bench --threads 1,2,4,8 --only select/bound
+
+Exits with status 1 when a gated metric regressed past the threshold, or when a
+concurrent render returned different HTML than a single-threaded one.
+"""
+
+import argparse
+import sys
+
+from crispy_neurobrutalist.bench.runner import (
+    DEFAULT_THRESHOLD,
+    compare,
+    format_table,
+    load,
+    run_benchmarks,
+    save,
+    setup_django,
+    to_json,
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m crispy_neurobrutalist.bench",
+        description="Benchmark the neobrutalist template pack.",
+    )
+    parser.add_argument("--fields", type=int, default=20, help="fields per widget-type form")
+    parser.add_argument("--rows", type=int, default=50, help="rows of the formset scenario")
+    parser.add_argument("--options", type=int, default=2000, help="options of the large select")
+    parser.add_argument("--repeat", type=int, default=30, help="timed renders per scenario")
+    parser.add_argument("--warmup", type=int, default=3, help="untimed renders per scenario")
+    parser.add_argument("--only", help="only run scenarios whose name starts with this")
+    parser.add_argument("--save", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against a saved JSON")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed relative growth of gated metrics (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--threads",
+        type=thread_counts,
+        metavar="N,N,...",
+        help="render a shared form from these thread counts instead (stress benchmark)",
+    )
+    return parser
+
+
+def thread_counts(value: str) -> tuple[int, ...]:
+    try:
+        counts = tuple(int(count) for count in value.split(","))
+    except ValueError:
+        counts = ()
+    if not counts or min(counts) < 1:
+        raise argparse.ArgumentTypeError(f"expected positive integers, got {value!r}")
+    return counts
+
+
+def run_stress(scenarios: list, args: argparse.Namespace) -> int:
+    from crispy_neurobrutalist.bench.threads import format_thread_table, stress
+
+    results = [
+        result
+        for scenario in scenarios
+        if args.only is None or scenario.name.startswith(args.only)
+        for result in stress(scenario, args.threads, args.repeat)
+    ]
+    print(format_thread_table(results))
+    if any(result.mismatches for result in results):
+        print("\nConcurrent renders returned different HTML.")
+        return 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    setup_django()
+
+    from crispy_neurobrutalist.bench.scenarios import build_scenarios
+
+    scenarios = build_scenarios(args.fields, args.rows, args.options)
+    if args.threads:
+        return run_stress(scenarios, args)
+
+    results = run_benchmarks(scenarios, args.repeat, args.warmup, args.only)
+    print(format_table(results))
+
+    if args.save:
+        params = {"fields": args.fields, "rows": args.rows, "options": args.options}
+        save(to_json(results, params), args.save)
+
+    if args.baseline:
+        regressions = compare(load(args.baseline), results, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"\nNo regressions over {args.threshold:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
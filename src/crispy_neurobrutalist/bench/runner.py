@@ -0,0 +1,186 @@
+"""Measure render latency, allocations and output size of benchmark scenarios."""
+
+import json
+import math
+import os
+import platform
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from crispy_neurobrutalist.bench.scenarios import Scenario
+
+# Metrics compared against a baseline; p95 is reported but too noisy to gate on.
+GATED_METRICS = ("mean_ms", "peak_alloc_bytes", "bytes_per_field")
+DEFAULT_THRESHOLD = 0.10
+
+
+class BenchResult(NamedTuple):
+    """Measurements of one scenario."""
+
+    name: str
+    mean_ms: float
+    p95_ms: float
+    peak_alloc_bytes: int
+    output_bytes: int
+    bytes_per_field: float
+
+    def as_dict(self) -> dict[str, Any]:
+        result = self._asdict()
+        del result["name"]
+        return result
+
+
+def setup_django() -> None:
+    """Configure a minimal Django project unless one is already configured."""
+    import django
+    from django.conf import settings
+
+    if not settings.configured and "DJANGO_SETTINGS_MODULE" not in os.environ:
+        settings.configure(
+            DEBUG=False,
+            SECRET_KEY="crispy-neurobrutalist-bench",
+            INSTALLED_APPS=["crispy_forms", "crispy_neurobrutalist"],
+            TEMPLATES=[
+                {"BACKEND": "django.template.backends.django.DjangoTemplates", "APP_DIRS": True}
+            ],
+            CRISPY_ALLOWED_TEMPLATE_PACKS="neobrutalist",
+            CRISPY_TEMPLATE_PACK="neobrutalist",
+            USE_TZ=True,
+        )
+    django.setup()
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """Nearest-rank percentile of ``values``."""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(percent / 100 * len(ordered)) - 1, 0)]
+
+
+def measure(scenario: Scenario, repeat: int = 30, warmup: int = 3) -> BenchResult:
+    """Render ``scenario`` ``repeat`` times and collect its measurements."""
+    from django.template import Context, Template
+
+    template = Template("{% load neuro_filters %}{{ form|crispy }}")
+
+    def prepare() -> Context:
+        form = scenario.make()
+        if form.is_bound:
+            # Validation isn't part of the pack's cost; run it before timing.
+            form.errors  # noqa: B018
+        return Context({"form": form})
+
+    def render() -> tuple[str, float]:
+        context = prepare()
+        start = time.perf_counter()
+        html = template.render(context)
+        return html, time.perf_counter() - start
+
+    for _ in range(warmup):
+        render()
+    timings = [render()[1] for _ in range(max(repeat, 1))]
+
+    # Allocations are traced in a separate render so tracing doesn't skew timings.
+    context = prepare()
+    tracemalloc.start()
+    try:
+        html = template.render(context)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    output_bytes = len(html.encode())
+    return BenchResult(
+        name=scenario.name,
+        mean_ms=round(sum(timings) / len(timings) * 1000, 4),
+        p95_ms=round(percentile(timings, 95) * 1000, 4),
+        peak_alloc_bytes=peak,
+        output_bytes=output_bytes,
+        bytes_per_field=round(output_bytes / max(scenario.fields, 1), 1),
+    )
+
+
+def run_benchmarks(
+    scenarios: list[Scenario], repeat: int = 30, warmup: int = 3, only: str | None = None
+) -> list[BenchResult]:
+    """Measure every scenario whose name starts with ``only`` (all by default)."""
+    return [
+        measure(scenario, repeat, warmup)
+        for scenario in scenarios
+        if only is None or scenario.name.startswith(only)
+    ]
+
+
+def to_json(results: list[BenchResult], params: dict[str, Any]) -> dict[str, Any]:
+    import django
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "params": params,
+        },
+        "results": {result.name: result.as_dict() for result in results},
+    }
+
+
+def save(report: dict[str, Any], path: str | Path) -> None:
+    Path(path).write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+def load(path: str | Path) -> dict[str, Any]:
+    return json.loads(Path(path).read_text())
+
+
+def compare(
+    baseline: dict[str, Any], results: list[BenchResult], threshold: float = DEFAULT_THRESHOLD
+) -> list[str]:
+    """
+    Return a description of every gated metric that grew more than ``threshold``.
+
+    Scenarios missing from the baseline are ignored.
+    """
+    regressions = []
+    previous = baseline.get("results", {})
+    for result in results:
+        before = previous.get(result.name)
+        if before is None:
+            continue
+        for metric in GATED_METRICS:
+            old, new = before.get(metric), getattr(result, metric)
+            if old and new > old * (1 + threshold):
+                regressions.append(
+                    f"{result.name}: {metric} {old} -> {new} (+{(new / old - 1) * 100:.1f}%)"
+                )
+    return regressions
+
+
+def format_rows(header: tuple[str, ...], rows: list[tuple[str, ...]]) -> str:
+    """Align ``rows`` under ``header``: the first column left, the others right."""
+    widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+    lines = [
+        "  ".join(
+            cell.ljust(width) if i == 0 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths, strict=True))
+        )
+        for row in [header, *rows]
+    ]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def format_table(results: list[BenchResult]) -> str:
+    return format_rows(
+        ("scenario", "mean ms", "p95 ms", "peak alloc KiB", "bytes/field"),
+        [
+            (
+                result.name,
+                f"{result.mean_ms:.3f}",
+                f"{result.p95_ms:.3f}",
+                f"{result.peak_alloc_bytes / 1024:.1f}",
+                f"{result.bytes_per_field:.1f}",
+            )
+            for result in results
+        ],
+    )
@@ -0,0 +1,132 @@
+"""
+Synthetic forms and formsets rendered by the benchmark suite.
+
+Every scenario builds a fresh form (or formset) per render, so measurements aren't
+skewed by state left on widgets by a previous render.
+"""
+
+from collections.abc import Callable, Iterator
+from typing import Any, NamedTuple
+
+from django import forms
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+STATES = ("unbound", "bound", "errors")
+
+
+class WidgetCase(NamedTuple):
+    """One widget type: how to build its field and a valid submitted value."""
+
+    name: str
+    make_field: Callable[[], forms.Field]
+    value: Any
+    is_file: bool = False
+
+
+class Scenario(NamedTuple):
+    """A named render target and the number of fields it renders."""
+
+    name: str
+    make: Callable[[], Any]
+    fields: int
+
+
+CHOICES = [("a", "Alpha"), ("b", "Beta"), ("c", "Gamma"), ("d", "Delta")]
+
+WIDGET_CASES = (
+    WidgetCase("text", forms.CharField, "hello"),
+    WidgetCase("number", forms.IntegerField, "42"),
+    WidgetCase("email", forms.EmailField, "ann@example.com"),
+    WidgetCase("url", forms.URLField, "https://example.com"),
+    WidgetCase("password", lambda: forms.CharField(widget=forms.PasswordInput), "secret"),
+    WidgetCase("textarea", lambda: forms.CharField(widget=forms.Textarea), "Some\nlines"),
+    WidgetCase("date", lambda: forms.DateField(widget=forms.DateInput), "2024-02-01"),
+    WidgetCase(
+        "datetime", lambda: forms.DateTimeField(widget=forms.DateTimeInput), "2024-02-01 10:30"
+    ),
+    WidgetCase("time", lambda: forms.TimeField(widget=forms.TimeInput), "10:30"),
+    WidgetCase("checkbox", forms.BooleanField, "on"),
+    WidgetCase("select", lambda: forms.ChoiceField(choices=CHOICES), "b"),
+    WidgetCase("selectmultiple", lambda: forms.MultipleChoiceField(choices=CHOICES), ["a", "c"]),
+    WidgetCase(
+        "radioselect", lambda: forms.ChoiceField(choices=CHOICES, widget=forms.RadioSelect), "c"
+    ),
+    WidgetCase(
+        "checkboxselectmultiple",
+        lambda: forms.MultipleChoiceField(choices=CHOICES, widget=forms.CheckboxSelectMultiple),
+        ["b", "d"],
+    ),
+    WidgetCase("file", lambda: forms.FileField(widget=forms.FileInput), "report.txt", True),
+    WidgetCase("clearablefile", forms.FileField, "report.txt", True),
+    WidgetCase("splitdatetime", forms.SplitDateTimeField, ["2024-02-01", "10:30"]),
+    WidgetCase("hidden", lambda: forms.CharField(widget=forms.HiddenInput), "token"),
+)
+
+
+def form_class(name: str, fields: dict[str, forms.Field]) -> type[forms.Form]:
+    return type(f"{name.title().replace('-', '')}BenchForm", (forms.Form,), fields)
+
+
+def submitted(case: WidgetCase, names: list[str]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return ``(data, files)`` submitting ``case.value`` for every field in ``names``."""
+    data: dict[str, Any] = {}
+    files: dict[str, Any] = {}
+    for name in names:
+        if case.is_file:
+            files[name] = SimpleUploadedFile(case.value, b"content")
+        elif case.name == "splitdatetime":
+            data[f"{name}_0"], data[f"{name}_1"] = case.value
+        else:
+            data[name] = case.value
+    return data, files
+
+
+def widget_scenarios(case: WidgetCase, fields: int) -> Iterator[Scenario]:
+    """Yield the unbound, bound and errors scenarios of ``fields`` ``case`` fields."""
+    names = [f"{case.name}_{i}" for i in range(fields)]
+    klass = form_class(case.name, {name: case.make_field() for name in names})
+
+    def bound() -> forms.Form:
+        data, files = submitted(case, names)
+        return klass(data, files)
+
+    yield Scenario(f"{case.name}/unbound", klass, fields)
+    yield Scenario(f"{case.name}/bound", bound, fields)
+    # Every field is required, so an empty submission has one error per field.
+    yield Scenario(f"{case.name}/errors", lambda: klass({}), fields)
+
+
+class RowForm(forms.Form):
+    """Mixed row form used by the formset scenario."""
+
+    title = forms.CharField()
+    amount = forms.IntegerField(required=False)
+    kind = forms.ChoiceField(choices=CHOICES)
+    done = forms.BooleanField(required=False)
+    notes = forms.CharField(widget=forms.Textarea, required=False)
+
+
+def formset_scenario(rows: int) -> Scenario:
+    formset_class = forms.formset_factory(RowForm, extra=rows)
+    return Scenario(f"formset/{rows}-rows", formset_class, rows * len(RowForm.base_fields))
+
+
+def large_select_scenario(options: int) -> Scenario:
+    choices = [(f"o{i}", f"Option {i}") for i in range(options)]
+    klass = form_class(
+        "large-select",
+        {
+            "single": forms.ChoiceField(choices=choices),
+            "multiple": forms.MultipleChoiceField(choices=choices),
+        },
+    )
+    initial = {"single": f"o{options // 2}", "multiple": ["o1", f"o{options - 1}"]}
+    return Scenario(f"select/{options}-options", lambda: klass(initial=initial), 2)
+
+
+def build_scenarios(fields: int = 20, rows: int = 50, options: int = 2000) -> list[Scenario]:
+    """Return every benchmark scenario."""
+    scenarios = [scenario for case in WIDGET_CASES for scenario in widget_scenarios(case, fields)]
+    scenarios.append(formset_scenario(rows))
+    scenarios.append(large_select_scenario(options))
+    return scenarios
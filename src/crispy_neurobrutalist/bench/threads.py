@@ -0,0 +1,105 @@
+"""
+Multithreaded stress benchmark.
+
+Renders one shared form instance from several threads at once and reports the
+throughput per thread count, checking that every render returns the same HTML as
+a single-threaded render. On a GIL build throughput stays roughly flat as threads
+are added; the HTML check is what catches renders that share mutable state. On a
+free-threaded build (``python3.13t``) throughput should grow with the threads.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import NamedTuple
+
+from crispy_neurobrutalist.bench.runner import format_rows
+from crispy_neurobrutalist.bench.scenarios import Scenario
+
+DEFAULT_THREADS = (1, 2, 4, 8)
+
+
+class ThreadResult(NamedTuple):
+    """Throughput of one scenario rendered by ``threads`` threads."""
+
+    name: str
+    threads: int
+    renders_per_s: float
+    speedup: float
+    mismatches: int
+
+
+def render_concurrently(
+    render: Callable[[], str], threads: int, renders: int, expected: str
+) -> tuple[float, int]:
+    """
+    Call ``render()`` ``renders`` times in each of ``threads`` threads.
+
+    Returns the elapsed seconds and the number of results that differed from ``expected``.
+    """
+    barrier = threading.Barrier(threads + 1)
+    mismatches = [0] * threads
+
+    def work(index: int) -> None:
+        barrier.wait()
+        for _ in range(renders):
+            if render() != expected:
+                mismatches[index] += 1
+
+    workers = [threading.Thread(target=work, args=(index,)) for index in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start, sum(mismatches)
+
+
+def stress(
+    scenario: Scenario, threads: tuple[int, ...] = DEFAULT_THREADS, renders: int = 30
+) -> list[ThreadResult]:
+    """Render one instance of ``scenario`` from each thread count in ``threads``."""
+    from django.template import Context, Template
+
+    template = Template("{% load neuro_filters %}{{ form|crispy }}")
+    form = scenario.make()
+    if form.is_bound:
+        form.errors  # noqa: B018
+
+    def render() -> str:
+        return template.render(Context({"form": form}))
+
+    expected = render()
+    results = []
+    for count in threads:
+        elapsed, mismatches = render_concurrently(render, count, renders, expected)
+        renders_per_s = count * renders / elapsed
+        # Speedup is relative to the first (usually single-threaded) run.
+        baseline = results[0].renders_per_s if results else renders_per_s
+        results.append(
+            ThreadResult(
+                name=scenario.name,
+                threads=count,
+                renders_per_s=round(renders_per_s, 1),
+                speedup=round(renders_per_s / baseline, 2),
+                mismatches=mismatches,
+            )
+        )
+    return results
+
+
+def format_thread_table(results: list[ThreadResult]) -> str:
+    return format_rows(
+        ("scenario", "threads", "renders/s", "speedup", "mismatches"),
+        [
+            (
+                result.name,
+                str(result.threads),
+                f"{result.renders_per_s:.1f}",
+                f"{result.speedup:.2f}x",
+                str(result.mismatches),
+            )
+            for result in results
+        ],
+    )
@@ -0,0 +1,89 @@
+"""Small in-process caches shared by the pack's render paths."""
+
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from collections.abc import Callable, Hashable
+from typing import Any
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize", "weight"])
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache with hit/miss statistics.
+
+    Bounded by ``maxsize`` entries and, optionally, by ``maxweight`` where each
+    value weighs ``weigh(value)`` (e.g. its length in characters). Entries expire
+    ``ttl`` seconds after being set when ``ttl`` is given.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        maxweight: int | None = None,
+        weigh: Callable[[Any], int] = len,
+        ttl: float | None = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.maxweight = maxweight
+        self.weigh = weigh
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[Any, int, float | None]] = OrderedDict()
+        self._weight = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                value, weight, expires = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                self._weight -= weight
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        weight = self.weigh(value) if self.maxweight is not None else 0
+        if self.maxweight is not None and weight > self.maxweight:
+            return
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._weight -= old[1]
+            self._data[key] = (value, weight, expires)
+            self._weight += weight
+            while len(self._data) > self.maxsize or (
+                self.maxweight is not None and self._weight > self.maxweight
+            ):
+                _key, (_value, evicted, _expires) = self._data.popitem(last=False)
+                self._weight -= evicted
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._weight -= old[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._weight = 0
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._data), self._weight)
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,86 @@
+"""
+Configuration of ``{% neo_field %}`` resolved once per form render.
+
+The settings read while rendering a field are snapshotted in ``pack_settings()``
+and refreshed on ``setting_changed``. The filters that render a whole form put a
+``RenderConfig`` into the template context under ``RENDER_CONFIG``, so each field
+reads local attributes instead of walking the context stack and the settings.
+Templates rendered without one (e.g. ``{% crispy %}``) resolve it per field.
+"""
+
+from functools import cache
+from typing import Any, NamedTuple
+
+from crispy_forms.utils import TEMPLATE_PACK
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+RENDER_CONFIG = "neo_render_config"
+
+SNAPSHOT_SETTINGS = (
+    "CRISPY_CLASS_CONVERTERS",
+    "CRISPY_NEUROBRUTALIST_NATIVE_WIDGETS",
+    "CRISPY_NEUROBRUTALIST_SEMANTIC_CLASSES",
+    "CRISPY_NEUROBRUTALIST_THEME_VARIABLES",
+)
+
+
+class PackSettings(NamedTuple):
+    """Settings read by ``{% neo_field %}``."""
+
+    class_converters: dict[str, str]
+    native_widgets: bool
+    semantic_classes: bool
+    theme_variables: bool
+
+
+@cache
+def pack_settings() -> PackSettings:
+    return PackSettings(
+        class_converters=dict(getattr(settings, "CRISPY_CLASS_CONVERTERS", {})),
+        native_widgets=getattr(settings, "CRISPY_NEUROBRUTALIST_NATIVE_WIDGETS", True),
+        semantic_classes=getattr(settings, "CRISPY_NEUROBRUTALIST_SEMANTIC_CLASSES", False),
+        theme_variables=getattr(settings, "CRISPY_NEUROBRUTALIST_THEME_VARIABLES", False),
+    )
+
+
+@receiver(setting_changed, dispatch_uid="crispy_neurobrutalist_pack_settings_changed")
+def pack_settings_changed(sender, setting, **kwargs):
+    if setting in SNAPSHOT_SETTINGS:
+        pack_settings.cache_clear()
+
+
+class RenderConfig(NamedTuple):
+    """Context values and settings shared by every field of one form render."""
+
+    template_pack: str
+    # ``None`` when the context has no ``css_container``: the tag uses its default.
+    css_container: Any
+    html5_required: bool
+    class_converters: dict[str, str]
+    native_widgets: bool
+    semantic_classes: bool
+    theme_variables: bool
+
+
+def resolve_render_config(context: Any) -> RenderConfig:
+    """Build the ``RenderConfig`` for ``context`` (a ``Context`` or a dict)."""
+    snapshot = pack_settings()
+    return RenderConfig(
+        template_pack=context.get("template_pack", TEMPLATE_PACK),
+        css_container=context.get("css_container"),
+        html5_required=bool(context.get("html5_required", False)),
+        class_converters=snapshot.class_converters,
+        native_widgets=snapshot.native_widgets,
+        semantic_classes=snapshot.semantic_classes,
+        theme_variables=snapshot.theme_variables,
+    )
+
+
+def render_config(context: Any) -> RenderConfig:
+    """Return the ``RenderConfig`` of the current form render, resolving it if missing."""
+    config = context.get(RENDER_CONFIG)
+    if config is None:
+        config = resolve_render_config(context)
+    return config
@@ -0,0 +1,165 @@
+"""
+Critical CSS of form pages.
+
+``{% neo_critical_css form %}`` inlines the rules of ``neurobrutalist.css`` that a
+form's widgets and helper layout can use (custom checkboxes and radios, the
+``neo-shadow*`` and ``neo-button`` rules, the select2 theme when a select2 widget
+is present) in a ``<style>`` element, and loads the full stylesheet without
+blocking the first paint::
+
+    <head>
+        {% load neo_field %}
+        {% neo_critical_css form %}
+    </head>
+
+Pass several forms or formsets to cover them all, and ``load_stylesheet=False``
+when the page already links the stylesheet. The classes are collected once per
+form class, from the templates the pack's widget dispatch picks for its fields
+and from its helper layout.
+"""
+
+from collections.abc import Iterable, Iterator
+from functools import cache, lru_cache
+from typing import Any
+
+from django.template.loader import get_template
+from django.templatetags.static import static
+from django.utils.html import format_html
+from django.utils.safestring import SafeString, mark_safe
+
+from crispy_neurobrutalist.cache import LRUCache
+from crispy_neurobrutalist.dispatch import get_widget_template
+from crispy_neurobrutalist.neurobrutalist import widget_style_key
+from crispy_neurobrutalist.safelist import template_classes
+from crispy_neurobrutalist.stylesheet import (
+    EXTERNAL_CLASSES,
+    STYLESHEET,
+    extract_css,
+    stylesheet_rules,
+)
+
+CRITICAL_CACHE_SIZE = 256
+
+form_styles_cache = LRUCache(CRITICAL_CACHE_SIZE)
+
+# Form-level templates rendered around the fields.
+FORM_TEMPLATES = ("neobrutalist/errors.html",)
+FORMSET_TEMPLATES = ("neobrutalist/errors.html", "neobrutalist/errors_formset.html")
+
+# Attributes of crispy layout objects holding classes.
+LAYOUT_CLASS_ATTRIBUTES = ("css_class", "field_classes", "wrapper_class")
+
+
+@cache
+def template_name_classes(template_name: str) -> frozenset[str]:
+    return frozenset(template_classes(get_template(template_name).template.source))
+
+
+def widget_classes(field: Any) -> Iterator[str]:
+    """Yield the classes the pack renders for a bound field's widget."""
+    from crispy_neurobrutalist.templatetags.neo_field import CrispyNeuroBrutaListFieldNode
+
+    template_name = get_widget_template(field)
+    if template_name is not None:
+        yield from template_name_classes(template_name)
+    # Widget templates and ``{% neo_field %}`` both style with the container.
+    container = CrispyNeuroBrutaListFieldNode.default_container
+    key = widget_style_key(field.field.widget.__class__)
+    for errors in (False, True):
+        yield from container.as_dict(errors=errors).get(key, "").split()
+
+
+def layout_classes(layout_object: Any) -> Iterator[str]:
+    """Yield the classes set on a crispy layout object and its children."""
+    for attribute in LAYOUT_CLASS_ATTRIBUTES:
+        css_class = getattr(layout_object, attribute, None)
+        if isinstance(css_class, str):
+            yield from css_class.split()
+    attrs = getattr(layout_object, "attrs", None)
+    if isinstance(attrs, dict) and isinstance(attrs.get("class"), str):
+        yield from attrs["class"].split()
+    for child in getattr(layout_object, "fields", ()):
+        if not isinstance(child, str):
+            yield from layout_classes(child)
+
+
+def widget_external_prefixes(widget_class: type) -> Iterator[str]:
+    for klass in widget_class.__mro__:
+        for prefix, module in EXTERNAL_CLASSES.items():
+            if klass.__module__.split(".")[0] == module:
+                yield prefix
+
+
+def form_styles(form: Any) -> tuple[frozenset[str], frozenset[str]]:
+    """
+    Return the classes and third-party class prefixes a form can render.
+
+    Formsets use their ``empty_form``. Results are cached per form class.
+    """
+    template_names = FORM_TEMPLATES
+    if hasattr(form, "empty_form"):
+        form = form.empty_form
+        template_names = FORMSET_TEMPLATES
+    key = (type(form), template_names)
+    styles = form_styles_cache.get(key)
+    if styles is not None:
+        return styles
+
+    classes: set[str] = set()
+    for template_name in template_names:
+        classes.update(template_name_classes(template_name))
+    external: set[str] = set()
+    for field in form:
+        if field.is_hidden:
+            continue
+        classes.update(widget_classes(field))
+        external.update(widget_external_prefixes(field.field.widget.__class__))
+    helper = getattr(form, "helper", None)
+    if helper is not None:
+        for layout_object in (getattr(helper, "layout", None), *getattr(helper, "inputs", ())):
+            if layout_object is not None:
+                classes.update(layout_classes(layout_object))
+
+    styles = (frozenset(classes), frozenset(external))
+    form_styles_cache.set(key, styles)
+    return styles
+
+
+@lru_cache(maxsize=CRITICAL_CACHE_SIZE)
+def critical_rules(classes: frozenset[str], external: frozenset[str]) -> str:
+    return extract_css(stylesheet_rules(), classes, tuple(sorted(external)))
+
+
+def critical_css(forms: Iterable[Any]) -> str:
+    """Return the minified stylesheet rules used by ``forms``."""
+    classes: frozenset[str] = frozenset()
+    external: frozenset[str] = frozenset()
+    for form in forms:
+        form_classes, form_external = form_styles(form)
+        classes |= form_classes
+        external |= form_external
+    return critical_rules(classes, external)
+
+
+def render_critical_css(forms: Iterable[Any], load_stylesheet: bool = True) -> SafeString:
+    """Render the ``<style>`` element of ``forms`` and the non-blocking stylesheet link."""
+    # CSS isn't HTML-escaped; only a closing tag could end the element early.
+    css = critical_css(forms).replace("</", "<\\/")
+    html = mark_safe(f"<style>{css}</style>")
+    if load_stylesheet:
+        href = static(STYLESHEET)
+        html += format_html(
+            '<link rel="preload" href="{}" as="style" '
+            "onload=\"this.onload=null;this.rel='stylesheet'\">"
+            '<noscript><link rel="stylesheet" href="{}"></noscript>',
+            href,
+            href,
+        )
+    return html
+
+
+def clear_critical_cache() -> None:
+    form_styles_cache.clear()
+    template_name_classes.cache_clear()
+    critical_rules.cache_clear()
+    stylesheet_rules.cache_clear()
@@ -0,0 +1,96 @@
+"""Widget class to layout template dispatch for the neobrutalist field template."""
+
+from typing import Any
+
+from django import forms
+
+
+class WidgetTemplateRegistry:
+    """
+    Map widget classes to the layout template used to render them.
+
+    Lookups walk the widget class MRO, so an entry for a base class also covers
+    its subclasses unless a more specific class is registered (``ClearableFileInput``
+    wins over ``FileInput``). A ``None`` template means the widget is rendered
+    directly with ``{% neo_field %}``. Resolved templates are cached per widget class.
+
+    Example:
+        >>> from crispy_neurobrutalist.dispatch import register_widget_template
+        >>> register_widget_template(ColorWidget, "myapp/layout/color.html")
+    """
+
+    def __init__(self, templates: dict[type, str | None] | None = None) -> None:
+        self._templates: dict[type, str | None] = dict(templates or {})
+        self._resolved: dict[type, str | None] = {}
+        self._optional_loaded = False
+
+    def register(self, widget_class: type, template_name: str | None = None) -> None:
+        """Render ``widget_class`` (and its subclasses) with ``template_name``."""
+        self._templates[widget_class] = template_name
+        self._resolved.clear()
+
+    def unregister(self, widget_class: type) -> None:
+        """Remove the entry for ``widget_class``; missing entries are ignored."""
+        self._templates.pop(widget_class, None)
+        self._resolved.clear()
+
+    def resolve(self, widget_class: type) -> str | None:
+        """Return the template registered for ``widget_class`` or its closest base."""
+        try:
+            return self._resolved[widget_class]
+        except KeyError:
+            pass
+
+        if not self._optional_loaded:
+            self._load_optional()
+
+        template_name = None
+        for klass in widget_class.__mro__:
+            if klass in self._templates:
+                template_name = self._templates[klass]
+                break
+
+        self._resolved[widget_class] = template_name
+        return template_name
+
+    def _load_optional(self) -> None:
+        """Register widgets from optional packages once, on first lookup."""
+        self._optional_loaded = True
+        try:
+            from django_select2.forms import Select2Mixin
+        except ImportError:
+            return
+        # Select2 widgets are also ``Select`` subclasses, but must keep their own markup.
+        self._templates.setdefault(Select2Mixin, None)
+        self._resolved.clear()
+
+
+widget_templates = WidgetTemplateRegistry(
+    {
+        forms.CheckboxInput: "neobrutalist/layout/checkbox.html",
+        forms.ClearableFileInput: "neobrutalist/layout/clearablefileinput.html",
+        forms.FileInput: "neobrutalist/layout/fileinput.html",
+        forms.CheckboxSelectMultiple: "neobrutalist/layout/checkboxselectmultiple.html",
+        forms.RadioSelect: "neobrutalist/layout/radioselect.html",
+        forms.SelectMultiple: "neobrutalist/layout/multiselect.html",
+        forms.Select: "neobrutalist/layout/select.html",
+        forms.Textarea: "neobrutalist/layout/textarea.html",
+        forms.DateInput: "neobrutalist/layout/dateinput.html",
+        forms.DateTimeInput: "neobrutalist/layout/datetimeinput.html",
+        forms.TimeInput: "neobrutalist/layout/timeinput.html",
+        forms.NumberInput: "neobrutalist/layout/numberinput.html",
+        forms.EmailInput: "neobrutalist/layout/emailinput.html",
+        forms.URLInput: "neobrutalist/layout/urlinput.html",
+        forms.PasswordInput: "neobrutalist/layout/passwordinput.html",
+    }
+)
+
+
+def register_widget_template(widget_class: type, template_name: str | None = None) -> None:
+    """Register ``template_name`` for ``widget_class`` in the default registry."""
+    widget_templates.register(widget_class, template_name)
+
+
+def get_widget_template(field: Any) -> str | None:
+    """Return the layout template for a bound field's widget, or ``None``."""
+    return widget_templates.resolve(field.field.widget.__class__)
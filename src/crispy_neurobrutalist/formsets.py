@@ -0,0 +1,124 @@
+"""
+Row-batched rendering of formsets.
+
+``{{ formset|crispy }}`` renders ``uni_formset.html``: the management form, the
+formset errors and one ``uni_form.html`` per row. Instead of a full template render
+per row, the row layout is compiled once from ``formset.empty_form`` into a render
+plan that every row with the same fields reuses. Rows whose fields differ (e.g. a
+``DELETE`` checkbox only on initial forms) get their own plan.
+
+Model choice fields built from the same queryset evaluate it once per formset:
+the rows share the fetched choices instead of running one query per row.
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+from django.core.exceptions import EmptyResultSet
+from django.forms.models import ModelChoiceField, ModelChoiceIterator
+from django.template.loader import get_template
+from django.utils.safestring import SafeString, mark_safe
+
+from crispy_neurobrutalist.plan import (
+    collapse_chunks,
+    form_signature,
+    get_form_plan,
+    iter_form_parts,
+    pack_templates_in_effect,
+    render_plans_enabled,
+)
+
+FORMSET_TEMPLATES = ("uni_formset.html",)
+
+FORMSET_ROW_OPEN = '<div class="multiField">'
+FORMSET_ROW_CLOSE = "</div>"
+
+
+def formset_template_in_effect(template_pack: str) -> bool:
+    """Check that ``uni_formset.html`` is the one mirrored by this module."""
+    return template_pack == "neobrutalist" and pack_templates_in_effect(FORMSET_TEMPLATES)
+
+
+def iter_formset_forms(formset: Any) -> Iterator[Any]:
+    """
+    Iterate over the forms of ``formset``, building them one at a time.
+
+    Mirrors ``BaseFormSet.forms`` without keeping every form alive; if the forms
+    were already built (e.g. by validation) those instances are reused.
+    """
+    if "forms" in formset.__dict__:
+        yield from formset.forms
+        return
+    for i in range(formset.total_form_count()):
+        yield formset._construct_form(i, **formset.get_form_kwargs(i))
+
+
+def model_choices_key(field: ModelChoiceField) -> tuple[Any, ...] | None:
+    """Describe where a model choice field's choices come from, or ``None`` if unknown."""
+    if not isinstance(field.widget.choices, ModelChoiceIterator):
+        return None
+    queryset = field.queryset
+    try:
+        query = str(queryset.query)
+    except EmptyResultSet:
+        return None
+    label_from_instance = getattr(field.label_from_instance, "__func__", field.label_from_instance)
+    return (
+        type(field),
+        queryset.model,
+        queryset.db,
+        query,
+        field.to_field_name,
+        field.empty_label,
+        field.iterator,
+        label_from_instance,
+    )
+
+
+def share_model_choices(form: Any, shared: dict[Any, list[Any]]) -> None:
+    """Point the model choice widgets of ``form`` at choices already fetched for a row."""
+    for name, field in form.fields.items():
+        if not isinstance(field, ModelChoiceField):
+            continue
+        key = model_choices_key(field)
+        if key is None:
+            continue
+        key = (name, key)
+        choices = shared.get(key)
+        if choices is None:
+            # iter() so list() doesn't call ModelChoiceIterator.__len__ (a COUNT query).
+            choices = shared[key] = list(iter(field.widget.choices))
+        field.widget.choices = choices
+
+
+def iter_formset_parts(formset: Any, context: dict[str, Any], template_pack: str) -> Iterator[str]:
+    """Yield the uncollapsed markup pieces of ``uni_formset.html``, row by row."""
+    yield from iter_form_parts(formset.management_form, context, template_pack)
+    if context.get("form_show_errors") and formset.non_form_errors():
+        yield get_template(f"{template_pack}/errors_formset.html").render(
+            {**context, "formset": formset}
+        )
+
+    row_plan = row_signature = None
+    if render_plans_enabled():
+        empty_form = formset.empty_form
+        row_signature = form_signature(empty_form)
+        row_plan = get_form_plan(
+            empty_form, template_pack, context["label_class"], context["field_class"]
+        )
+
+    shared_choices: dict[Any, list[Any]] = {}
+    for form in iter_formset_forms(formset):
+        share_model_choices(form, shared_choices)
+        yield FORMSET_ROW_OPEN
+        if row_plan is not None and form_signature(form) == row_signature:
+            yield from row_plan.render_parts(form, {**context, "form": form})
+        else:
+            yield from iter_form_parts(form, context, template_pack)
+        yield FORMSET_ROW_CLOSE
+
+
+def render_formset(formset: Any, context: dict[str, Any], template_pack: str) -> SafeString:
+    """Render ``formset`` like ``uni_formset.html`` with the row-batched engine."""
+    html = "".join(collapse_chunks(iter_formset_parts(formset, context, template_pack)))
+    return mark_safe(f"\n\n{html}\n")
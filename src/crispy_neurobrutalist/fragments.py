@@ -0,0 +1,264 @@
+"""
+Rendered-fragment cache for unbound forms.
+
+``{% crispy_cached form [helper] %}`` renders like crispy's ``{% crispy %}`` tag but
+keeps the HTML of unbound forms, so login, search or signup forms rendered on every
+request are only rendered once. The cache key covers the form's fields (labels,
+widgets, attributes, choices and initial values), the helper and its layout, the
+template pack, the class modes (semantic classes, CSS-variable colors), the active
+language and the pack version. The CSRF token is stored as a placeholder and filled in on every hit.
+
+Bound forms, formsets and layouts containing ``HTML`` objects (which may render
+arbitrary context) are never cached. Forms whose unbound output depends on
+anything else than the above (e.g. the current user in a custom widget) must keep
+using ``{% crispy %}``.
+
+Fragments live in an in-process LRU by default; set
+``CRISPY_NEUROBRUTALIST_FRAGMENT_CACHE`` to a ``CACHES`` alias to share them.
+"""
+
+import datetime
+import decimal
+import hashlib
+import uuid
+from functools import cache
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import EmptyResultSet
+from django.core.signals import setting_changed
+from django.db.models import Model
+from django.dispatch import receiver
+from django.forms.models import ModelChoiceIterator
+from django.utils.functional import Promise
+from django.utils.html import conditional_escape
+from django.utils.safestring import SafeString, mark_safe
+from django.utils.translation import get_language
+
+from crispy_neurobrutalist.cache import LRUCache
+from crispy_neurobrutalist.config import pack_settings
+
+DEFAULT_TIMEOUT = 300
+DEFAULT_SIZE = 256
+KEY_PREFIX = "crispy_neurobrutalist:fragment"
+
+# Rendered by ``{% csrf_token %}`` in place of the real token; escaping leaves it unchanged.
+CSRF_PLACEHOLDER = "crispy-neurobrutalist-csrf-placeholder"
+
+# Nesting depth after which an object is considered too complex to fingerprint.
+MAX_DEPTH = 12
+
+SCALARS = (
+    type(None),
+    bool,
+    int,
+    float,
+    str,
+    decimal.Decimal,
+    uuid.UUID,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+)
+
+
+class Uncacheable(Exception):
+    """Raised when a form, helper or layout can't be safely described by a cache key."""
+
+
+def fingerprint(value: Any, depth: int = 0) -> str:
+    """Return a stable description of ``value`` for cache keys, or raise ``Uncacheable``."""
+    if depth > MAX_DEPTH:
+        raise Uncacheable("nested too deeply")
+    if isinstance(value, SCALARS):
+        return repr(value)
+    if isinstance(value, Promise):
+        return repr(str(value))
+    if isinstance(value, type) or (callable(value) and hasattr(value, "__qualname__")):
+        return f"{value.__module__}.{value.__qualname__}"
+    if isinstance(value, Model):
+        return f"{value._meta.label}:{value.pk!r}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(fingerprint(item, depth + 1) for item in value) + "]"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ",".join(sorted(fingerprint(item, depth + 1) for item in value)) + "}"
+    if isinstance(value, dict):
+        items = sorted(
+            (fingerprint(k, depth + 1), fingerprint(v, depth + 1)) for k, v in value.items()
+        )
+        return "{" + ",".join(f"{k}:{v}" for k, v in items) + "}"
+
+    from crispy_forms.layout import HTML
+
+    if isinstance(value, HTML):
+        raise Uncacheable("HTML layout objects render arbitrary context")
+    if hasattr(value, "__dict__"):
+        return fingerprint(type(value), depth) + fingerprint(vars(value), depth + 1)
+    raise Uncacheable(f"can't fingerprint {type(value).__name__}")
+
+
+def choices_fingerprint(widget: Any) -> str:
+    choices = getattr(widget, "choices", None)
+    if choices is None:
+        return ""
+    if isinstance(choices, ModelChoiceIterator):
+        field = choices.field
+        label_from_instance = getattr(
+            field.label_from_instance, "__func__", field.label_from_instance
+        )
+        try:
+            query = str(field.queryset.query)
+        except EmptyResultSet:
+            query = None
+        return fingerprint(
+            [
+                query,
+                field.to_field_name,
+                field.empty_label,
+                label_from_instance,
+            ]
+        )
+    return fingerprint(list(choices))
+
+
+def form_fingerprint(form: Any) -> str:
+    """Describe everything of an unbound form that its rendered HTML depends on."""
+    parts = [
+        fingerprint(type(form)),
+        fingerprint([form.prefix, form.auto_id, form.label_suffix, form.use_required_attribute]),
+    ]
+    for bound_field in form:
+        field = bound_field.field
+        widget = field.widget
+        parts.append(
+            fingerprint(
+                [
+                    bound_field.name,
+                    type(field),
+                    type(widget),
+                    field.label,
+                    field.help_text,
+                    field.required,
+                    field.disabled,
+                    field.localize,
+                    widget.attrs,
+                    widget.is_hidden,
+                    bound_field.value(),
+                ]
+            )
+        )
+        parts.append(choices_fingerprint(widget))
+    return "\n".join(parts)
+
+
+def helper_fingerprint(helper: Any) -> str:
+    # ``FormHelper(form)`` keeps a reference to the form it was built for.
+    return fingerprint({name: value for name, value in vars(helper).items() if name != "form"})
+
+
+def csrf_state(csrf_token: Any) -> str:
+    if not csrf_token:
+        return "missing"
+    if csrf_token == "NOTPROVIDED":
+        return "notprovided"
+    return "token"
+
+
+def class_mode(snapshot: Any) -> str:
+    return ":".join(
+        [
+            "semantic" if snapshot.semantic_classes else "tailwind",
+            "themed" if snapshot.theme_variables else "colors",
+        ]
+    )
+
+
+def fragment_key(form: Any, helper: Any, template_pack: str, csrf_token: Any) -> str | None:
+    """Return the cache key of a form render, or ``None`` when it must not be cached."""
+    from crispy_neurobrutalist import __version__
+
+    if form.is_bound or not hasattr(form, "fields"):
+        return None
+    try:
+        description = "\n".join(
+            [
+                form_fingerprint(form),
+                helper_fingerprint(helper),
+                template_pack,
+                class_mode(pack_settings()),
+                str(get_language()),
+                csrf_state(csrf_token),
+            ]
+        )
+    except Uncacheable:
+        return None
+    digest = hashlib.sha256(description.encode()).hexdigest()
+    return f"{KEY_PREFIX}:{__version__}:{generation}:{digest}"
+
+
+def fill_placeholders(html: str, csrf_token: Any) -> SafeString:
+    if csrf_state(csrf_token) == "token":
+        html = html.replace(CSRF_PLACEHOLDER, conditional_escape(str(csrf_token)))
+    return mark_safe(html)
+
+
+class LocalFragmentStore:
+    """In-process LRU store with per-entry expiry."""
+
+    def __init__(self, maxsize: int, timeout: float | None) -> None:
+        self.cache = LRUCache(maxsize, ttl=timeout)
+
+    def get(self, key: str) -> str | None:
+        return self.cache.get(key)
+
+    def set(self, key: str, html: str) -> None:
+        self.cache.set(key, html)
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+
+class DjangoCacheFragmentStore:
+    """Store backed by one of the project's ``CACHES``."""
+
+    def __init__(self, alias: str, timeout: float | None) -> None:
+        self.alias = alias
+        self.timeout = timeout
+
+    def get(self, key: str) -> str | None:
+        return caches[self.alias].get(key)
+
+    def set(self, key: str, html: str) -> None:
+        caches[self.alias].set(key, str(html), self.timeout)
+
+    def clear(self) -> None:
+        # Shared caches are not flushed; bumping ``generation`` orphans the old keys.
+        pass
+
+
+@cache
+def fragment_store() -> LocalFragmentStore | DjangoCacheFragmentStore:
+    """Return the store configured by the ``CRISPY_NEUROBRUTALIST_FRAGMENT_CACHE*`` settings."""
+    alias = getattr(settings, "CRISPY_NEUROBRUTALIST_FRAGMENT_CACHE", None)
+    timeout = getattr(settings, "CRISPY_NEUROBRUTALIST_FRAGMENT_CACHE_TIMEOUT", DEFAULT_TIMEOUT)
+    if alias is None:
+        size = getattr(settings, "CRISPY_NEUROBRUTALIST_FRAGMENT_CACHE_SIZE", DEFAULT_SIZE)
+        return LocalFragmentStore(size, timeout)
+    return DjangoCacheFragmentStore(alias, timeout)
+
+
+generation = 0
+
+
+def clear_fragment_cache() -> None:
+    """Forget every cached fragment (templates changed or settings were overridden)."""
+    global generation
+    generation += 1
+    fragment_store().clear()
+
+
+@receiver(setting_changed, dispatch_uid="crispy_neurobrutalist_fragment_settings_changed")
+def fragment_settings_changed(sender, setting, **kwargs):
+    if setting.startswith("CRISPY_NEUROBRUTALIST_FRAGMENT_CACHE"):
+        fragment_store.cache_clear()
@@ -0,0 +1,143 @@
+"""
+Opt-in render instrumentation.
+
+Register a callback to receive a :class:`RenderSpan` for every form, formset,
+field, widget and error block the pack renders::
+
+    from crispy_neurobrutalist.instrumentation import add_render_callback
+
+    def record(span):
+        tracer.record(f"crispy.{span.kind}", span.duration, field=span.field_name)
+
+    add_render_callback(record)
+
+Spans are emitted when a render finishes, so nested spans (the fields of a form)
+arrive before their parent. Per-field spans come from compiled render plans,
+``|as_crispy_field`` and ``{% neo_field %}``. With no callback registered the
+instrumented functions only check whether the callback list is empty.
+"""
+
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class RenderSpan(NamedTuple):
+    """
+    One timed render.
+
+    ``kind`` is ``"form"``, ``"formset"``, ``"field"``, ``"widget"`` or ``"errors"``;
+    ``duration`` is in seconds and ``output_bytes`` is the UTF-8 size of the output.
+    """
+
+    kind: str
+    form: type | None
+    field_name: str | None
+    widget: type | None
+    template: str | None
+    duration: float
+    output_bytes: int
+    has_errors: bool
+
+
+SPAN_DEFAULTS = {
+    "form": None,
+    "field_name": None,
+    "widget": None,
+    "template": None,
+    "has_errors": False,
+}
+
+RenderCallback = Callable[[RenderSpan], None]
+
+render_callbacks: list[RenderCallback] = []
+
+
+def add_render_callback(callback: RenderCallback) -> None:
+    """Call ``callback`` with a :class:`RenderSpan` after every instrumented render."""
+    render_callbacks.append(callback)
+
+
+def remove_render_callback(callback: RenderCallback) -> None:
+    """Unregister ``callback``; unknown callbacks are ignored."""
+    if callback in render_callbacks:
+        render_callbacks.remove(callback)
+
+
+@contextmanager
+def capture_render_spans() -> Iterator[list[RenderSpan]]:
+    """Collect the spans emitted inside the ``with`` block into a list."""
+    spans: list[RenderSpan] = []
+    add_render_callback(spans.append)
+    try:
+        yield spans
+    finally:
+        remove_render_callback(spans.append)
+
+
+def emit(span: RenderSpan) -> None:
+    for callback in tuple(render_callbacks):
+        try:
+            callback(span)
+        except Exception:
+            # A broken tracer must not break the page.
+            logger.exception("Render callback %r failed", callback)
+
+
+def timed(render: Callable[[], Any], describe: Callable[[], dict[str, Any]]) -> Any:
+    """Call ``render()`` and emit a span built from ``describe()`` and its output."""
+    start = time.perf_counter()
+    output = render()
+    duration = time.perf_counter() - start
+    output_bytes = len(str(output).encode()) if output is not None else 0
+    emit(
+        RenderSpan(
+            **{**SPAN_DEFAULTS, **describe(), "duration": duration, "output_bytes": output_bytes}
+        )
+    )
+    return output
+
+
+def instrumented(describe: Callable[..., dict[str, Any]]) -> Callable[[Callable], Callable]:
+    """
+    Emit a span around each call of the decorated render function.
+
+    ``describe`` receives the call's arguments and returns the span's ``kind`` and
+    the other descriptive fields; it is only called when a callback is registered.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not render_callbacks:
+                return func(*args, **kwargs)
+            return timed(lambda: func(*args, **kwargs), lambda: describe(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
+
+
+def form_has_errors(form: Any) -> bool:
+    """Check for errors without validating unbound forms and formsets."""
+    if not form.is_bound:
+        return False
+    if hasattr(form, "total_error_count"):
+        return bool(form.total_error_count())
+    return bool(form.errors)
+
+
+def describe_field(field: Any, kind: str = "field", template: str | None = None) -> dict[str, Any]:
+    return {
+        "kind": kind,
+        "form": type(field.form),
+        "field_name": field.name,
+        "widget": type(field.field.widget),
+        "template": template,
+        "has_errors": bool(field.errors),
+    }
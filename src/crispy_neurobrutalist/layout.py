@@ -4,6 +4,16 @@ from typing import Any, Literal
 
 from crispy_forms.layout import BaseInput, Div, Field
 
+from crispy_neurobrutalist.tailwind import merge_classes
+from crispy_neurobrutalist.theme import theme_classes
+
+
+def set_css_class(kwargs: dict[str, Any], default: str) -> None:
+    """Set ``kwargs["css_class"]`` to ``default`` if missing, merged with ``merge_classes()``."""
+    css_class = kwargs.setdefault("css_class", default)
+    if css_class:
+        kwargs["css_class"] = merge_classes(css_class)
+
 
 class Submit(BaseInput):
     input_type = "submit"
@@ -15,7 +25,7 @@ class Submit(BaseInput):
                 "rounded-lg py-3 neo-shadow-sm neo-button hover:bg-gray-800"
             )
         else:
-            self.field_classes = css_class
+            self.field_classes = merge_classes(css_class)
         super().__init__(*args, **kwargs)
 
 
@@ -37,12 +47,14 @@ class Button(BaseInput):
                 "danger": "bg-red-400 hover:bg-red-500",
                 "purple": "bg-purple-400 hover:bg-purple-500",
             }
-            self.field_classes = (
-                f"font-bold text-black {mapcolor[color]} border-2 border-black "
-                f"rounded-lg px-7 py-3 neo-shadow neo-button transition-all"
+            self.field_classes = merge_classes(
+                theme_classes(
+                    f"font-bold text-black {mapcolor[color]} border-2 border-black "
+                    f"rounded-lg px-7 py-3 neo-shadow neo-button transition-all"
+                )
             )
         else:
-            self.field_classes = css_class
+            self.field_classes = merge_classes(css_class)
         super().__init__(*args, **kwargs)
 
 
@@ -81,12 +93,14 @@ class Reset(BaseInput):
                 "warning": "bg-yellow-400 hover:bg-yellow-500",
                 "danger": "bg-red-400 hover:bg-red-500",
             }
-            self.field_classes = (
-                f"font-bold text-black {mapcolor[color]} border-2 border-black "
-                f"rounded-lg px-7 py-3 neo-shadow neo-button transition-all"
+            self.field_classes = merge_classes(
+                theme_classes(
+                    f"font-bold text-black {mapcolor[color]} border-2 border-black "
+                    f"rounded-lg px-7 py-3 neo-shadow neo-button transition-all"
+                )
             )
         else:
-            self.field_classes = css_class
+            self.field_classes = merge_classes(css_class)
         super().__init__(*args, **kwargs)
 
 
@@ -112,7 +126,7 @@ class FormActions(Div):
             *fields: Layout objects (buttons) to include.
             **kwargs: Additional keyword arguments (css_class, css_id, etc.).
         """
-        kwargs.setdefault("css_class", "flex gap-4 mt-6 justify-end")
+        set_css_class(kwargs, "flex gap-4 mt-6 justify-end")
         super().__init__(*fields, **kwargs)
 
 
@@ -158,7 +172,7 @@ class Alert(Div):
         if dismissible:
             base_classes += " relative pr-12"
 
-        kwargs.setdefault("css_class", base_classes)
+        set_css_class(kwargs, theme_classes(base_classes))
         super().__init__(*fields, **kwargs)
 
 
@@ -186,9 +200,7 @@ class Card(Div):
             *fields: Layout objects to include in the card.
             **kwargs: Additional keyword arguments (css_class, css_id, etc.).
         """
-        kwargs.setdefault(
-            "css_class", "bg-white border-2 border-black rounded-lg p-6 neo-shadow mb-4"
-        )
+        set_css_class(kwargs, "bg-white border-2 border-black rounded-lg p-6 neo-shadow mb-4")
         super().__init__(*fields, **kwargs)
 
 
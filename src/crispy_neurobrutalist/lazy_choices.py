@@ -0,0 +1,175 @@
+"""
+Paged, lazily-loaded choices for huge ``select`` fields.
+
+When ``CRISPY_NEUROBRUTALIST_LAZY_CHOICES_THRESHOLD`` is set, selects with more
+choices than the threshold are rendered as a stub: only the blank and selected
+options are inlined, and the ``<select>`` carries a ``data-choices-url`` pointing
+at :func:`crispy_neurobrutalist.views.lazy_choices`, which serves the remaining
+choices in pages as JSON (in the format of select2's AJAX transport).
+
+The URL holds a signed token naming the form class and field, so the view only
+serves choices of fields the pack has rendered. Only forms registered with
+:func:`register_lazy_form` are rendered lazily: the view builds the form for each
+request with the registered factory, so querysets narrowed in the form's
+``__init__`` (per user, per tenant) apply to the served choices too::
+
+    register_lazy_form(InvoiceForm, lambda request: InvoiceForm(user=request.user))
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from typing import Any
+
+from django import forms
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.forms.models import ModelChoiceIterator
+from django.http import HttpRequest
+from django.urls import reverse
+from django.utils.html import format_html
+from django.utils.module_loading import import_string
+
+from crispy_neurobrutalist.options import OptionsFragment, flatten_choices
+
+DEFAULT_PAGE_SIZE = 50
+TOKEN_SALT = "crispy_neurobrutalist.lazy_choices"
+URL_NAME = "crispy_neurobrutalist:lazy_choices"
+
+# Form class -> callable building the form the choices endpoint serves for a request.
+lazy_forms: dict[type, Callable[[HttpRequest], forms.BaseForm]] = {}
+
+
+def register_lazy_form(form_class: type, factory: Callable[[HttpRequest], forms.BaseForm]) -> None:
+    """
+    Render the large selects of ``form_class`` lazily, serving their choices from the
+    form ``factory(request)`` returns. The factory may raise ``PermissionDenied``.
+    """
+    lazy_forms[form_class] = factory
+
+
+def lazy_choices_threshold() -> int | None:
+    return getattr(settings, "CRISPY_NEUROBRUTALIST_LAZY_CHOICES_THRESHOLD", None)
+
+
+def lazy_choices_page_size() -> int:
+    return getattr(settings, "CRISPY_NEUROBRUTALIST_LAZY_CHOICES_PAGE_SIZE", DEFAULT_PAGE_SIZE)
+
+
+def form_path(form_class: type) -> str | None:
+    """Return the import path of ``form_class``, or ``None`` if it can't be imported."""
+    qualname = form_class.__qualname__
+    if "<locals>" in qualname:
+        return None
+    return f"{form_class.__module__}.{qualname}"
+
+
+def is_lazy(field: Any) -> bool:
+    """Check if a bound select field should be rendered as a lazy stub."""
+    threshold = lazy_choices_threshold()
+    if threshold is None:
+        return False
+    widget = field.field.widget
+    form_class = type(field.form)
+    if not isinstance(widget, forms.Select) or form_class not in lazy_forms:
+        return False
+    if form_path(form_class) is None:
+        return False
+    try:
+        from django_select2.forms import Select2Mixin
+    except ImportError:
+        pass
+    else:
+        if isinstance(widget, Select2Mixin):
+            return False
+    return len(widget.choices) > threshold
+
+
+def make_token(field: Any) -> str:
+    return signing.dumps([form_path(type(field.form)), field.name], salt=TOKEN_SALT)
+
+
+def choices_url(field: Any) -> str:
+    return f"{reverse(URL_NAME)}?token={make_token(field)}"
+
+
+def render_lazy_attrs(field: Any) -> str:
+    """Return the ``data-choices-*`` attributes of a lazy select stub."""
+    return format_html(
+        ' data-choices-url="{}" data-choices-page-size="{}"',
+        choices_url(field),
+        lazy_choices_page_size(),
+    )
+
+
+def stub_choices(field: Any, values: list[str]) -> list[tuple[Any, Any]]:
+    """Return the blank choice (if first) and the choices matching ``values``."""
+    choices = field.field.widget.choices
+    if isinstance(choices, ModelChoiceIterator):
+        # Only fetch the selected rows instead of iterating the whole queryset.
+        model_field = field.field
+        key = model_field.to_field_name or "pk"
+        values = [value for value in values if value != ""]
+        stub = [("", model_field.empty_label)] if model_field.empty_label is not None else []
+        if values:
+            try:
+                selected = model_field.queryset.filter(**{f"{key}__in": values})
+                stub.extend(choices.choice(obj) for obj in selected)
+            except (ValueError, TypeError, ValidationError):
+                pass
+        return stub
+
+    wanted = set(values)
+    stub = []
+    for index, (value, label) in enumerate(flatten_choices(choices)):
+        if (index == 0 and value in ("", None)) or str(value) in wanted:
+            stub.append((value, label))
+    return stub
+
+
+def render_lazy_options(field: Any) -> str:
+    """Render only the blank and selected ``<option>`` elements of a lazy select."""
+    widget = field.field.widget
+    values = widget.format_value(field.value())
+    return OptionsFragment(stub_choices(field, values)).render(
+        values, widget.allow_multiple_selected
+    )
+
+
+def load_field(token: str, request: HttpRequest) -> forms.Field:
+    """
+    Return the form field named by a signed token, from the form the registered
+    factory builds for ``request``.
+
+    Raises ``signing.BadSignature`` for tampered tokens, ``LookupError`` when the
+    form or field no longer exists and ``PermissionDenied`` when the form isn't
+    registered with ``register_lazy_form()``.
+    """
+    path, name = signing.loads(token, salt=TOKEN_SALT)
+    try:
+        form_class = import_string(path)
+    except ImportError as e:
+        raise LookupError(path) from e
+    factory = lazy_forms.get(form_class)
+    if factory is None:
+        raise PermissionDenied(f"{path} is not registered for lazy choices.")
+    return factory(request).fields[name]
+
+
+def search_choices(choices: Iterable[tuple[Any, Any]], term: str) -> Iterator[tuple[Any, Any]]:
+    """Yield the flattened choices whose label contains ``term`` (case-insensitive)."""
+    term = term.casefold()
+    for value, label in flatten_choices(choices):
+        if term in str(label).casefold():
+            yield value, label
+
+
+def page_choices(
+    field: forms.Field, term: str = "", page: int = 1, page_size: int | None = None
+) -> tuple[list[dict[str, str]], bool]:
+    """Return one page of ``{"id", "text"}`` results and whether more pages follow."""
+    page_size = page_size or lazy_choices_page_size()
+    start = (max(page, 1) - 1) * page_size
+    matches = list(islice(search_choices(field.widget.choices, term), start, start + page_size + 1))
+    results = [{"id": str(value), "text": str(label)} for value, label in matches[:page_size]]
+    return results, len(matches) > page_size
@@ -0,0 +1,169 @@
+"""
+Template loader that compiles the pack's templates for rendering speed.
+
+Wrap the project's loaders with this one::
+
+    TEMPLATES = [{
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "OPTIONS": {
+            "loaders": [
+                ("crispy_neurobrutalist.loaders.Loader", [
+                    ("django.template.loaders.cached.Loader", [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ]),
+                ]),
+            ],
+        },
+    }]
+
+and includes of other pack templates by a literal name (``field.html`` ->
+``help_text_and_errors.html`` -> ``help_text.html``, ``inputs.html`` ->
+``baseinput.html``, ...) are resolved once, when the ``neobrutalist/`` templates are
+compiled, and rendered in place, without the template lookup of ``{% include %}``.
+Set ``CRISPY_NEUROBRUTALIST_INLINE_INCLUDES = False`` to keep the includes, e.g. for
+the debug toolbar's template panel or ``assertTemplateUsed``. Includes of a variable
+(the widget template) stay dynamic.
+
+The output is unchanged.
+"""
+
+from typing import Any
+
+from django.conf import settings
+from django.template import TemplateDoesNotExist
+from django.template.base import Node, NodeList, Template
+from django.template.defaulttags import IfNode
+from django.template.loader_tags import IncludeNode
+from django.template.loaders.base import Loader as BaseLoader
+
+PACK_PREFIX = "neobrutalist/"
+
+
+def inline_includes_enabled() -> bool:
+    return getattr(settings, "CRISPY_NEUROBRUTALIST_INLINE_INCLUDES", True)
+
+
+class InlinedIncludeNode(Node):
+    """``{% include %}`` of a template that was resolved when the includer was compiled."""
+
+    # The included template is compiled on its own; don't walk into it.
+    child_nodelists = ()
+
+    def __init__(self, include: IncludeNode, template: Template) -> None:
+        self.template = template
+        self.extra_context = include.extra_context
+        self.isolated_context = include.isolated_context
+
+    def render(self, context: Any) -> str:
+        values = {name: var.resolve(context) for name, var in self.extra_context.items()}
+        if self.isolated_context:
+            return self.render_template(context.new(values))
+        with context.push(**values):
+            return self.render_template(context)
+
+    def render_template(self, context: Any) -> str:
+        # What ``Template.render`` does for an included template.
+        render_context = context.render_context
+        initial = render_context.template
+        render_context.template = self.template
+        render_context.push()
+        try:
+            return self.template.nodelist.render(context)
+        finally:
+            render_context.template = initial
+            render_context.pop()
+
+
+def static_include_name(node: IncludeNode) -> str | None:
+    """Return the template name of ``{% include "literal" %}``, or ``None``."""
+    name = node.template.var
+    if node.template.filters or not isinstance(name, str):
+        return None
+    return name
+
+
+def child_nodelists(node: Node) -> list[NodeList]:
+    if isinstance(node, IfNode):
+        # ``IfNode.nodelist`` is a copy; its branches live in ``conditions_nodelists``.
+        return [nodelist for _condition, nodelist in node.conditions_nodelists]
+    return [
+        nodelist
+        for nodelist in (getattr(node, attr, None) for attr in node.child_nodelists)
+        if nodelist is not None
+    ]
+
+
+def replace_node(original: Node, replacement: Node) -> Node:
+    # Keep the source position used by debug error pages.
+    replacement.token = getattr(original, "token", None)
+    replacement.origin = getattr(original, "origin", None)
+    return replacement
+
+
+def compile_nodelist(nodelist: NodeList, loader: "Loader", chain: tuple[str, ...]) -> None:
+    """
+    Inline the static includes of ``nodelist``, in place.
+
+    ``chain`` names the templates being compiled; including one of them again (a
+    recursive include) stays a regular ``{% include %}``.
+    """
+    for index, node in enumerate(nodelist):
+        if type(node) is IncludeNode and inline_includes_enabled():
+            name = static_include_name(node)
+            if name is not None and name.startswith(PACK_PREFIX) and name not in chain:
+                try:
+                    template = loader.load_template(name, chain)
+                except TemplateDoesNotExist:
+                    # Leave the error to the render, as ``{% include %}`` does.
+                    continue
+                nodelist[index] = replace_node(node, InlinedIncludeNode(node, template))
+                continue
+        for child in child_nodelists(node):
+            compile_nodelist(child, loader, chain)
+
+
+class Loader(BaseLoader):
+    """
+    Wraps other loaders and compiles the pack's templates they return.
+
+    Templates are compiled after the wrapped loaders built them, so this loader goes
+    outside ``cached.Loader`` and compiles each cached template once.
+    """
+
+    def __init__(self, engine: Any, loaders: list[Any]) -> None:
+        super().__init__(engine)
+        self.loaders = engine.get_template_loaders(loaders)
+
+    def get_template(self, template_name: str, skip: list[Any] | None = None) -> Template:
+        return self.load_template(template_name, (), skip)
+
+    def load_template(
+        self, template_name: str, chain: tuple[str, ...], skip: list[Any] | None = None
+    ) -> Template:
+        tried = []
+        for loader in self.loaders:
+            try:
+                template = loader.get_template(template_name, skip)
+            except TemplateDoesNotExist as e:
+                tried.extend(e.tried)
+                continue
+            if template_name.startswith(PACK_PREFIX) and not getattr(template, "compiled", False):
+                template.compiled = True
+                compile_nodelist(template.nodelist, self, (*chain, template_name))
+            return template
+        raise TemplateDoesNotExist(template_name, tried=tried)
+
+    def get_template_sources(self, template_name: str) -> Any:
+        for loader in self.loaders:
+            yield from loader.get_template_sources(template_name)
+
+    def get_dirs(self) -> Any:
+        for loader in self.loaders:
+            if hasattr(loader, "get_dirs"):
+                yield from loader.get_dirs()
+
+    def reset(self) -> None:
+        for loader in self.loaders:
+            if hasattr(loader, "reset"):
+                loader.reset()
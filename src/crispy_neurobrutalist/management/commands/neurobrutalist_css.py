@@ -0,0 +1,45 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from crispy_neurobrutalist.stylesheet import build_stylesheet, write_stylesheet
+
+
+class Command(BaseCommand):
+    help = (
+        "Write a minified neurobrutalist.css with only the rules the pack can use, under a "
+        "content-hashed name with precompressed .gz/.br siblings."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-o",
+            "--output-dir",
+            help="directory to write to (default: STATIC_ROOT/crispy_neurobrutalist/css)",
+        )
+        parser.add_argument(
+            "--container",
+            action="append",
+            default=[],
+            metavar="DOTTED.PATH",
+            help="also keep the classes of a CSSContainer; can be repeated",
+        )
+        parser.add_argument(
+            "--keep",
+            action="append",
+            default=[],
+            metavar="CLASS",
+            help="also keep the rules of a class used by your templates; can be repeated",
+        )
+
+    def handle(self, *args, **options):
+        output_dir = options["output_dir"]
+        if output_dir is None:
+            if not settings.STATIC_ROOT:
+                raise CommandError("Set STATIC_ROOT or pass --output-dir.")
+            output_dir = Path(settings.STATIC_ROOT) / "crispy_neurobrutalist" / "css"
+
+        content = build_stylesheet(options["container"], options["keep"])
+        for path in write_stylesheet(content, output_dir):
+            self.stdout.write(f"Wrote {path} ({path.stat().st_size} bytes).")
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from crispy_neurobrutalist.safelist import FORMATS, collect_classes, format_classes
+
+
+class Command(BaseCommand):
+    help = (
+        "Write every CSS class the neobrutalist pack can render, one per line for Tailwind's "
+        "content scan or as a JSON safelist."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-o",
+            "--output",
+            help="file to write (default: standard output)",
+        )
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            default="txt",
+            help="one class per line or a JSON array (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--container",
+            action="append",
+            default=[],
+            metavar="DOTTED.PATH",
+            help="also include a CSSContainer; can be repeated",
+        )
+
+    def handle(self, *args, **options):
+        classes = collect_classes(options["container"])
+        content = format_classes(classes, options["format"])
+        if options["output"] is None:
+            self.stdout.write(content, ending="")
+            return
+        with open(options["output"], "w", encoding="utf-8") as output:
+            output.write(content)
+        self.stdout.write(f"Wrote {len(classes)} classes to {options['output']}.")
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from crispy_neurobrutalist.semantic import semantic_css
+
+
+class Command(BaseCommand):
+    help = (
+        "Write the Tailwind component classes used by CRISPY_NEUROBRUTALIST_SEMANTIC_CLASSES, "
+        "to be included in the project's Tailwind input CSS."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-o",
+            "--output",
+            help="file to write (default: standard output)",
+        )
+
+    def handle(self, *args, **options):
+        content = semantic_css()
+        if options["output"] is None:
+            self.stdout.write(content, ending="")
+            return
+        with open(options["output"], "w", encoding="utf-8") as output:
+            output.write(content)
+        self.stdout.write(f"Wrote the semantic classes to {options['output']}.")
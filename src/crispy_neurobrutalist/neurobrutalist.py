@@ -1,89 +1,245 @@
 import re
+import warnings
+from functools import cache, lru_cache
 from typing import Any
+from weakref import WeakValueDictionary
+
+from crispy_neurobrutalist.tailwind import merge_classes, parse_class, remove_classes
+
+DEFAULT_ITEMS = (
+    "text",
+    "number",
+    "email",
+    "url",
+    "password",
+    "hidden",
+    "multiplehidden",
+    "file",
+    "clearablefile",
+    "textarea",
+    "date",
+    "datetime",
+    "time",
+    "checkbox",
+    "select",
+    "nullbooleanselect",
+    "selectmultiple",
+    "radioselect",
+    "checkboxselectmultiple",
+    "multi",
+    "splitdatetime",
+    "splithiddendatetime",
+    "selectdate",
+    "error_border",
+    # django-select2 widget types
+    "select2",
+    "select2multiple",
+    "select2tag",
+    "heavyselect2",
+    "heavyselect2multiple",
+    "heavyselect2tag",
+    "modelselect2",
+    "modelselect2multiple",
+    "modelselect2tag",
+)
+
+# Upper bound on the ``+``/``-`` results memoized per container.
+MAX_DERIVED = 128
+
+
+def border_group(token: str) -> str | None:
+    """
+    Return the border utility group of a class (``"width"``, ``"style"`` or
+    ``"color"``), or ``None`` for classes that aren't unprefixed border utilities.
+
+    Variant classes such as ``focus:border-blue-500`` or ``file:border-2`` are
+    left alone, as are ``border-collapse``/``border-separate`` and ``border-spacing-*``.
+    """
+    modifiers, group = parse_class(token)
+    if modifiers or group is None or not group.startswith("border-"):
+        return None
+    kind = group.split("-")[1]
+    return kind if kind in ("width", "style", "color") else None
+
+
+@lru_cache(maxsize=1024)
+def error_variant(css_class: str, error_class: str) -> str:
+    """
+    Return ``css_class`` in its error state.
+
+    When ``css_class`` has border utilities, ``error_class`` is inserted at the
+    first of them and the utilities it conflicts with (see ``merge_classes()``)
+    are dropped: ``bg-red-100 border-red-500`` replaces the widget's background
+    and border color. Border widths are the widget's own: the width of
+    ``error_class`` only applies to widgets that don't set one. Classes without
+    border utilities are returned unchanged.
+    """
+    tokens = css_class.split()
+    groups = [border_group(token) for token in tokens]
+    if not any(groups):
+        return css_class
+
+    error_tokens = error_class.split()
+    if "width" in groups:
+        error_tokens = [token for token in error_tokens if border_group(token) != "width"]
+    kept = set(merge_classes(css_class, " ".join(error_tokens)).split())
+    result: list[str] = []
+    for token, group in zip(tokens, groups, strict=True):
+        if group is not None and error_tokens:
+            result.extend(error_tokens)
+            error_tokens = []
+        if token in kept and token not in result:
+            result.append(token)
+    return " ".join(result)
+
+
+@lru_cache(maxsize=1024)
+def widget_classes(css_class: str, container_class: str) -> str:
+    """
+    Return a widget's own ``css_class`` followed by the classes of its container.
+
+    Both are merged with ``merge_classes()`` and the widget's own utilities win
+    conflicts: ``border-4 p-2`` drops the container's ``border-2`` and ``p-3``.
+    """
+    own = set(css_class.split())
+    merged = merge_classes(container_class, css_class).split()
+    return " ".join(
+        [token for token in merged if token in own]
+        + [token for token in merged if token not in own]
+    )
+
+
+@cache
+def widget_style_key(widget_class: type) -> str:
+    """Return the CSSContainer key for a widget class (``PasswordInput`` -> ``password``)."""
+    return re.sub(r"widget$|input$", "", widget_class.__name__.lower())
 
 
 class CSSContainer:
-    def __init__(self, css_styles: dict[str, str]) -> None:
-        default_items = [
-            "text",
-            "number",
-            "email",
-            "url",
-            "password",
-            "hidden",
-            "multiplehidden",
-            "file",
-            "clearablefile",
-            "textarea",
-            "date",
-            "datetime",
-            "time",
-            "checkbox",
-            "select",
-            "nullbooleanselect",
-            "selectmultiple",
-            "radioselect",
-            "checkboxselectmultiple",
-            "multi",
-            "splitdatetime",
-            "splithiddendatetime",
-            "selectdate",
-            "error_border",
-            # django-select2 widget types
-            "select2",
-            "select2multiple",
-            "select2tag",
-            "heavyselect2",
-            "heavyselect2multiple",
-            "heavyselect2tag",
-            "modelselect2",
-            "modelselect2multiple",
-            "modelselect2tag",
-        ]
+    """
+    Immutable mapping of widget type to CSS classes.
 
+    Containers are hash-consed: building one from styles that resolve to the same
+    class sets returns the existing instance. Classes are merged with
+    ``merge_classes()``, so a widget style overrides conflicting ``base`` utilities
+    and ``+`` replaces the utilities it conflicts with. ``+`` and ``-`` return new (memoized)
+    containers instead of modifying the receiver, so shared containers such as
+    ``CrispyNeuroBrutaListFieldNode.default_container`` can't be changed by accident.
+    The error state of each widget type (see ``error_variant()``) is computed when
+    the container is built.
+    """
+
+    __slots__ = ("_styles", "_error_styles", "_by_widget", "_derived", "__weakref__")
+
+    _interned: "WeakValueDictionary[Any, CSSContainer]" = WeakValueDictionary()
+
+    def __new__(cls, css_styles: dict[str, str]) -> "CSSContainer":
         base = css_styles.get("base", "")
-        for item in default_items:
-            setattr(self, item, base)
+        styles = dict.fromkeys(DEFAULT_ITEMS, base)
 
         for key, value in css_styles.items():
             if key != "base":
-                current_class = set(getattr(self, key).split())
-                current_class.update(set(value.split()))
-                new_classes = " ".join(current_class)
-                setattr(self, key, new_classes)
+                styles[key] = merge_classes(styles.get(key, ""), value)
+
+        return cls._intern(styles)
+
+    @classmethod
+    def _intern(cls, styles: dict[str, str]) -> "CSSContainer":
+        key = (cls, frozenset((name, frozenset(value.split())) for name, value in styles.items()))
+        instance = cls._interned.get(key)
+        if instance is None:
+            # Sorted, so containers with the same class sets render the same HTML.
+            styles = {name: " ".join(sorted(value.split())) for name, value in styles.items()}
+            instance = object.__new__(cls)
+            object.__setattr__(instance, "_styles", styles)
+            object.__setattr__(
+                instance,
+                "_error_styles",
+                {
+                    name: error_variant(value, styles.get("error_border", ""))
+                    for name, value in styles.items()
+                },
+            )
+            object.__setattr__(instance, "_by_widget", {})
+            object.__setattr__(instance, "_derived", {})
+            instance = cls._interned.setdefault(key, instance)
+        return instance
+
+    def __getattr__(self, name: str) -> str:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._styles[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' has no style for widget type '{name}'"
+            ) from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"'{type(self).__name__}' is immutable; use + or - instead")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"'{type(self).__name__}' is immutable; use + or - instead")
 
     def __repr__(self) -> str:
-        return str(self.__dict__)
+        return f"{type(self).__name__}({self._styles!r})"
 
-    def __add__(self, other: dict[str, str]) -> "CSSContainer":
-        for field, css_class in other.items():
-            current_class = set(getattr(self, field).split())
-            current_class.update(set(css_class.split()))
-            new_classes = " ".join(current_class)
-            setattr(self, field, new_classes)
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (type(self), (dict(self._styles),))
+
+    def __copy__(self) -> "CSSContainer":
         return self
 
-    def __sub__(self, other: dict[str, str]) -> "CSSContainer":
-        for field, css_class in other.items():
-            current_class = set(getattr(self, field).split())
-            removed_classes = set(css_class.split())
-            new_classes = " ".join(current_class - removed_classes)
-            setattr(self, field, new_classes)
+    def __deepcopy__(self, memo: dict[int, Any]) -> "CSSContainer":
         return self
 
-    def get_input_class(self, field: Any) -> str:
-        widget_name = re.sub(r"widget$|input$", "", field.field.widget.__class__.__name__.lower())
-        css_classes = getattr(self, widget_name, None)
+    def as_dict(self, errors: bool = False) -> dict[str, str]:
+        """Return a copy of the widget type to CSS classes mapping (error states if ``errors``)."""
+        return dict(self._error_styles if errors else self._styles)
 
-        if css_classes is None:
-            import warnings
+    def _derive(self, op: str, other: dict[str, str]) -> "CSSContainer":
+        key = (op, frozenset(other.items()))
+        derived = self._derived.get(key)
+        if derived is not None:
+            return derived
 
+        styles = dict(self._styles)
+        for field, css_class in other.items():
+            if op == "+":
+                styles[field] = merge_classes(styles.get(field, ""), css_class)
+            else:
+                styles[field] = remove_classes(styles.get(field, ""), css_class)
+
+        if len(self._derived) >= MAX_DERIVED:
+            self._derived.clear()
+        return self._derived.setdefault(key, self._intern(styles))
+
+    def __add__(self, other: dict[str, str]) -> "CSSContainer":
+        return self._derive("+", other)
+
+    def __sub__(self, other: dict[str, str]) -> "CSSContainer":
+        return self._derive("-", other)
+
+    def get_input_class(self, field: Any, errors: bool = False) -> str:
+        """Return the classes of ``field``'s widget type, in the error state if ``errors``."""
+        widget_class = field.field.widget.__class__
+        try:
+            css_classes = self._by_widget[widget_class]
+        except KeyError:
+            key = widget_style_key(widget_class)
+            if key in self._styles:
+                css_classes = (self._styles[key], self._error_styles[key])
+            else:
+                css_classes = None
+            self._by_widget[widget_class] = css_classes
+
+        if css_classes is None:
             warnings.warn(
-                f"Widget type '{widget_name}' (from {field.field.widget.__class__.__name__}) "
+                f"Widget type '{widget_style_key(widget_class)}' (from {widget_class.__name__}) "
                 f"is not configured in CSSContainer. Field: {field.name}",
                 UserWarning,
                 stacklevel=2,
             )
             return ""
 
-        return css_classes
+        return css_classes[1] if errors else css_classes[0]
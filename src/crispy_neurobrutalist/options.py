@@ -0,0 +1,162 @@
+"""
+Cached ``<option>`` markup for the ``select.html`` and ``multiselect.html`` layouts.
+
+The option list of a select is rendered once per set of choices (and active
+language) and kept in a size-bounded LRU shared across requests. Rendering a field
+then only marks the selected options on a copy of the cached fragment, instead of
+building a ``BoundWidget`` and running the template loop for every option.
+
+Model choices are looked up by their queryset's SQL, so a hit doesn't query the
+database. Their fragments expire after ``MODEL_OPTIONS_TTL`` seconds and are
+dropped whenever a model instance is saved or deleted in the process.
+"""
+
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+from django.core.exceptions import EmptyResultSet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.forms.models import ModelChoiceIterator
+from django.utils.translation import get_language
+
+from crispy_neurobrutalist.cache import LRUCache
+from crispy_neurobrutalist.renderers import render_value
+
+OPTIONS_CACHE_SIZE = 128
+OPTIONS_CACHE_MAX_CHARS = 32 * 1024 * 1024
+# Seconds the options of model choices are kept (saves and deletes clear them).
+MODEL_OPTIONS_TTL = 10
+
+# One iteration of the ``{% for widget in field.subwidgets %}`` loop in the templates.
+OPTION_PREFIX = '\n        <option value="'
+OPTION_SELECT_AT = '"\n                '
+OPTION_SUFFIX = "</option>\n    "
+
+
+class OptionsFragment:
+    """Rendered options of one flattened choices list with an index of option positions."""
+
+    __slots__ = ("parts", "positions", "html")
+
+    def __init__(self, options: Iterable[tuple[Any, Any]]) -> None:
+        self.parts: list[str] = []
+        self.positions: dict[str, list[int]] = {}
+        for index, (value, label) in enumerate(options):
+            self.parts.append(
+                f"{OPTION_PREFIX}{render_value(value)}{OPTION_SELECT_AT}>"
+                f"{render_value(label)}{OPTION_SUFFIX}"
+            )
+            self.positions.setdefault(str(value), []).append(index)
+        self.html = "".join(self.parts)
+
+    def __len__(self) -> int:
+        return len(self.html)
+
+    def render(self, values: list[str], allow_multiple_selected: bool) -> str:
+        """Return the options with ``selected`` set like ``ChoiceWidget.optgroups``."""
+        if allow_multiple_selected:
+            selected = [i for value in set(values) for i in self.positions.get(value, ())]
+        else:
+            first = [self.positions[value][0] for value in values if value in self.positions]
+            selected = [min(first)] if first else []
+        if not selected:
+            return self.html
+
+        parts = self.parts.copy()
+        for index in selected:
+            parts[index] = parts[index].replace(
+                OPTION_SELECT_AT + ">", OPTION_SELECT_AT + "selected>", 1
+            )
+        return "".join(parts)
+
+
+def flatten_choices(choices: Iterable[tuple[Any, Any]]) -> Iterable[tuple[Any, Any]]:
+    """Yield ``(value, label)`` pairs in the order ``BoundField.subwidgets`` does."""
+    for option_value, option_label in choices:
+        if isinstance(option_label, (list, tuple)):
+            yield from option_label
+        else:
+            yield ("" if option_value is None else option_value), option_label
+
+
+def choices_key(choices: Any) -> Hashable:
+    """
+    Return the cache key of ``choices`` without evaluating model choices.
+
+    Model choices are described by their queryset's SQL and the field options
+    their labels depend on, other choices by their flattened ``(value, label)`` pairs.
+    """
+    if isinstance(choices, ModelChoiceIterator):
+        field = choices.field
+        try:
+            query = str(field.queryset.query)
+        except EmptyResultSet:
+            query = None
+        label_from_instance = getattr(
+            field.label_from_instance, "__func__", field.label_from_instance
+        )
+        return (
+            field.queryset.model,
+            field.queryset.db,
+            query,
+            field.to_field_name,
+            field.empty_label,
+            field.iterator,
+            label_from_instance,
+        )
+    return tuple(flatten_choices(choices))
+
+
+options_cache = LRUCache(OPTIONS_CACHE_SIZE, maxweight=OPTIONS_CACHE_MAX_CHARS)
+# Options of model choices go stale when rows change, so they expire.
+model_options_cache = LRUCache(
+    OPTIONS_CACHE_SIZE, maxweight=OPTIONS_CACHE_MAX_CHARS, ttl=MODEL_OPTIONS_TTL
+)
+# ``id()`` of a choices object -> ``(choices, fragment)``, so rendering the same
+# choices again skips building the key. Entries keep their choices alive: ids
+# aren't reused while cached.
+identity_cache = LRUCache(OPTIONS_CACHE_SIZE)
+
+
+def options_fragment(choices: Any) -> OptionsFragment:
+    """Return the cached fragment of ``choices``, rendering it on a miss."""
+    language = get_language()
+    model_choices = isinstance(choices, ModelChoiceIterator)
+    if not model_choices:
+        entry = identity_cache.get((id(choices), language))
+        if entry is not None and entry[0] is choices:
+            return entry[1]
+
+    cache = model_options_cache if model_choices else options_cache
+    try:
+        key = (choices_key(choices), language)
+        fragment = cache.get(key)
+    except TypeError:
+        # Unhashable choice values or labels can't be cached.
+        return OptionsFragment(flatten_choices(choices))
+
+    if fragment is None:
+        fragment = OptionsFragment(flatten_choices(choices))
+        cache.set(key, fragment)
+    if not model_choices:
+        identity_cache.set((id(choices), language), (choices, fragment))
+    return fragment
+
+
+@receiver(post_save, dispatch_uid="crispy_neurobrutalist_model_options_saved")
+@receiver(post_delete, dispatch_uid="crispy_neurobrutalist_model_options_deleted")
+def clear_model_options(sender, **kwargs):
+    model_options_cache.clear()
+
+
+def render_options(field: Any) -> str:
+    """Render the ``<option>`` elements of a bound select field."""
+    widget = field.field.widget
+    fragment = options_fragment(widget.choices)
+
+    values = widget.format_value(field.value())
+    if not isinstance(values, (list, tuple)):
+        # ``NullBooleanSelect.format_value()`` returns a single string.
+        values = [values]
+    return fragment.render(values, widget.allow_multiple_selected)
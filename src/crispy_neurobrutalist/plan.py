@@ -0,0 +1,257 @@
+"""
+Compiled render plans for ``{{ form|crispy }}``.
+
+A render plan is built once per form class, field layout, template pack and
+label/field classes. It holds one renderer per field with the wrapper and label
+markup of ``field.html`` precomputed and the widget template already resolved, so
+rendering a form only interpolates values, labels and errors. The output is the
+same as rendering ``uni_form.html``.
+
+Plans are only used while the pack's own structural templates are in effect; if a
+project overrides ``field.html`` or one of its helpers, ``get_form_plan`` returns
+``None`` and the template path is used.
+"""
+
+import os
+from collections.abc import Callable, Iterable, Iterator
+from functools import cache, lru_cache
+from typing import Any
+
+from crispy_forms.templatetags.crispy_forms_utils import remove_spaces
+from django import forms
+from django.conf import settings
+from django.template import engines
+from django.template.loader import get_template
+from django.utils.safestring import SafeString, mark_safe
+
+from crispy_neurobrutalist.dispatch import widget_templates
+from crispy_neurobrutalist.instrumentation import describe_field, render_callbacks, timed
+from crispy_neurobrutalist.renderers import render_value
+from crispy_neurobrutalist.semantic import template_class
+
+PLAN_CACHE_SIZE = 256
+
+DEFAULT_LABEL_CLASS = "block text-gray-700 text-sm font-bold mb-2"
+DEFAULT_FIELD_CLASS = "mb-3"
+
+PACK_TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+# Templates whose markup is mirrored by the plan instead of being rendered.
+MIRRORED_TEMPLATES = (
+    "uni_form.html",
+    "field.html",
+    "layout/help_text_and_errors.html",
+    "layout/help_text.html",
+    "layout/field_errors_block.html",
+)
+
+# Any run of three or more whitespace characters between tags collapses to a single
+# space in ``specialspaceless``, so markup pieces are joined with such a run.
+SEP = "\n    "
+
+WRAPPER_OPEN = '<div class="mb-2">\n        <div id="div_'
+WRAPPER_CLASS = '" class="\n                {field_class}">'
+WRAPPER_CLOSE = "</div>\n    </div>"
+LABEL = (
+    '<label for="{id_for_label}"\n'
+    '                       class="block font-bold text-sm mb-2 {error_class}">\n'
+    "                    {label}{asterisk}\n"
+    "                </label>"
+)
+LABEL_ERROR_CLASS = " {error_text} "
+ASTERISK = '<span class="asteriskField {error_text}">*</span>'
+FIELD_ERROR = (
+    '<p id="error_{counter}_{auto_id}" class="text-xs {error_text} mt-1 font-semibold">'
+    "<strong>{error}</strong></p>"
+)
+HELP_TEXT = '<small {id_attr}class="text-gray-500 text-xs mt-1">{help_text}</small>'
+
+FieldRenderer = Callable[[Any, dict[str, Any]], str]
+
+
+def render_plans_enabled() -> bool:
+    return getattr(settings, "CRISPY_NEUROBRUTALIST_RENDER_PLANS", True)
+
+
+def collapse_chunks(parts: Iterable[str]) -> Iterator[str]:
+    """
+    Apply ``specialspaceless`` to markup pieces separated by whitespace.
+
+    Yields each collapsed piece prefixed with the separator the full-string pass
+    would have left in front of it, so the chunks join to the same HTML.
+    """
+    previous = ""
+    for part in parts:
+        chunk = remove_spaces(part.strip())
+        if not chunk:
+            continue
+        if previous:
+            chunk = (" " if previous[-1] == ">" and chunk[0] == "<" else SEP) + chunk
+        yield chunk
+        previous = chunk
+
+
+def render_hidden_field(field: Any, _context: dict[str, Any]) -> str:
+    return str(field)
+
+
+def render_help_text_and_errors(field: Any, context: dict[str, Any]) -> list[str]:
+    """Mirror ``help_text_and_errors.html`` with block errors and non-inline help text."""
+    parts = []
+    if context.get("form_show_errors") and field.errors:
+        auto_id = render_value(field.auto_id)
+        error_text = template_class("neo-error-text")
+        for counter, error in enumerate(field.errors, 1):
+            parts.append(
+                FIELD_ERROR.format(
+                    counter=counter,
+                    auto_id=auto_id,
+                    error_text=error_text,
+                    error=render_value(error),
+                )
+            )
+    if field.help_text:
+        id_for_label = field.id_for_label
+        id_attr = f'id="{render_value(id_for_label)}_helptext" ' if id_for_label else ""
+        parts.append(HELP_TEXT.format(id_attr=id_attr, help_text=str(field.help_text)))
+    return parts
+
+
+def make_field_renderer(widget_class: type, field_class: str) -> FieldRenderer:
+    """Build the renderer mirroring ``field.html`` for one non-hidden field."""
+    template_name = widget_templates.resolve(widget_class)
+    widget_template = neo_field_template() if template_name is None else get_template(template_name)
+    wrapper_class = WRAPPER_CLASS.format(field_class=render_value(field_class or "mb-3"))
+    labelled = not issubclass(widget_class, forms.CheckboxInput)
+
+    def render_field(field: Any, context: dict[str, Any]) -> str:
+        parts = [WRAPPER_OPEN + render_value(field.auto_id) + wrapper_class]
+        if labelled and field.label and context.get("form_show_labels"):
+            error_text = template_class("neo-error-text")
+            error_class = LABEL_ERROR_CLASS.format(error_text=error_text) if field.errors else ""
+            asterisk = ASTERISK.format(error_text=error_text) if field.field.required else ""
+            parts.append(
+                LABEL.format(
+                    id_for_label=render_value(field.id_for_label),
+                    error_class=error_class,
+                    label=str(field.label),
+                    asterisk=asterisk,
+                )
+            )
+        parts.append(
+            widget_template.render({**context, "field": field, "widget_template": template_name})
+        )
+        parts.extend(render_help_text_and_errors(field, context))
+        parts.append(WRAPPER_CLOSE)
+        return SEP.join(parts)
+
+    return render_field
+
+
+def render_field_timed(render_field: FieldRenderer, field: Any, context: dict[str, Any]) -> str:
+    return timed(
+        lambda: render_field(field, context),
+        lambda: describe_field(field, template=context.get("field_template")),
+    )
+
+
+class FormRenderPlan:
+    """Ordered per-field renderers for one form layout."""
+
+    def __init__(self, fields: list[FieldRenderer]) -> None:
+        self.fields = fields
+
+    def render_parts(self, form: Any, context: dict[str, Any]) -> Iterator[str]:
+        """Yield the uncollapsed markup pieces of ``uni_form.html``, one per field."""
+        if context.get("include_media"):
+            yield str(form.media)
+        if context.get("form_show_errors") and form.non_field_errors():
+            yield get_template("neobrutalist/errors.html").render(context)
+        for render_field, field in zip(self.fields, form, strict=True):
+            if render_callbacks:
+                yield render_field_timed(render_field, field, context)
+            else:
+                yield render_field(field, context)
+
+    def render(self, form: Any, context: dict[str, Any]) -> SafeString:
+        html = "".join(collapse_chunks(self.render_parts(form, context)))
+        return mark_safe(f"\n\n{html}\n")
+
+
+def form_signature(form: Any) -> tuple[tuple[Any, ...], ...]:
+    """Describe the structure of ``form``: field names, widget classes and visibility."""
+    return tuple(
+        (name, field.widget.__class__, field.widget.is_hidden)
+        for name, field in form.fields.items()
+    )
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def compile_form_plan(
+    form_class: type,  # noqa: ARG001 - part of the cache key only
+    signature: tuple[tuple[Any, ...], ...],
+    template_pack: str,
+    label_class: str,  # noqa: ARG001 - part of the cache key only
+    field_class: str,
+) -> FormRenderPlan | None:
+    """Compile the render plan for a form layout, or ``None`` if it can't be mirrored."""
+    if template_pack != "neobrutalist" or not pack_templates_in_effect(MIRRORED_TEMPLATES):
+        return None
+
+    fields: list[FieldRenderer] = []
+    for _name, widget_class, is_hidden in signature:
+        if is_hidden:
+            fields.append(render_hidden_field)
+        else:
+            fields.append(make_field_renderer(widget_class, field_class))
+    return FormRenderPlan(fields)
+
+
+def get_form_plan(
+    form: Any, template_pack: str, label_class: str, field_class: str
+) -> FormRenderPlan | None:
+    """Return the cached render plan matching ``form``'s current fields."""
+    return compile_form_plan(
+        form.__class__, form_signature(form), str(template_pack), label_class, field_class
+    )
+
+
+def iter_form_parts(form: Any, context: dict[str, Any], template_pack: str) -> Iterator[str]:
+    """Yield the uncollapsed markup pieces of one form, from its plan or ``uni_form.html``."""
+    context = {**context, "form": form}
+    plan = None
+    if render_plans_enabled():
+        plan = get_form_plan(form, template_pack, context["label_class"], context["field_class"])
+
+    if plan is not None:
+        yield from plan.render_parts(form, context)
+    else:
+        from crispy_neurobrutalist.templatetags.neuro_filters import uni_form_template
+
+        yield uni_form_template(template_pack).render(context)
+
+
+def plan_cache_info() -> Any:
+    """Return hit/miss/size statistics of the render plan cache."""
+    return compile_form_plan.cache_info()
+
+
+def clear_plan_cache() -> None:
+    compile_form_plan.cache_clear()
+    pack_templates_in_effect.cache_clear()
+    neo_field_template.cache_clear()
+
+
+@cache
+def pack_templates_in_effect(names: tuple[str, ...]) -> bool:
+    """Check that the named templates resolve to the ones shipped with the pack."""
+    for name in names:
+        origin = get_template(f"neobrutalist/{name}").origin.name
+        if not os.path.abspath(origin).startswith(PACK_TEMPLATES_DIR):
+            return False
+    return True
+
+
+@cache
+def neo_field_template() -> Any:
+    return engines["django"].from_string("{% load neo_field %}{% neo_field field %}")
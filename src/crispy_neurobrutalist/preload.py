@@ -0,0 +1,97 @@
+"""
+``Link: rel=preload`` headers for the static assets of rendered forms.
+
+With ``PreloadMiddleware`` installed, every form rendered by the pack while
+handling a request (``|crispy``, ``|as_crispy_field``, ``{% crispy %}``,
+``{% crispy_cached %}``, ``iter_crispy_form``) records the pack's stylesheet and
+the form's ``media`` (e.g. the django-select2 script and stylesheet). The
+middleware announces them in the response's ``Link`` header, so browsers fetch
+them before parsing the HTML::
+
+    MIDDLEWARE = [
+        ...,
+        "crispy_neurobrutalist.preload.PreloadMiddleware",
+    ]
+
+Django can't send ``103 Early Hints`` itself; servers and CDNs that support them
+(nginx ``early_hints``, h2o, Cloudflare) build them from these ``Link`` headers.
+Set ``CRISPY_NEUROBRUTALIST_PRELOAD_STYLESHEET`` to the static path of your own
+build (see ``crispy_neurobrutalist.stylesheet``), or to ``None`` to only preload
+form media. Streaming responses send their headers before the body is rendered:
+``iter_crispy_form()`` records its assets when it is called, so call it in the
+view.
+"""
+
+from contextvars import ContextVar
+from typing import Any
+
+from django.conf import settings
+from django.forms import Media
+from django.templatetags.static import static
+
+from crispy_neurobrutalist.stylesheet import STYLESHEET
+
+
+class AssetRecorder:
+    """Ordered, de-duplicated assets of one request, by URL."""
+
+    def __init__(self) -> None:
+        self.assets: dict[str, str] = {}
+
+    def add(self, url: str, destination: str) -> None:
+        self.assets.setdefault(url, destination)
+
+    def add_media(self, media: Media) -> None:
+        for paths in media._css.values():
+            for path in paths:
+                if isinstance(path, str):
+                    self.add(media.absolute_path(path), "style")
+        for path in media._js:
+            # Script objects (Django 4.1+) render their own tags and aren't preloaded.
+            if isinstance(path, str):
+                self.add(media.absolute_path(path), "script")
+
+    def link_header(self) -> str:
+        return ", ".join(
+            f"<{url}>; rel=preload; as={destination}" for url, destination in self.assets.items()
+        )
+
+
+asset_recorder: ContextVar[AssetRecorder | None] = ContextVar(
+    "crispy_neurobrutalist_asset_recorder", default=None
+)
+
+
+def record_form_assets(form: Any) -> None:
+    """Record the stylesheet and the media of a form, formset or widget for the current request."""
+    recorder = asset_recorder.get()
+    if recorder is None:
+        return
+    stylesheet = getattr(settings, "CRISPY_NEUROBRUTALIST_PRELOAD_STYLESHEET", STYLESHEET)
+    if stylesheet:
+        recorder.add(static(stylesheet), "style")
+    media = getattr(form, "media", None)
+    if isinstance(media, Media):
+        recorder.add_media(media)
+
+
+class PreloadMiddleware:
+    """Adds ``Link: rel=preload`` headers for the assets of the forms a response rendered."""
+
+    def __init__(self, get_response: Any) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: Any) -> Any:
+        recorder = AssetRecorder()
+        token = asset_recorder.set(recorder)
+        try:
+            response = self.get_response(request)
+        finally:
+            asset_recorder.reset(token)
+
+        if recorder.assets:
+            links = recorder.link_header()
+            if response.has_header("Link"):
+                links = f"{response['Link']}, {links}"
+            response["Link"] = links
+        return response
@@ -0,0 +1,294 @@
+"""
+Direct HTML emission for Django's built-in widget templates.
+
+``NativeWidgetRenderer`` wraps a form renderer and builds the markup of the stock
+``django/forms/widgets/*.html`` templates with plain string operations, producing
+the same bytes as the template engine. Any other template (custom widgets, project
+overrides under a different name, unexpected option templates) is delegated to the
+wrapped renderer, and so is every widget of a renderer that resolves one of the stock
+templates to a project override (e.g. ``django/forms/widgets/attrs.html`` under
+``TemplatesSetting``).
+"""
+
+import copy
+from pathlib import Path
+from typing import Any
+
+import django.forms
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.forms.boundfield import BoundField
+from django.template import TemplateDoesNotExist
+from django.utils.formats import localize
+from django.utils.html import conditional_escape, escape, strip_spaces_between_tags
+from django.utils.safestring import SafeData
+from django.utils.timezone import template_localtime
+
+from crispy_neurobrutalist.config import pack_settings
+
+WIDGETS_DIR = "django/forms/widgets/"
+
+INPUT_TEMPLATES = frozenset(
+    f"{WIDGETS_DIR}{name}.html"
+    for name in (
+        "input",
+        "text",
+        "number",
+        "email",
+        "url",
+        "password",
+        "hidden",
+        "date",
+        "datetime",
+        "time",
+        "checkbox",
+        "file",
+        "color",
+        "search",
+        "tel",
+    )
+)
+MULTIWIDGET_TEMPLATES = frozenset(
+    f"{WIDGETS_DIR}{name}.html"
+    for name in (
+        "multiwidget",
+        "multiple_hidden",
+        "splitdatetime",
+        "splithiddendatetime",
+        "select_date",
+    )
+)
+TEXTAREA_TEMPLATE = f"{WIDGETS_DIR}textarea.html"
+SELECT_TEMPLATE = f"{WIDGETS_DIR}select.html"
+SELECT_OPTION_TEMPLATE = f"{WIDGETS_DIR}select_option.html"
+
+# Every template the emitters reproduce, including the ones they include.
+STOCK_TEMPLATES = (
+    *sorted(INPUT_TEMPLATES | MULTIWIDGET_TEMPLATES),
+    TEXTAREA_TEMPLATE,
+    SELECT_TEMPLATE,
+    SELECT_OPTION_TEMPLATE,
+    f"{WIDGETS_DIR}attrs.html",
+)
+# Django's own ``templates`` and ``jinja2`` widget directories.
+FORMS_DIR = Path(django.forms.__file__).resolve().parent
+
+
+def render_value(value: Any) -> str:
+    """Render ``value`` like ``{{ value }}`` does with autoescaping on."""
+    value = localize(template_localtime(value))
+    if not issubclass(type(value), str):
+        value = str(value)
+    return conditional_escape(value)
+
+
+def render_stringformat(value: Any) -> str:
+    """Render ``value`` like ``{{ value|stringformat:'s' }}`` does with autoescaping on."""
+    if isinstance(value, tuple):
+        value = str(value)
+    try:
+        output = f"{value}"
+    except (ValueError, TypeError):
+        return ""
+    if isinstance(value, SafeData):
+        return output
+    return escape(output)
+
+
+def render_attrs(attrs: dict[str, Any]) -> str | None:
+    """Render ``django/forms/widgets/attrs.html``; ``None`` if a value needs the engine."""
+    parts = []
+    for name, value in attrs.items():
+        if value is False:
+            continue
+        if callable(value):
+            return None
+        if value is True:
+            parts.append(f" {render_value(name)}")
+        else:
+            parts.append(f' {render_value(name)}="{render_stringformat(value)}"')
+    return "".join(parts)
+
+
+def emit_input(widget: dict[str, Any]) -> str | None:
+    attrs = render_attrs(widget["attrs"])
+    if attrs is None:
+        return None
+    value = widget["value"]
+    value_attr = f' value="{render_stringformat(value)}"' if value is not None else ""
+    return (
+        f'<input type="{render_value(widget["type"])}" name="{render_value(widget["name"])}"'
+        f"{value_attr}{attrs}>"
+    )
+
+
+def emit_textarea(widget: dict[str, Any]) -> str | None:
+    attrs = render_attrs(widget["attrs"])
+    if attrs is None:
+        return None
+    value = render_value(widget["value"]) if widget["value"] else ""
+    return f'<textarea name="{render_value(widget["name"])}"{attrs}>\n{value}</textarea>'
+
+
+def emit_option(option: dict[str, Any]) -> str | None:
+    if option["template_name"] != SELECT_OPTION_TEMPLATE:
+        return None
+    attrs = render_attrs(option["attrs"])
+    if attrs is None:
+        return None
+    return (
+        f'<option value="{render_stringformat(option["value"])}"{attrs}>'
+        f'{render_value(option["label"])}</option>'
+    )
+
+
+def emit_select(widget: dict[str, Any]) -> str | None:
+    attrs = render_attrs(widget["attrs"])
+    if attrs is None:
+        return None
+    parts = [f'<select name="{render_value(widget["name"])}"{attrs}>']
+    for group_name, group_choices, _group_index in widget["optgroups"]:
+        if group_name:
+            parts.append(f'\n  <optgroup label="{render_value(group_name)}">')
+        for option in group_choices:
+            html = emit_option(option)
+            if html is None:
+                return None
+            # The included option template ends with a newline.
+            parts.append(f"\n  {html}\n")
+        if group_name:
+            parts.append("\n  </optgroup>")
+    parts.append("\n</select>")
+    return "".join(parts)
+
+
+def emit_multiwidget(widget: dict[str, Any]) -> str | None:
+    parts = []
+    for subwidget in widget["subwidgets"]:
+        html = emit(subwidget["template_name"], subwidget)
+        if html is None:
+            return None
+        parts.append(html)
+    # ``{% spaceless %}`` around the subwidget includes.
+    return strip_spaces_between_tags("".join(parts).strip())
+
+
+def emit(template_name: str, widget: dict[str, Any]) -> str | None:
+    """Return the markup of ``template_name`` for ``widget``, or ``None`` if unsupported."""
+    if template_name in INPUT_TEMPLATES:
+        return emit_input(widget)
+    if template_name == SELECT_TEMPLATE:
+        return emit_select(widget)
+    if template_name == TEXTAREA_TEMPLATE:
+        return emit_textarea(widget)
+    if template_name in MULTIWIDGET_TEMPLATES:
+        return emit_multiwidget(widget)
+    return None
+
+
+def resolves_stock_templates(renderer: Any) -> bool:
+    """Whether ``renderer`` resolves every template in ``STOCK_TEMPLATES`` to Django's own."""
+    for template_name in STOCK_TEMPLATES:
+        try:
+            origin = renderer.get_template(template_name).origin
+        except (AttributeError, TemplateDoesNotExist):
+            # Custom renderers without ``get_template()`` or template origins.
+            return False
+        if not Path(origin.name).resolve().is_relative_to(FORMS_DIR):
+            return False
+    return True
+
+
+# Renderer class -> ``resolves_stock_templates()`` of its instances.
+stock_template_renderers: dict[type, bool] = {}
+
+
+def uses_stock_templates(renderer: Any) -> bool:
+    """
+    Cached ``resolves_stock_templates()``.
+
+    Renderers of one class resolve templates alike, so the result is cached per
+    class (until the template settings change): forms that build a renderer per
+    request don't look the templates up again, and renderers aren't kept alive.
+    """
+    renderer_class = type(renderer)
+    result = stock_template_renderers.get(renderer_class)
+    if result is None:
+        result = stock_template_renderers[renderer_class] = resolves_stock_templates(renderer)
+    return result
+
+
+@receiver(setting_changed, dispatch_uid="crispy_neurobrutalist_renderer_settings_changed")
+def renderer_settings_changed(sender, setting, **kwargs):
+    if setting in ("TEMPLATES", "FORM_RENDERER", "INSTALLED_APPS"):
+        stock_template_renderers.clear()
+
+
+class NativeWidgetRenderer:
+    """Form renderer that emits built-in widget markup directly."""
+
+    def __init__(self, fallback: Any) -> None:
+        self.fallback = fallback
+
+    def render(self, template_name: str, context: dict[str, Any], request: Any = None) -> str:
+        widget = context.get("widget")
+        if widget is not None and uses_stock_templates(self.fallback):
+            html = emit(template_name, widget)
+            if html is not None:
+                return html
+        return self.fallback.render(template_name, context, request=request)
+
+
+def native_widgets_enabled() -> bool:
+    return pack_settings().native_widgets
+
+
+def copy_widget(widget: Any) -> Any:
+    """
+    Return a shallow copy of ``widget`` with its own ``attrs`` and sub-widgets.
+
+    The copy can be changed for one render without touching the form's widget,
+    which may be shared across renders and threads. Choices are shared.
+    """
+    clone = copy.copy(widget)
+    clone.attrs = dict(widget.attrs)
+    if hasattr(widget, "widgets"):
+        clone.widgets = [copy_widget(subwidget) for subwidget in widget.widgets]
+    elif hasattr(widget, "widget"):
+        clone.widget = copy_widget(widget.widget)
+    return clone
+
+
+def render_widget(field: BoundField, widget: Any) -> str:
+    """Render ``field`` like ``str(field)``, with ``widget`` instead of its own."""
+    html = field.as_widget(widget)
+    if field.field.show_hidden_initial:
+        html += field.as_hidden(only_initial=True)
+    return html
+
+
+def render_bound_field(field: BoundField, widget: Any = None) -> str:
+    """
+    Render ``field`` exactly like ``str(field)``, emitting built-in widgets directly.
+
+    ``widget`` replaces the field's widget, e.g. with a copy from ``copy_widget()``.
+    Falls back to the template engine for bound fields that customize ``as_widget``
+    or render a hidden initial value.
+    """
+    if widget is None:
+        widget = field.field.widget
+    if field.field.show_hidden_initial or type(field).as_widget is not BoundField.as_widget:
+        return render_widget(field, widget)
+
+    # Mirrors BoundField.as_widget(), swapping in the native renderer.
+    if field.field.localize:
+        widget.is_localized = True
+    attrs = field.build_widget_attrs({}, widget)
+    if field.auto_id and "id" not in widget.attrs:
+        attrs.setdefault("id", field.auto_id)
+    return widget.render(
+        name=field.html_name,
+        value=field.value(),
+        attrs=attrs,
+        renderer=NativeWidgetRenderer(field.form.renderer),
+    )
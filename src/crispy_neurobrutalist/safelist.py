@@ -0,0 +1,141 @@
+"""
+Every CSS class the pack can render, for the Tailwind build.
+
+``collect_classes()`` gathers the static classes of the pack's templates (as the
+template engine resolves them, so project overrides count), the widget styles of
+``{% neo_class %}`` and their semantic classes, the widget styles and
+error variants of ``CrispyNeuroBrutaListFieldNode.default_container`` and of the
+containers listed in ``CRISPY_NEUROBRUTALIST_SAFELIST_CONTAINERS``, the
+classes of the layout components in every color and their CSS-variable variants. The
+``neurobrutalist_safelist`` management command writes them to a file Tailwind
+can scan instead of the installed package::
+
+    CRISPY_NEUROBRUTALIST_SAFELIST_CONTAINERS = ["myapp.forms.compact_styles"]
+
+Classes inserted through template variables (``{{ wrapper_class }}``, helper
+attributes) aren't known to the pack and must be covered by the project.
+"""
+
+import inspect
+import json
+import re
+import typing
+from collections.abc import Callable, Iterable, Iterator
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.template.loader import get_template
+from django.utils.module_loading import import_string
+
+from crispy_neurobrutalist import layout
+from crispy_neurobrutalist.neurobrutalist import CSSContainer
+from crispy_neurobrutalist.plan import DEFAULT_FIELD_CLASS, DEFAULT_LABEL_CLASS
+from crispy_neurobrutalist.semantic import TEMPLATE_STYLES, semantic_styles
+from crispy_neurobrutalist.theme import THEMED_CLASSES
+from crispy_neurobrutalist.warmup import pack_template_names
+
+NEO_CLASS_TAG = re.compile(r"""{%\s*neo_class\s+["']([\w-]+)["']\s*%}""")
+TEMPLATE_TAG = re.compile(r"{%.*?%}|{{.*?}}|{#.*?#}", re.DOTALL)
+CLASS_ATTRIBUTE = re.compile(r"""\bclass=(?:"([^"]*)"|'([^']*)')""")
+MARKER = "\0"
+
+FORMATS = ("txt", "json")
+
+
+def template_classes(source: str) -> Iterator[str]:
+    """
+    Yield the static classes of the ``class`` attributes in a template source.
+
+    Text touching a template tag is kept only when it can't be part of a class
+    name built by the tag: ``sr-only{% if %}`` gives ``sr-only``, while
+    ``bg-{{ color }}`` gives nothing. ``{% neo_class %}`` tags give their Tailwind classes.
+    """
+    source = NEO_CLASS_TAG.sub(lambda match: TEMPLATE_STYLES.get(match.group(1), ""), source)
+    source = TEMPLATE_TAG.sub(MARKER, source)
+    for match in CLASS_ATTRIBUTE.finditer(source):
+        for token in (match.group(1) or match.group(2) or "").split():
+            parts = token.split(MARKER)
+            for index, part in enumerate(parts):
+                if not part:
+                    continue
+                if index > 0 and part[0] in "-:":
+                    continue
+                if index < len(parts) - 1 and part[-1] in "-:":
+                    continue
+                yield part
+
+
+def container_classes(container: CSSContainer) -> Iterator[str]:
+    """Yield the classes of every widget type of ``container``, in both states."""
+    for errors in (False, True):
+        for css_class in container.as_dict(errors=errors).values():
+            yield from css_class.split()
+
+
+def literal_choices(function: Callable[..., object], parameter: str) -> tuple[str, ...]:
+    """Return the values of a ``Literal[...]`` annotated parameter."""
+    return typing.get_args(inspect.signature(function).parameters[parameter].annotation)
+
+
+def layout_classes() -> Iterator[str]:
+    """Yield the default classes of the layout components in every variant."""
+    css_classes = [
+        layout.Submit("submit", "Submit").field_classes,
+        layout.Card().css_class,
+        layout.FormActions().css_class,
+        layout.InlineCheckboxes("field").wrapper_class,
+        layout.InlineRadios("field").wrapper_class,
+    ]
+    for button in (layout.Button, layout.Reset):
+        for color in literal_choices(button.__init__, "color"):
+            css_classes.append(button("button", "Button", color=color).field_classes)
+    for alert_type in literal_choices(layout.Alert.__init__, "alert_type"):
+        for dismissible in (False, True):
+            css_classes.append(
+                layout.Alert(alert_type=alert_type, dismissible=dismissible).css_class
+            )
+    for css_class in css_classes:
+        yield from css_class.split()
+
+
+def configured_containers(paths: Iterable[str] = ()) -> list[CSSContainer]:
+    """Return the default container and those named in the setting and in ``paths``."""
+    from crispy_neurobrutalist.templatetags.neo_field import CrispyNeuroBrutaListFieldNode
+
+    containers = [CrispyNeuroBrutaListFieldNode.default_container]
+    for path in (*getattr(settings, "CRISPY_NEUROBRUTALIST_SAFELIST_CONTAINERS", ()), *paths):
+        try:
+            container = import_string(path)
+        except ImportError as e:
+            raise ImproperlyConfigured(
+                f"CRISPY_NEUROBRUTALIST_SAFELIST_CONTAINERS: can't import {path!r}."
+            ) from e
+        if not isinstance(container, CSSContainer):
+            raise ImproperlyConfigured(
+                f"CRISPY_NEUROBRUTALIST_SAFELIST_CONTAINERS: {path!r} is not a CSSContainer."
+            )
+        containers.append(container)
+    return containers
+
+
+def collect_classes(container_paths: Iterable[str] = ()) -> list[str]:
+    """Return every class the pack can render, sorted."""
+    classes = set(DEFAULT_LABEL_CLASS.split()) | set(DEFAULT_FIELD_CLASS.split())
+    for name in pack_template_names():
+        classes.update(template_classes(get_template(name).template.source))
+    containers = configured_containers(container_paths)
+    for container in containers:
+        classes.update(container_classes(container))
+    for name, css_class in semantic_styles(containers[0]):
+        classes.add(name)
+        classes.update(css_class.split())
+    classes.update(layout_classes())
+    classes.update(THEMED_CLASSES.values())
+    return sorted(classes)
+
+
+def format_classes(classes: list[str], output_format: str = "txt") -> str:
+    """Render ``classes`` one per line (a Tailwind content file) or as a JSON safelist."""
+    if output_format == "json":
+        return json.dumps(classes, indent=2) + "\n"
+    return "".join(f"{css_class}\n" for css_class in classes)
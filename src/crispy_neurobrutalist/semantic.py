@@ -0,0 +1,180 @@
+"""
+Short semantic classes for the pack's widgets.
+
+By default every widget carries its Tailwind classes inline, so a form with
+many fields repeats the same long class strings. With
+``CRISPY_NEUROBRUTALIST_SEMANTIC_CLASSES = True`` the pack emits one class per
+widget style instead (``neo-input``, ``neo-check``, ``neo-file``, with
+``-error`` variants for fields with errors), and ``semantic_css()`` turns the
+same style tables into component classes for the Tailwind build::
+
+    python manage.py neurobrutalist_semantic_css -o assets/neurobrutalist-semantic.css
+
+The pack's own classes (``neo-shadow-sm``, ``custom-checkbox``) are plain CSS
+that ``@apply`` can't use, so they stay inline next to the semantic class.
+Fields rendered with a custom ``css_container`` keep their Tailwind classes.
+"""
+
+import re
+from collections.abc import Iterator
+from functools import cache, lru_cache
+from typing import Any
+
+from crispy_neurobrutalist.config import pack_settings
+from crispy_neurobrutalist.neurobrutalist import CSSContainer, widget_style_key
+from crispy_neurobrutalist.tailwind import merge_classes, split_modifiers
+from crispy_neurobrutalist.theme import theme_classes, theme_variables_enabled, themed_classes
+
+INPUT_CLASSES = (
+    "w-full p-3 bg-white border-2 border-black rounded-lg "
+    "focus:outline-none focus:ring-2 focus:ring-blue-400 neo-shadow-sm"
+)
+CHECKBOX_CLASSES = "w-5 h-5 border-2 border-black rounded-md appearance-none custom-checkbox"
+
+# Classes written in the layout templates with ``{% neo_class %}``.
+TEMPLATE_STYLES = {
+    "neo-input": INPUT_CLASSES,
+    "neo-text": (
+        "w-full px-4 py-3 bg-white border-2 border-black rounded-lg "
+        "focus:outline-none focus:ring-2 focus:ring-yellow-400 neo-shadow-sm caret-black"
+    ),
+    "neo-textarea": (
+        "w-full px-4 py-3 bg-white border-2 border-black rounded-lg "
+        "focus:outline-none focus:ring-2 focus:ring-yellow-400 neo-shadow-sm"
+    ),
+    "neo-select": f"mt-1 {INPUT_CLASSES} appearance-none",
+    "neo-multiselect": f"mt-1 {INPUT_CLASSES}",
+    "neo-check": CHECKBOX_CLASSES,
+    "neo-radio": "w-6 h-6 border-2 border-black rounded-full appearance-none custom-radio",
+    "neo-form-error": (
+        "flex flex-col p-4 bg-red-300 border-2 border-black rounded-lg neo-shadow-sm my-2"
+    ),
+    "neo-error-text": "text-red-600",
+}
+
+# Semantic class of the CSSContainer widget types; the others use ``neo-<type>``.
+WIDGET_NAMES = {
+    **dict.fromkeys(
+        ("text", "number", "email", "url", "password", "textarea", "date", "datetime", "time"),
+        "neo-input",
+    ),
+    "checkbox": "neo-check",
+    "file": "neo-file",
+    "clearablefile": "neo-file",
+    "splitdatetime": "neo-split",
+    **dict.fromkeys(
+        (
+            "select2",
+            "select2multiple",
+            "select2tag",
+            "heavyselect2",
+            "heavyselect2multiple",
+            "heavyselect2tag",
+            "modelselect2",
+            "modelselect2multiple",
+            "modelselect2tag",
+        ),
+        "neo-select2",
+    ),
+}
+
+ERROR_SUFFIX = "-error"
+
+PACK_CLASS = re.compile(r"(neo|custom)-")
+
+
+def is_pack_class(token: str) -> bool:
+    """Whether ``token`` is one of the pack's plain CSS classes (``file:neo-shadow-sm``)."""
+    return bool(PACK_CLASS.match(split_modifiers(token)[1]))
+
+
+def semantic_classes_enabled() -> bool:
+    return pack_settings().semantic_classes
+
+
+@lru_cache(maxsize=1024)
+def compact_class(name: str, css_class: str) -> str:
+    """Return ``name`` followed by the pack classes of ``css_class``."""
+    return " ".join([name, *(token for token in css_class.split() if is_pack_class(token))])
+
+
+def template_class(name: str) -> str:
+    """Return the classes of a ``TEMPLATE_STYLES`` entry in the active modes."""
+    snapshot = pack_settings()
+    css_class = TEMPLATE_STYLES[name]
+    if snapshot.theme_variables:
+        css_class = themed_classes(css_class)
+    if snapshot.semantic_classes:
+        return compact_class(name, css_class)
+    return css_class
+
+
+@cache
+def widget_name(widget_class: type, errors: bool = False) -> str:
+    """Return the semantic class of a widget class (``TextInput`` -> ``neo-input``)."""
+    key = widget_style_key(widget_class)
+    name = WIDGET_NAMES.get(key, f"neo-{key}")
+    return name + ERROR_SUFFIX if errors else name
+
+
+def widget_class(field: Any, css_class: str, errors: bool = False) -> str:
+    """Return the semantic classes for ``field`` styled with ``css_class``."""
+    if not css_class:
+        return css_class
+    return compact_class(widget_name(field.field.widget.__class__, errors), css_class)
+
+
+def semantic_styles(container: CSSContainer) -> Iterator[tuple[str, str]]:
+    """Yield ``(semantic class, Tailwind classes)`` for the templates and ``container``."""
+    for name, css_class in TEMPLATE_STYLES.items():
+        yield name, theme_classes(css_class)
+    styles = container.as_dict()
+    error_styles = container.as_dict(errors=True)
+    for key, css_class in styles.items():
+        if key == "error_border" or not css_class:
+            continue
+        name = WIDGET_NAMES.get(key, f"neo-{key}")
+        yield name, css_class
+        yield name + ERROR_SUFFIX, error_styles[key]
+
+
+def semantic_rules(container: CSSContainer) -> dict[str, str]:
+    """
+    Return the Tailwind utilities of each semantic class, without the pack classes.
+
+    Utilities are merged with ``merge_classes()``: the rule of ``neo-input-error``
+    applies ``bg-red-100`` only, where the inline classes carry both backgrounds.
+
+    Raises ``ValueError`` when two widget types share a semantic class but not
+    their utilities.
+    """
+    rules: dict[str, str] = {}
+    for name, css_class in semantic_styles(container):
+        utilities = merge_classes(
+            " ".join(token for token in css_class.split() if not is_pack_class(token))
+        )
+        if name in rules:
+            if set(rules[name].split()) != set(utilities.split()):
+                raise ValueError(f"Widget types sharing {name!r} have different classes.")
+            continue
+        rules[name] = utilities
+    return rules
+
+
+def semantic_css(container: CSSContainer | None = None) -> str:
+    """Return the ``@layer components`` rules of the semantic classes."""
+    if container is None:
+        from crispy_neurobrutalist.templatetags.neo_field import CrispyNeuroBrutaListFieldNode
+
+        node = CrispyNeuroBrutaListFieldNode
+        container = node.themed_container if theme_variables_enabled() else node.default_container
+
+    lines = [
+        "/* Generated by `manage.py neurobrutalist_semantic_css`; do not edit. */",
+        "@layer components {",
+    ]
+    for name, utilities in semantic_rules(container).items():
+        if utilities:
+            lines.append(f"  .{name} {{ @apply {utilities}; }}")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
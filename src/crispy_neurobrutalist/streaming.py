@@ -0,0 +1,78 @@
+"""
+Streaming rendering of forms and formsets.
+
+``iter_crispy_form`` yields the HTML of ``{{ form|crispy }}`` field by field (and
+formsets row by row) so large pages can be sent with ``StreamingHttpResponse``
+without building the whole document in memory::
+
+    from django.http import StreamingHttpResponse
+    from crispy_neurobrutalist import iter_crispy_form
+
+    def edit_items(request):
+        formset = ItemFormSet(queryset=Item.objects.all())
+        return StreamingHttpResponse(iter_crispy_form(formset))
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+from crispy_forms.utils import TEMPLATE_PACK
+from django.forms.formsets import BaseFormSet
+
+from crispy_neurobrutalist.config import RENDER_CONFIG, resolve_render_config
+from crispy_neurobrutalist.formsets import formset_template_in_effect, iter_formset_parts
+from crispy_neurobrutalist.plan import (
+    DEFAULT_FIELD_CLASS,
+    DEFAULT_LABEL_CLASS,
+    collapse_chunks,
+    iter_form_parts,
+)
+from crispy_neurobrutalist.preload import record_form_assets
+
+
+def iter_crispy_form(
+    form_or_formset: Any,
+    template_pack: str = TEMPLATE_PACK,
+    label_class: str = DEFAULT_LABEL_CLASS,
+    field_class: str = DEFAULT_FIELD_CLASS,
+) -> Iterator[str]:
+    """
+    Yield the HTML of ``form_or_formset|crispy`` in chunks.
+
+    Form chunks are single fields; formset rows are streamed one after the other,
+    so only one row is held in memory at a time. Joining the chunks gives the same
+    HTML as the ``crispy`` filter.
+    """
+    # Recorded on call: a streaming response sends its headers before the first chunk.
+    record_form_assets(form_or_formset)
+    return iter_chunks(form_or_formset, template_pack, label_class, field_class)
+
+
+def iter_chunks(
+    form_or_formset: Any, template_pack: str, label_class: str, field_class: str
+) -> Iterator[str]:
+    context = {
+        "field_class": field_class,
+        "field_template": f"{template_pack}/field.html",
+        "form_show_errors": True,
+        "form_show_labels": True,
+        "label_class": label_class,
+    }
+    context[RENDER_CONFIG] = resolve_render_config(context)
+
+    if isinstance(form_or_formset, BaseFormSet):
+        if not formset_template_in_effect(template_pack):
+            from crispy_neurobrutalist.templatetags.neuro_filters import uni_formset_template
+
+            # A project-level uni_formset.html can't be streamed row by row.
+            yield uni_formset_template(template_pack).render(
+                {**context, "formset": form_or_formset}
+            )
+            return
+        parts = iter_formset_parts(form_or_formset, context, template_pack)
+    else:
+        parts = iter_form_parts(form_or_formset, context, template_pack)
+
+    yield "\n\n"
+    yield from collapse_chunks(parts)
+    yield "\n"
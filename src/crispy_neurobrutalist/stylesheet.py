@@ -0,0 +1,242 @@
+"""
+Tree-shaken, minified build of ``neurobrutalist.css``.
+
+``build_stylesheet()`` keeps the rules of ``crispy_neurobrutalist/css/neurobrutalist.css``
+(as the staticfiles finders resolve it, so project overrides count) whose class
+selectors only use classes the pack can render (see ``safelist.collect_classes()``)
+and minifies them. Select2 rules are kept when ``django_select2`` is installed, and
+``@keyframes`` only when a kept rule animates with them. The
+``neurobrutalist_css`` management command writes the result under a content-hashed
+name with precompressed ``.gz`` (and ``.br`` with the ``brotli`` package) siblings
+that WhiteNoise-style servers pick up::
+
+    python manage.py neurobrutalist_css --output-dir static/css --keep neo-card
+
+Classes your own templates use from the stylesheet (``neo-card``, ``neo-pop``)
+must be kept explicitly.
+"""
+
+import gzip
+import hashlib
+import importlib.util
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+from django.contrib.staticfiles import finders
+from django.core.exceptions import ImproperlyConfigured
+
+from crispy_neurobrutalist.safelist import collect_classes
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+STYLESHEET = "crispy_neurobrutalist/css/neurobrutalist.css"
+
+# Class prefixes of third-party markup, kept when the package rendering it is installed.
+EXTERNAL_CLASSES = {"select2-": "django_select2"}
+
+BLOCK_START = re.compile(r"[{;]")
+COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+CLASS_SELECTOR = re.compile(r"\.(-?[_a-zA-Z][\w-]*)")
+ANIMATION = re.compile(r"animation(?:-name)?:([^;]+)")
+NESTED_AT_RULES = ("@media", "@supports", "@layer")
+
+
+class Rule(NamedTuple):
+    """A rule: declarations, nested rules (``@media``) or neither (``@import``)."""
+
+    prelude: str
+    declarations: str | None = None
+    children: tuple["Rule", ...] | None = None
+
+
+def parse_rules(css: str) -> tuple[Rule, ...]:
+    """Parse comment-free CSS into rules; nested blocks are parsed recursively."""
+    rules = []
+    position = 0
+    while True:
+        match = BLOCK_START.search(css, position)
+        if match is None:
+            break
+        prelude = css[position : match.start()].strip()
+        if match.group() == ";":
+            rules.append(Rule(prelude))
+            position = match.end()
+            continue
+        depth = 1
+        end = match.end()
+        while depth:
+            if end == len(css):
+                raise ValueError(f"Unclosed block after {prelude!r}.")
+            if css[end] == "{":
+                depth += 1
+            elif css[end] == "}":
+                depth -= 1
+            end += 1
+        body = css[match.end() : end - 1]
+        if prelude.startswith(NESTED_AT_RULES) or prelude.startswith("@keyframes"):
+            rules.append(Rule(prelude, children=parse_rules(body)))
+        else:
+            rules.append(Rule(prelude, declarations=body))
+        position = end
+    return tuple(rules)
+
+
+def selector_reachable(selector: str, classes: set[str], external: tuple[str, ...]) -> bool:
+    return all(
+        name in classes or name.startswith(external) for name in CLASS_SELECTOR.findall(selector)
+    )
+
+
+def shake(rules: Iterable[Rule], classes: set[str], external: tuple[str, ...]) -> list[Rule]:
+    """Drop the selectors (and emptied rules) using classes outside ``classes``."""
+    kept = []
+    for rule in rules:
+        if rule.prelude.startswith("@keyframes") or (
+            rule.children is None and rule.declarations is None
+        ):
+            # Statements and keyframes; unused keyframes are dropped afterwards.
+            kept.append(rule)
+        elif rule.children is not None:
+            children = shake(rule.children, classes, external)
+            if children:
+                kept.append(rule._replace(children=tuple(children)))
+        else:
+            selectors = [
+                selector
+                for selector in rule.prelude.split(",")
+                if selector_reachable(selector, classes, external)
+            ]
+            if selectors:
+                kept.append(rule._replace(prelude=",".join(selectors)))
+    return kept
+
+
+def animations(rules: Iterable[Rule]) -> set[str]:
+    """Return the names used by ``animation`` declarations of ``rules``."""
+    names = set()
+    for rule in rules:
+        if rule.children is not None and not rule.prelude.startswith("@keyframes"):
+            names |= animations(rule.children)
+        elif rule.declarations:
+            for value in ANIMATION.findall(rule.declarations):
+                names.update(re.split(r"[\s,]+", value.strip()))
+    return names
+
+
+def minify_value(value: str) -> str:
+    value = " ".join(value.split())
+    if '"' in value or "'" in value:
+        return value
+    value = re.sub(r"\s*,\s*", ",", value)
+    return re.sub(r"\s*!important", "!important", value)
+
+
+def minify_declarations(declarations: str) -> str:
+    minified = []
+    for declaration in declarations.split(";"):
+        name, _, value = declaration.partition(":")
+        if name.strip():
+            minified.append(f"{name.strip()}:{minify_value(value)}")
+    return ";".join(minified)
+
+
+def minify_prelude(prelude: str) -> str:
+    prelude = " ".join(prelude.split())
+    if prelude.startswith("@"):
+        return re.sub(r"\(\s*([\w-]+)\s*:\s*", r"(\1:", prelude)
+    return re.sub(r"\s*([>~,])\s*", r"\1", prelude)
+
+
+def serialize(rules: Iterable[Rule]) -> str:
+    parts = []
+    for rule in rules:
+        prelude = minify_prelude(rule.prelude)
+        if rule.children is not None:
+            parts.append(f"{prelude}{{{serialize(rule.children)}}}")
+        elif rule.declarations is not None:
+            parts.append(f"{prelude}{{{minify_declarations(rule.declarations)}}}")
+        else:
+            parts.append(f"{prelude};")
+    return "".join(parts)
+
+
+def external_prefixes() -> tuple[str, ...]:
+    return tuple(
+        prefix
+        for prefix, module in EXTERNAL_CLASSES.items()
+        if importlib.util.find_spec(module) is not None
+    )
+
+
+def read_stylesheet() -> str:
+    path = finders.find(STYLESHEET)
+    if path is None:
+        raise ImproperlyConfigured(f"Static file {STYLESHEET!r} not found.")
+    return Path(path).read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=1)
+def stylesheet_rules() -> tuple[Rule, ...]:
+    """Return the parsed rules of the pack's stylesheet, read once."""
+    return parse_rules(COMMENT.sub("", read_stylesheet()))
+
+
+def extract_css(rules: Iterable[Rule], classes: set[str], external: tuple[str, ...]) -> str:
+    """Return the minified ``rules`` reachable from ``classes``, with the keyframes they use."""
+    rules = shake(rules, classes, external)
+    used_animations = animations(rules)
+    return serialize(
+        rule
+        for rule in rules
+        if not rule.prelude.startswith("@keyframes") or rule.prelude.split()[-1] in used_animations
+    )
+
+
+def build_stylesheet(
+    container_paths: Iterable[str] = (),
+    keep: Iterable[str] = (),
+    source: str | None = None,
+) -> str:
+    """
+    Return the minified rules of the pack's stylesheet reachable from its classes.
+
+    ``container_paths`` and ``keep`` add classes like ``--container`` and ``--keep``.
+    """
+    if source is None:
+        source = read_stylesheet()
+    classes = {*collect_classes(container_paths), *keep}
+    rules = parse_rules(COMMENT.sub("", source))
+    return extract_css(rules, classes, external_prefixes()) + "\n"
+
+
+def write_stylesheet(
+    content: str, output_dir: str | Path, name: str = "neurobrutalist"
+) -> list[Path]:
+    """
+    Write ``<name>.<hash>.min.css`` and its precompressed siblings to ``output_dir``.
+
+    The hash is the first 12 hex digits of the content's MD5, like Django's
+    ``ManifestStaticFilesStorage``. Returns the written paths.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    data = content.encode()
+    digest = hashlib.md5(data, usedforsecurity=False).hexdigest()[:12]
+    path = output_dir / f"{name}.{digest}.min.css"
+    path.write_bytes(data)
+    paths = [path]
+
+    gz_path = path.with_name(path.name + ".gz")
+    gz_path.write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+    paths.append(gz_path)
+    if brotli is not None:
+        br_path = path.with_name(path.name + ".br")
+        br_path.write_bytes(brotli.compress(data, mode=brotli.MODE_TEXT))
+        paths.append(br_path)
+    return paths
@@ -0,0 +1,434 @@
+"""
+Deterministic, conflict-aware merging of Tailwind class strings.
+
+``merge_classes("p-3 bg-white border-2", "p-4 bg-red-100")`` returns
+``"border-2 p-4 bg-red-100"``: classes are kept in the order they were given,
+and when two utilities set the same property under the same variants (``p-3``
+and ``p-4``, ``hover:bg-white`` and ``hover:bg-red-100``) only the last one
+survives. Shorthands also remove the longhands before them (``px-2 p-4`` ->
+``p-4``) but not after them (``p-4 px-2`` is kept as is). Classes that aren't
+Tailwind utilities, such as ``neo-shadow-sm``, are only de-duplicated.
+
+The result only depends on the input strings, so rendered HTML is byte-stable
+across processes, and merges are memoized.
+"""
+
+import re
+from collections.abc import Callable
+from functools import lru_cache
+
+MERGE_CACHE_SIZE = 4096
+
+COLOR = re.compile(
+    r"(inherit|current|transparent|black|white"
+    r"|(slate|gray|zinc|neutral|stone|red|orange|amber|yellow|lime|green|emerald|teal|cyan"
+    r"|sky|blue|indigo|violet|purple|fuchsia|pink|rose)-(50|[1-9]00|950))"
+    r"(/\d+|/\[[^\]]+\])?"
+)
+ARBITRARY_COLOR = re.compile(r"\[(#|rgba?\(|hsla?\(|color:)")
+LENGTH = re.compile(r"\d+(\.\d+)?|px|\[[^\]]*(px|rem|em|%|vh|vw)\]")
+
+FONT_SIZES = frozenset(("xs", "sm", "base", "lg", "xl", *(f"{n}xl" for n in range(2, 10))))
+FONT_WEIGHTS = frozenset(
+    ("thin", "extralight", "light", "normal", "medium", "semibold", "bold", "extrabold", "black")
+)
+TEXT_ALIGNS = frozenset(("left", "center", "right", "justify", "start", "end"))
+LINE_STYLES = frozenset(("solid", "dashed", "dotted", "double", "hidden", "none"))
+SHADOW_SIZES = frozenset(("", "sm", "md", "lg", "xl", "2xl", "inner", "none"))
+BG_POSITIONS = frozenset(
+    (
+        "bottom",
+        "center",
+        "left",
+        "left-bottom",
+        "left-top",
+        "right",
+        "right-bottom",
+        "right-top",
+        "top",
+    )
+)
+BG_REPEATS = frozenset(
+    ("repeat", "no-repeat", "repeat-x", "repeat-y", "repeat-round", "repeat-space")
+)
+
+# Whole utilities that set one property.
+STANDALONE = {
+    **dict.fromkeys(
+        (
+            "block",
+            "inline-block",
+            "inline",
+            "flex",
+            "inline-flex",
+            "grid",
+            "inline-grid",
+            "table",
+            "contents",
+            "flow-root",
+            "list-item",
+            "hidden",
+        ),
+        "display",
+    ),
+    **dict.fromkeys(("static", "fixed", "absolute", "relative", "sticky"), "position"),
+    **dict.fromkeys(("visible", "invisible", "collapse"), "visibility"),
+    **dict.fromkeys(("italic", "not-italic"), "font-style"),
+    **dict.fromkeys(("uppercase", "lowercase", "capitalize", "normal-case"), "text-transform"),
+    **dict.fromkeys(("underline", "overline", "line-through", "no-underline"), "text-decoration"),
+    **dict.fromkeys(("truncate", "text-ellipsis", "text-clip"), "text-overflow"),
+    **dict.fromkeys(("sr-only", "not-sr-only"), "sr-only"),
+}
+
+
+def is_color(value: str) -> bool:
+    return bool(COLOR.fullmatch(value) or ARBITRARY_COLOR.match(value))
+
+
+def is_length(value: str) -> bool:
+    return value == "" or bool(LENGTH.fullmatch(value))
+
+
+def text_group(value: str) -> str:
+    if value in FONT_SIZES or (value.startswith("[") and is_length(value)):
+        return "font-size"
+    if value in TEXT_ALIGNS:
+        return "text-align"
+    if value in ("wrap", "nowrap", "balance", "pretty"):
+        return "text-wrap"
+    return "text-color"
+
+
+def font_group(value: str) -> str:
+    return "font-weight" if value in FONT_WEIGHTS or value.isdigit() else "font-family"
+
+
+def bg_group(value: str) -> str:
+    if value in ("fixed", "local", "scroll"):
+        return "bg-attachment"
+    if value in BG_POSITIONS:
+        return "bg-position"
+    if value in BG_REPEATS:
+        return "bg-repeat"
+    if value in ("auto", "cover", "contain"):
+        return "bg-size"
+    if value == "none" or value.startswith("gradient"):
+        return "bg-image"
+    return "bg-color"
+
+
+def border_side_group(side: str) -> Callable[[str], str]:
+    def group(value: str) -> str:
+        if is_length(value):
+            return f"border-width{side}"
+        if not side and value in LINE_STYLES:
+            return "border-style"
+        if not side and value in ("collapse", "separate"):
+            return "border-collapse"
+        return f"border-color{side}"
+
+    return group
+
+
+def sized_or_colored(name: str, sizes: frozenset[str] = frozenset(("",))) -> Callable[[str], str]:
+    """Group ``sizes`` as ``name``, other lengths as ``name-width``, colors as ``name-color``."""
+
+    def group(value: str) -> str:
+        if is_color(value):
+            return f"{name}-color"
+        if value in sizes:
+            return name
+        return f"{name}-width" if is_length(value) else name
+
+    return group
+
+
+def outline_group(value: str) -> str:
+    if value == "" or value in LINE_STYLES:
+        return "outline-style"
+    if is_length(value):
+        return "outline-width"
+    return "outline-color"
+
+
+def flex_group(value: str) -> str:
+    if value in ("row", "row-reverse", "col", "col-reverse"):
+        return "flex-direction"
+    if value in ("wrap", "wrap-reverse", "nowrap"):
+        return "flex-wrap"
+    return "flex"
+
+
+SIDES = ("x", "y", "t", "r", "b", "l", "s", "e")
+# Longhands each shorthand overrides, for box families written ``<prefix><side>``.
+BOX_SIDES = {"": SIDES, "x": ("r", "l", "s", "e"), "y": ("t", "b")}
+
+
+def box_family(prefix: str, separator: str = "") -> dict[str, set[str]]:
+    """Conflicts of a ``p``/``px``/``pt``-style family (``border-width``, ``border-width-x``...)."""
+    return {
+        prefix + (separator + side if side else ""): {prefix + separator + s for s in sides}
+        for side, sides in BOX_SIDES.items()
+    }
+
+
+CONFLICTS: dict[str, set[str]] = {
+    **box_family("p"),
+    **box_family("m"),
+    **box_family("scroll-p", "-"),
+    **box_family("scroll-m", "-"),
+    **box_family("border-width", "-"),
+    **box_family("border-color", "-"),
+    "gap": {"gap-x", "gap-y"},
+    "size": {"w", "h"},
+    "inset": {"inset-x", "inset-y", "top", "right", "bottom", "left", "start", "end"},
+    "inset-x": {"right", "left", "start", "end"},
+    "inset-y": {"top", "bottom"},
+    "overflow": {"overflow-x", "overflow-y"},
+    "overscroll": {"overscroll-x", "overscroll-y"},
+    "scale": {"scale-x", "scale-y"},
+    "rounded": {
+        "rounded-t",
+        "rounded-r",
+        "rounded-b",
+        "rounded-l",
+        "rounded-s",
+        "rounded-e",
+        "rounded-tl",
+        "rounded-tr",
+        "rounded-br",
+        "rounded-bl",
+        "rounded-ss",
+        "rounded-se",
+        "rounded-es",
+        "rounded-ee",
+    },
+    "rounded-t": {"rounded-tl", "rounded-tr"},
+    "rounded-r": {"rounded-tr", "rounded-br"},
+    "rounded-b": {"rounded-br", "rounded-bl"},
+    "rounded-l": {"rounded-tl", "rounded-bl"},
+    "rounded-s": {"rounded-ss", "rounded-es"},
+    "rounded-e": {"rounded-se", "rounded-ee"},
+}
+
+# Utility prefix -> group, or a function of the value after the prefix.
+PREFIXES: dict[str, str | Callable[[str], str]] = {
+    **{f"p{side}": f"p{side}" for side in ("", *SIDES)},
+    **{f"m{side}": f"m{side}" for side in ("", *SIDES)},
+    **{f"scroll-p{side}": f"scroll-p{'-' + side if side else ''}" for side in ("", *SIDES)},
+    **{f"scroll-m{side}": f"scroll-m{'-' + side if side else ''}" for side in ("", *SIDES)},
+    "border": border_side_group(""),
+    **{f"border-{side}": border_side_group(f"-{side}") for side in SIDES},
+    "border-spacing": "border-spacing",
+    "border-opacity": "border-opacity",
+    **{
+        prefix: prefix
+        for prefix in (
+            "rounded",
+            "rounded-t",
+            "rounded-r",
+            "rounded-b",
+            "rounded-l",
+            "rounded-s",
+            "rounded-e",
+            "rounded-tl",
+            "rounded-tr",
+            "rounded-br",
+            "rounded-bl",
+            "rounded-ss",
+            "rounded-se",
+            "rounded-es",
+            "rounded-ee",
+            "w",
+            "h",
+            "size",
+            "min-w",
+            "min-h",
+            "max-w",
+            "max-h",
+            "gap",
+            "gap-x",
+            "gap-y",
+            "space-x",
+            "space-y",
+            "inset",
+            "inset-x",
+            "inset-y",
+            "top",
+            "right",
+            "bottom",
+            "left",
+            "start",
+            "end",
+            "z",
+            "order",
+            "opacity",
+            "cursor",
+            "leading",
+            "tracking",
+            "indent",
+            "duration",
+            "ease",
+            "delay",
+            "animate",
+            "transition",
+            "appearance",
+            "overflow",
+            "overflow-x",
+            "overflow-y",
+            "overscroll",
+            "overscroll-x",
+            "overscroll-y",
+            "whitespace",
+            "break",
+            "list",
+            "object",
+            "resize",
+            "pointer-events",
+            "align",
+            "items",
+            "self",
+            "content",
+            "justify",
+            "justify-items",
+            "justify-self",
+            "place-content",
+            "place-items",
+            "place-self",
+            "grid-cols",
+            "grid-rows",
+            "grid-flow",
+            "col",
+            "col-span",
+            "col-start",
+            "col-end",
+            "row",
+            "row-span",
+            "row-start",
+            "row-end",
+            "auto-cols",
+            "auto-rows",
+            "basis",
+            "grow",
+            "shrink",
+            "aspect",
+            "columns",
+            "float",
+            "clear",
+            "scale",
+            "scale-x",
+            "scale-y",
+            "rotate",
+            "translate-x",
+            "translate-y",
+            "skew-x",
+            "skew-y",
+            "origin",
+            "line-clamp",
+            "blur",
+            "brightness",
+            "bg-opacity",
+            "text-opacity",
+            "bg-clip",
+            "bg-origin",
+            "from",
+            "via",
+            "to",
+            "fill",
+            "stroke",
+            "accent",
+            "caret",
+            "decoration",
+            "underline-offset",
+            "outline-offset",
+            "mix-blend",
+            "backdrop-blur",
+            "will-change",
+            "select",
+        )
+    },
+    "text": text_group,
+    "font": font_group,
+    "bg": bg_group,
+    "flex": flex_group,
+    "shadow": sized_or_colored("shadow", SHADOW_SIZES),
+    "ring": sized_or_colored("ring", frozenset(("inset",))),
+    "ring-offset": sized_or_colored("ring-offset"),
+    "outline": outline_group,
+}
+
+
+def split_modifiers(token: str) -> tuple[str, str]:
+    """Split ``hover:md:p-3`` into ``("hover:md:", "p-3")``, ignoring ``:`` inside ``[...]``."""
+    depth = 0
+    end = 0
+    for index, char in enumerate(token):
+        if char == "[":
+            depth += 1
+        elif char == "]":
+            depth -= 1
+        elif char == ":" and depth == 0:
+            end = index + 1
+    return token[:end], token[end:]
+
+
+def utility_group(utility: str) -> str | None:
+    """Return the conflict group of a utility without modifiers, or ``None`` if unknown."""
+    group = STANDALONE.get(utility)
+    if group is not None:
+        return group
+    if utility.startswith("[") and ":" in utility:
+        # Arbitrary property: ``[mask-type:luminance]``.
+        return utility[1 : utility.index(":")]
+    parts = utility.split("-")
+    for end in range(len(parts), 0, -1):
+        rule = PREFIXES.get("-".join(parts[:end]))
+        if rule is not None:
+            return rule if isinstance(rule, str) else rule("-".join(parts[end:]))
+    return None
+
+
+@lru_cache(maxsize=MERGE_CACHE_SIZE)
+def parse_class(token: str) -> tuple[str, str | None]:
+    """
+    Return the modifiers and the conflict group of one class.
+
+    Modifiers are sorted so ``hover:focus:`` and ``focus:hover:`` match; the
+    important (``!``) flag is part of them. Negative values share their group.
+    """
+    modifiers, utility = split_modifiers(token)
+    important = ""
+    if utility.startswith("!") or utility.endswith("!"):
+        important = "!"
+        utility = utility.strip("!")
+    utility = utility.removeprefix("-")
+    key = ":".join(sorted(modifiers.split(":"))) + important
+    return key, utility_group(utility)
+
+
+@lru_cache(maxsize=MERGE_CACHE_SIZE)
+def merge_classes(*class_strings: str) -> str:
+    """Merge class strings left to right; later utilities win conflicts."""
+    tokens = " ".join(class_strings).split()
+    covered: set[tuple[str, str]] = set()
+    seen: set[str] = set()
+    merged: list[str] = []
+    for token in reversed(tokens):
+        if token in seen:
+            continue
+        modifiers, group = parse_class(token)
+        if group is not None:
+            if (modifiers, group) in covered:
+                continue
+            covered.add((modifiers, group))
+            covered.update((modifiers, longhand) for longhand in CONFLICTS.get(group, ()))
+        seen.add(token)
+        merged.append(token)
+    merged.reverse()
+    return " ".join(merged)
+
+
+def remove_classes(css_class: str, removed: str) -> str:
+    """Return ``css_class`` without the classes in ``removed``, keeping the order."""
+    removed_tokens = set(removed.split())
+    return " ".join(token for token in css_class.split() if token not in removed_tokens)
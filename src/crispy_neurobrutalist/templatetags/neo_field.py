@@ -1,11 +1,33 @@
-import re
-
-from crispy_forms.utils import TEMPLATE_PACK, get_template_pack
+from crispy_forms.helper import FormHelper
+from crispy_forms.templatetags.crispy_forms_tags import CrispyFormNode, do_uni_form
+from crispy_forms.utils import get_template_pack
 from django import forms, template
-from django.conf import settings
 from django.template import Context, loader
-
-from crispy_neurobrutalist.neurobrutalist import CSSContainer
+from django.utils.safestring import mark_safe
+
+from crispy_neurobrutalist.config import render_config
+from crispy_neurobrutalist.critical import render_critical_css
+from crispy_neurobrutalist.dispatch import get_widget_template
+from crispy_neurobrutalist.fragments import (
+    CSRF_PLACEHOLDER,
+    fill_placeholders,
+    fragment_key,
+    fragment_store,
+)
+from crispy_neurobrutalist.instrumentation import describe_field, instrumented
+from crispy_neurobrutalist.lazy_choices import is_lazy, render_lazy_attrs, render_lazy_options
+from crispy_neurobrutalist.neurobrutalist import CSSContainer, error_variant, widget_classes
+from crispy_neurobrutalist.options import render_options
+from crispy_neurobrutalist.preload import record_form_assets
+from crispy_neurobrutalist.renderers import copy_widget, render_bound_field, render_widget
+from crispy_neurobrutalist.semantic import (
+    CHECKBOX_CLASSES,
+    INPUT_CLASSES,
+    TEMPLATE_STYLES,
+    template_class,
+    widget_class,
+)
+from crispy_neurobrutalist.theme import theme_css, themed_classes
 
 register = template.Library()
 
@@ -66,6 +88,12 @@ def is_select2(field):
         return False
 
 
+@register.filter
+def is_lazy_select(field):
+    """Check if a select field has more choices than the lazy choices threshold."""
+    return is_select(field) and not is_select2(field) and is_lazy(field)
+
+
 @register.filter
 def is_dateinput(field):
     """Check if field is a DateInput widget."""
@@ -108,6 +136,15 @@ def is_textarea(field):
     return isinstance(field.field.widget, forms.Textarea)
 
 
+@register.filter
+def widget_template(field):
+    """
+    Returns the layout template registered for the field's widget, or ``None``
+    when the widget should be rendered with ``{% neo_field %}``
+    """
+    return get_widget_template(field)
+
+
 @register.filter
 def classes(field):
     """
@@ -124,20 +161,47 @@ def css_class(field):
     return field.field.widget.__class__.__name__.lower()
 
 
+def describe_neo_field(node, context):
+    field = template.Variable(node.field).resolve(context)
+    return describe_field(field, "widget", getattr(field.field.widget, "template_name", None))
+
+
+def compile_attribute(parser, token):
+    """
+    Compile an attribute name or value of ``{% neo_field %}``.
+
+    Literals without filters are returned resolved; anything else becomes a
+    ``FilterExpression`` resolved on each render.
+    """
+    expression = parser.compile_filter(token)
+    if expression.filters:
+        return expression
+    if not expression.is_var:
+        return expression.var
+    variable = expression.var
+    # Number literals; ``_("...")`` is translated per render.
+    if variable.lookups is None and not variable.translate:
+        return variable.literal
+    return expression
+
+
+def resolve_attribute(attribute, context):
+    if isinstance(attribute, template.base.FilterExpression):
+        return attribute.resolve(context)
+    return attribute
+
+
 def pairwise(iterable):
     """s -> (s0,s1), (s2,s3), (s4, s5), ..."""
     a = iter(iterable)
-    return zip(a, a)
+    return zip(a, a, strict=True)
 
 
 class CrispyNeuroBrutaListFieldNode(template.Node):
     """Template node for rendering form fields with neurobrutalist styling."""
 
     # Base input styling used for most text-based inputs
-    BASE_INPUT_CLASSES = (
-        "w-full p-3 bg-white border-2 border-black rounded-lg "
-        "focus:outline-none focus:ring-2 focus:ring-blue-400 neo-shadow-sm"
-    )
+    BASE_INPUT_CLASSES = INPUT_CLASSES
 
     # File input styling
     FILE_INPUT_CLASSES = (
@@ -165,7 +229,7 @@ class CrispyNeuroBrutaListFieldNode(template.Node):
         "date": BASE_INPUT_CLASSES,
         "datetime": BASE_INPUT_CLASSES,
         "time": BASE_INPUT_CLASSES,
-        "checkbox": "w-5 h-5 border-2 border-black rounded-md appearance-none custom-checkbox",
+        "checkbox": CHECKBOX_CLASSES,
         "file": FILE_INPUT_CLASSES,
         "clearablefile": FILE_INPUT_CLASSES,
         "splitdatetime": SPLIT_DATETIME_CLASSES,
@@ -193,85 +257,83 @@ class CrispyNeuroBrutaListFieldNode(template.Node):
     }
 
     default_container = CSSContainer(default_styles)
+    # ``default_container`` with CSS-variable colors (CRISPY_NEUROBRUTALIST_THEME_VARIABLES).
+    themed_container = CSSContainer(
+        {widget_type: themed_classes(styles) for widget_type, styles in default_styles.items()}
+    )
 
     def __init__(self, field, attrs):
         self.field = field
         self.attrs = attrs
-        self.html5_required = "html5_required"
 
+    @instrumented(describe_neo_field)
     def render(self, context):
         if self not in context.render_context:
-            context.render_context[self] = (
-                template.Variable(self.field),
-                self.attrs,
-                template.Variable(self.html5_required),
-            )
-
-        field, attrs, html5_required = context.render_context[self]
-        field = field.resolve(context)
-        try:
-            html5_required = html5_required.resolve(context)
-        except template.VariableDoesNotExist:
-            html5_required = False
+            context.render_context[self] = template.Variable(self.field)
 
-        template_pack = context.get("template_pack", TEMPLATE_PACK)
+        field = context.render_context[self].resolve(context)
+        config = render_config(context)
+        attrs = self.attrs
 
-        widgets = getattr(
-            field.field.widget,
-            "widgets",
-            [getattr(field.field.widget, "widget", field.field.widget)],
-        )
+        # Attributes go on a per-render copy: the form's widgets may be shared
+        # across renders and threads.
+        widget = copy_widget(field.field.widget)
+        widgets = getattr(widget, "widgets", [getattr(widget, "widget", widget)])
 
         if isinstance(attrs, dict):
             attrs = [attrs] * len(widgets)
 
-        converters = {}
-        converters.update(getattr(settings, "CRISPY_CLASS_CONVERTERS", {}))
-
-        restorers = []
-        for widget in widgets:
-            if isinstance(widget, forms.ClearableFileInput):
-                restorers.append((widget, widget.template_name))
-                widget.template_name = "django/forms/widgets/file.html"
+        for subwidget in widgets:
+            if isinstance(subwidget, forms.ClearableFileInput):
+                subwidget.template_name = "django/forms/widgets/file.html"
 
-        for widget, attr in zip(widgets, attrs):
-            class_name = widget.__class__.__name__.lower()
-            class_name = converters.get(class_name, class_name)
-            css_class = widget.attrs.get("class", "")
+        for subwidget, attr in zip(widgets, attrs, strict=True):
+            class_name = subwidget.__class__.__name__.lower()
+            class_name = config.class_converters.get(class_name, class_name)
+            css_class = subwidget.attrs.get("class", "")
             if css_class:
                 if css_class.find(class_name) == -1:
                     css_class += " %s" % class_name
             else:
                 css_class = class_name
 
-            if template_pack == "neobrutalist" and '"class"' not in attr.keys():
-                css_container = context.get("css_container", self.default_container)
+            if config.template_pack == "neobrutalist" and '"class"' not in attr.keys():
+                css_container = config.css_container
+                pack_styles = css_container is None
+                if pack_styles:
+                    if config.theme_variables:
+                        css_container = self.themed_container
+                    else:
+                        css_container = self.default_container
                 if css_container:
-                    css = " " + css_container.get_input_class(field)
-                    css_class += css
-                if field.errors:
-                    error_border_class = css_container.error_border
-                    css_class = re.sub(r"border-\S+", error_border_class, css_class)
-
-            widget.attrs["class"] = css_class
-
-            if html5_required and field.field.required and "required" not in widget.attrs:
+                    has_errors = bool(field.errors)
+                    css = css_container.get_input_class(field, errors=has_errors)
+                    if config.semantic_classes and pack_styles:
+                        css = widget_class(field, css, errors=has_errors)
+                    if has_errors:
+                        # The container's error variants are precomputed, the widget's own aren't.
+                        css_class = error_variant(css_class, css_container.error_border)
+                    css_class = widget_classes(css_class, css)
+
+            subwidget.attrs["class"] = css_class
+
+            if config.html5_required and field.field.required and "required" not in subwidget.attrs:
                 if field.field.widget.__class__.__name__ != "RadioSelect":
-                    widget.attrs["required"] = "required"
+                    subwidget.attrs["required"] = "required"
 
-            for attribute_name, attribute in attr.items():
-                attribute_name = template.Variable(attribute_name).resolve(context)
+            for attribute_name, attribute in attr.values():
+                attribute_name = resolve_attribute(attribute_name, context)
+                value = resolve_attribute(attribute, context)
 
-                if attribute_name in widget.attrs:
-                    widget.attrs[attribute_name] += " " + template.Variable(attribute).resolve(
-                        context
-                    )
+                if attribute_name in subwidget.attrs:
+                    subwidget.attrs[attribute_name] += " " + value
                 else:
-                    widget.attrs[attribute_name] = template.Variable(attribute).resolve(context)
+                    subwidget.attrs[attribute_name] = value
 
-        rendered_field = str(field)
-        for widget, original_template in restorers:
-            widget.template_name = original_template
+        if config.native_widgets:
+            rendered_field = render_bound_field(field, widget)
+        else:
+            rendered_field = render_widget(field, widget)
 
         return rendered_field
 
@@ -284,11 +346,148 @@ def neo_field(parser, token):
 
     token.pop(0)
     for attribute_name, value in pairwise(token):
-        attrs[attribute_name] = value
+        attrs[attribute_name] = (
+            compile_attribute(parser, attribute_name),
+            compile_attribute(parser, value),
+        )
 
     return CrispyNeuroBrutaListFieldNode(field, attrs)
 
 
+class CachedCrispyFormNode(CrispyFormNode):
+    """``{% crispy %}`` node that caches the HTML of unbound forms."""
+
+    def render(self, context):
+        try:
+            form = template.Variable(self.form).resolve(context)
+            if self.helper is not None:
+                helper = template.Variable(self.helper).resolve(context)
+            else:
+                # Same lookup as ``CrispyFormNode``: an empty helper is falsy.
+                helper = form.helper if hasattr(form, "helper") else FormHelper()
+        except template.VariableDoesNotExist:
+            return context.template.engine.string_if_invalid
+
+        record_form_assets(form)
+        template_pack = getattr(helper, "template_pack", None) or self.template_pack
+        csrf_token = context.get("csrf_token")
+        key = fragment_key(form, helper, template_pack, csrf_token)
+        if key is None:
+            return super().render(context)
+
+        store = fragment_store()
+        html = store.get(key)
+        if html is None:
+            with context.push(csrf_token=CSRF_PLACEHOLDER if csrf_token else csrf_token):
+                html = super().render(context)
+            store.set(key, html)
+        return fill_placeholders(html, csrf_token)
+
+
+class NeoClassNode(template.Node):
+    def __init__(self, name):
+        self.name = name
+
+    def render(self, context):
+        return template_class(self.name)
+
+
+@register.tag(name="neo_class")
+def neo_class(parser, token):
+    """
+    Renders the classes of one of the pack's widget styles: its Tailwind classes,
+    or its semantic class with ``CRISPY_NEUROBRUTALIST_SEMANTIC_CLASSES``::
+
+        <input type="radio" class="{% neo_class "neo-radio" %}">
+    """
+    bits = token.split_contents()
+    if len(bits) != 2 or bits[1][0] not in "\"'" or bits[1][-1] != bits[1][0]:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' takes one quoted style name")
+    name = bits[1][1:-1]
+    if name not in TEMPLATE_STYLES:
+        raise template.TemplateSyntaxError(f"'{bits[0]}': unknown style {name!r}")
+    return NeoClassNode(name)
+
+
+@register.simple_tag()
+def neo_theme_css(colors=None, selector=":root"):
+    """
+    Renders the CSS variables of a theme for ``CRISPY_NEUROBRUTALIST_THEME_VARIABLES``;
+    ``colors`` overrides entries of ``THEME_DEFAULTS``::
+
+        {% neo_theme_css tenant.colors %}
+        {% neo_theme_css dark_colors selector=".dark" %}
+    """
+    css = theme_css(colors, selector).replace("</", "<\\/")
+    return mark_safe(f"<style>{css}</style>")
+
+
+@register.tag(name="crispy_cached")
+def crispy_cached(parser, token):
+    """
+    Renders a form like ``{% crispy %}``, caching the HTML of unbound forms::
+
+        {% crispy_cached login_form %}
+        {% crispy_cached search_form search_helper %}
+
+    The CSRF token is filled in on every render; see ``crispy_neurobrutalist.fragments``.
+    """
+    node = do_uni_form(parser, token)
+    return CachedCrispyFormNode(node.form, node.helper, template_pack=node.template_pack)
+
+
+@register.simple_tag()
+def neo_options(field):
+    """
+    Renders the ``<option>`` elements of a select field from the cached options
+    fragment, marking the selected ones::
+
+        <select name="{{ field.name }}">{% neo_options field %}</select>
+    """
+    return mark_safe(render_options(field))
+
+
+@register.simple_tag()
+def neo_preload(form):
+    """
+    Records the assets of ``form`` for ``PreloadMiddleware``; renders nothing::
+
+        {% neo_preload form %}
+    """
+    record_form_assets(form)
+    return ""
+
+
+@register.simple_tag()
+def neo_critical_css(*forms, load_stylesheet=True):
+    """
+    Renders the rules of ``neurobrutalist.css`` used by the given forms or formsets
+    in a ``<style>`` element and preloads the full stylesheet::
+
+        {% neo_critical_css form %}
+        {% neo_critical_css form address_formset load_stylesheet=False %}
+    """
+    return render_critical_css(forms, load_stylesheet)
+
+
+@register.simple_tag()
+def neo_lazy_options(field):
+    """
+    Renders only the blank and selected ``<option>`` elements of a lazy select;
+    the other choices are fetched from the ``data-choices-url`` endpoint
+    """
+    return mark_safe(render_lazy_options(field))
+
+
+@register.simple_tag()
+def neo_choices_attrs(field):
+    """
+    Renders the ``data-choices-url`` and ``data-choices-page-size`` attributes
+    of a lazy select
+    """
+    return render_lazy_attrs(field)
+
+
 @register.simple_tag()
 def crispy_addon(field, append="", prepend="", form_show_labels=True):
     """
@@ -2,15 +2,33 @@ from functools import lru_cache
 
 from django import template
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.forms import boundfield
 from django.forms.formsets import BaseFormSet
 from django.template import Context
+from django.template.autoreload import get_template_directories
 from django.template.loader import get_template
+from django.utils.autoreload import file_changed
 from django.utils.safestring import mark_safe
 
 from crispy_forms.exceptions import CrispyError
 from crispy_forms.utils import TEMPLATE_PACK, flatatt
 
+from crispy_neurobrutalist.config import RENDER_CONFIG, resolve_render_config
+from crispy_neurobrutalist.critical import clear_critical_cache
+from crispy_neurobrutalist.formsets import formset_template_in_effect, render_formset
+from crispy_neurobrutalist.fragments import clear_fragment_cache
+from crispy_neurobrutalist.instrumentation import describe_field, form_has_errors, instrumented
+from crispy_neurobrutalist.plan import (
+    DEFAULT_FIELD_CLASS,
+    DEFAULT_LABEL_CLASS,
+    clear_plan_cache,
+    get_form_plan,
+    render_plans_enabled,
+)
+from crispy_neurobrutalist.preload import record_form_assets
+
 
 @lru_cache()
 def uni_formset_template(template_pack=TEMPLATE_PACK):
@@ -22,12 +40,67 @@ def uni_form_template(template_pack=TEMPLATE_PACK):
     return get_template("%s/uni_form.html" % template_pack)
 
 
+def reset_template_caches():
+    """
+    Drop cached templates, render plans, fragments and critical CSS so template
+    edits are picked up.
+    """
+    uni_formset_template.cache_clear()
+    uni_form_template.cache_clear()
+    clear_plan_cache()
+    clear_fragment_cache()
+    clear_critical_cache()
+
+
+@receiver(file_changed, dispatch_uid="crispy_neurobrutalist_template_changed")
+def template_changed(sender, file_path, **kwargs):
+    if file_path.suffix == ".py":
+        return
+    for template_dir in get_template_directories():
+        if template_dir in file_path.parents:
+            reset_template_caches()
+            return
+
+
+@receiver(setting_changed, dispatch_uid="crispy_neurobrutalist_templates_setting_changed")
+def templates_setting_changed(sender, setting, **kwargs):
+    if setting in ("TEMPLATES", "CRISPY_TEMPLATE_PACK"):
+        reset_template_caches()
+
+
 register = template.Library()
 
 
+def describe_crispy_form(form, template_pack=TEMPLATE_PACK, *args, **kwargs):
+    is_formset = isinstance(form, BaseFormSet)
+    return {
+        "kind": "formset" if is_formset else "form",
+        "form": type(form),
+        "template": "%s/%s" % (template_pack, "uni_formset.html" if is_formset else "uni_form.html"),
+        "has_errors": form_has_errors(form),
+    }
+
+
+def describe_crispy_errors(form, template_pack=TEMPLATE_PACK):
+    is_formset = isinstance(form, BaseFormSet)
+    return {
+        "kind": "errors",
+        "form": type(form),
+        "template": "%s/%s" % (template_pack, "errors_formset.html" if is_formset else "errors.html"),
+        "has_errors": form_has_errors(form),
+    }
+
+
+def describe_crispy_field(field, template_pack=TEMPLATE_PACK, *args, **kwargs):
+    helper = getattr(field.form, "helper", None)
+    template_path = getattr(helper, "field_template", None) or "%s/field.html" % template_pack
+    return describe_field(field, template=template_path)
+
+
 @register.filter(name="crispy")
+@instrumented(describe_crispy_form)
 def as_crispy_form(
-    form, template_pack=TEMPLATE_PACK, label_class="block text-gray-700 text-sm font-bold mb-2", field_class="mb-3"
+    form, template_pack=TEMPLATE_PACK, label_class=DEFAULT_LABEL_CLASS, field_class=DEFAULT_FIELD_CLASS
 ):
     """
     The original and still very useful way to generate a div elegant form/formset::
@@ -47,26 +120,33 @@ def as_crispy_form(
 
         {{ myform|label_class:"col-lg-2",field_class:"col-lg-8" }}
     """
-    c = Context(
-        {
-            "field_class": field_class,
-            "field_template": "%s/field.html" % template_pack,
-            "form_show_errors": True,
-            "form_show_labels": True,
-            "label_class": label_class,
-        }
-    ).flatten()
+    record_form_assets(form)
+    c = {
+        "field_class": field_class,
+        "field_template": "%s/field.html" % template_pack,
+        "form_show_errors": True,
+        "form_show_labels": True,
+        "label_class": label_class,
+    }
+    c[RENDER_CONFIG] = resolve_render_config(c)
     if isinstance(form, BaseFormSet):
-        template = uni_formset_template(template_pack)
         c["formset"] = form
+        if render_plans_enabled() and formset_template_in_effect(template_pack):
+            return render_formset(form, c, template_pack)
+        template = uni_formset_template(template_pack)
     else:
-        template = uni_form_template(template_pack)
         c["form"] = form
+        if render_plans_enabled():
+            plan = get_form_plan(form, template_pack, label_class, field_class)
+            if plan is not None:
+                return plan.render(form, c)
+        template = uni_form_template(template_pack)
 
     return template.render(c)
 
 
 @register.filter(name="as_crispy_errors")
+@instrumented(describe_crispy_errors)
 def as_crispy_errors(form, template_pack=TEMPLATE_PACK):
     """
     Renders only form errors the same way as django-crispy-forms::
@@ -89,6 +169,7 @@ def as_crispy_errors(form, template_pack=TEMPLATE_PACK):
 
 
 @register.filter(name="as_crispy_field")
+@instrumented(describe_crispy_field)
 def as_crispy_field(field, template_pack=TEMPLATE_PACK, label_class="", field_class=""):
     """
     Renders a form field like a django-crispy-forms field::
@@ -103,6 +184,7 @@ def as_crispy_field(field, template_pack=TEMPLATE_PACK, label_class="", field_cl
     if not isinstance(field, boundfield.BoundField) and settings.DEBUG:
         raise CrispyError("|as_crispy_field got passed an invalid or inexistent field")
 
+    record_form_assets(field.field.widget)
     attributes = {
         "field": field,
         "form_show_errors": True,
@@ -120,6 +202,7 @@ def as_crispy_field(field, template_pack=TEMPLATE_PACK, label_class="", field_cl
         template_path = "%s/field.html" % template_pack
     template = get_template(template_path)
 
+    attributes[RENDER_CONFIG] = resolve_render_config(attributes)
     c = Context(attributes).flatten()
     return template.render(c)
 
@@ -136,7 +219,7 @@ def build_attrs(field):
     ``widget.allow_multiple_selected`` attribute  and adding ``multiple`` to the
     attributes if it is set to ``True``.
     """
-    attrs = field.field.widget.attrs
+    attrs = dict(field.field.widget.attrs)
     attrs.setdefault("id", field.auto_id)
 
     field_built_widget_attrs = field.build_widget_attrs(attrs)
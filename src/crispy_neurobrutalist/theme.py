@@ -0,0 +1,127 @@
+"""
+CSS-variable theming.
+
+By default the pack bakes Tailwind colors into markup: the ``Button``/``Reset``
+colors, the ``Alert`` types, the form error box, the ``error_border`` style, the
+error text of fields and the focus rings of the widget templates. With
+``CRISPY_NEUROBRUTALIST_THEME_VARIABLES = True`` those classes render as arbitrary values reading CSS custom properties
+(``bg-blue-400`` -> ``bg-[color:var(--neo-primary)]``), so a form renders the same
+HTML under every theme and cached fragments are shared. A theme is then a small
+block of variables, rendered per tenant with ``{% neo_theme_css %}``::
+
+    {% load neo_field %}
+    {% neo_theme_css tenant.colors %}
+
+``THEME_DEFAULTS`` lists the variables (without the ``--neo-`` prefix) and the
+Tailwind colors they replace. Colors passed in projects' own ``css_class`` are
+left alone.
+"""
+
+import re
+from functools import lru_cache
+
+from crispy_neurobrutalist.config import pack_settings
+
+THEME_DEFAULTS = {
+    "primary": "#60a5fa",  # blue-400
+    "primary-hover": "#3b82f6",  # blue-500
+    "success": "#4ade80",  # green-400
+    "success-hover": "#22c55e",  # green-500
+    "warning": "#facc15",  # yellow-400
+    "warning-hover": "#eab308",  # yellow-500
+    "danger": "#f87171",  # red-400
+    "danger-hover": "#ef4444",  # red-500
+    "purple": "#c084fc",  # purple-400
+    "purple-hover": "#a855f7",  # purple-500
+    "info-bg": "#bfdbfe",  # blue-200
+    "info-border": "#2563eb",  # blue-600
+    "info-text": "#1e3a8a",  # blue-900
+    "success-bg": "#bbf7d0",  # green-200
+    "success-border": "#16a34a",  # green-600
+    "success-text": "#14532d",  # green-900
+    "warning-bg": "#fef08a",  # yellow-200
+    "warning-border": "#ca8a04",  # yellow-600
+    "warning-text": "#713f12",  # yellow-900
+    "error-bg": "#fecaca",  # red-200
+    "error-border": "#dc2626",  # red-600
+    "error-text": "#7f1d1d",  # red-900
+    "form-error-bg": "#fca5a5",  # red-300
+    "field-error-bg": "#fee2e2",  # red-100
+    "field-error-border": "#ef4444",  # red-500
+    "field-error-text": "#dc2626",  # red-600
+    "focus": "#60a5fa",  # blue-400
+    "focus-text": "#facc15",  # yellow-400
+}
+
+
+def variable(utility: str, name: str) -> str:
+    return f"{utility}-[color:var(--neo-{name})]"
+
+
+# Button/Reset colors and Alert types -> their Tailwind color.
+VARIANT_COLORS = {
+    "primary": "blue",
+    "success": "green",
+    "warning": "yellow",
+    "danger": "red",
+    "purple": "purple",
+}
+ALERT_COLORS = {"info": "blue", "success": "green", "warning": "yellow", "error": "red"}
+
+# Tailwind color class -> themed class, for the colors the pack renders by default.
+THEMED_CLASSES = {
+    **{f"bg-{color}-400": variable("bg", name) for name, color in VARIANT_COLORS.items()},
+    **{
+        f"hover:bg-{color}-500": variable("hover:bg", f"{name}-hover")
+        for name, color in VARIANT_COLORS.items()
+    },
+    **{
+        f"{part}-{color}-{shade}": variable(part, f"{alert_type}-{part}")
+        for alert_type, color in ALERT_COLORS.items()
+        for part, shade in (("bg", 200), ("border", 600), ("text", 900))
+    },
+    "bg-red-300": variable("bg", "form-error-bg"),
+    "bg-red-100": variable("bg", "field-error-bg"),
+    "border-red-500": variable("border", "field-error-border"),
+    "text-red-600": variable("text", "field-error-text"),
+    "focus:ring-blue-400": variable("focus:ring", "focus"),
+    "focus:ring-yellow-400": variable("focus:ring", "focus-text"),
+}
+
+# Values a variable may take: colors, ``var()``/``rgb()`` calls, keywords.
+SAFE_VALUE = re.compile(r"[#\w\s().,%/-]+")
+
+
+def theme_variables_enabled() -> bool:
+    return pack_settings().theme_variables
+
+
+@lru_cache(maxsize=1024)
+def themed_classes(css_class: str) -> str:
+    """Replace the Tailwind colors of ``css_class`` with their CSS-variable classes."""
+    return " ".join(THEMED_CLASSES.get(token, token) for token in css_class.split())
+
+
+def theme_classes(css_class: str) -> str:
+    """Return ``css_class`` themed when ``CRISPY_NEUROBRUTALIST_THEME_VARIABLES`` is on."""
+    if theme_variables_enabled():
+        return themed_classes(css_class)
+    return css_class
+
+
+def theme_css(colors: dict[str, str] | None = None, selector: str = ":root") -> str:
+    """
+    Return the CSS custom properties of a theme: ``THEME_DEFAULTS`` updated with ``colors``.
+
+    Raises ``ValueError`` for unknown variables and values that aren't plain colors.
+    """
+    colors = dict(colors or {})
+    unknown = set(colors) - set(THEME_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown theme variables: {', '.join(sorted(unknown))}.")
+    for name, value in colors.items():
+        if not SAFE_VALUE.fullmatch(value):
+            raise ValueError(f"Invalid value for theme variable {name!r}: {value!r}.")
+    values = {**THEME_DEFAULTS, **colors}
+    declarations = ";".join(f"--neo-{name}:{value}" for name, value in values.items())
+    return f"{selector}{{{declarations}}}"
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from crispy_neurobrutalist import views
+
+app_name = "crispy_neurobrutalist"
+
+urlpatterns = [
+    path("choices/", views.lazy_choices, name="lazy_choices"),
+]
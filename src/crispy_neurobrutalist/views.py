@@ -0,0 +1,39 @@
+from django.core import signing
+from django.core.exceptions import PermissionDenied
+from django.http import (
+    HttpResponseBadRequest,
+    HttpResponseForbidden,
+    HttpResponseNotFound,
+    JsonResponse,
+)
+from django.views.decorators.http import require_GET
+
+from crispy_neurobrutalist.lazy_choices import load_field, page_choices
+
+
+@require_GET
+def lazy_choices(request):
+    """
+    Serve the choices of a lazy select in pages.
+
+    Query parameters: ``token`` (from the select's ``data-choices-url``), ``q`` (search
+    term matched against labels) and ``page`` (1-based). Responds with
+    ``{"results": [{"id": ..., "text": ...}], "pagination": {"more": bool}}``. Forms
+    not registered with ``register_lazy_form()`` are refused with a 403.
+    """
+    try:
+        field = load_field(request.GET.get("token", ""), request)
+    except signing.BadSignature:
+        return HttpResponseBadRequest("Invalid choices token")
+    except LookupError:
+        return HttpResponseNotFound("Unknown choices field")
+    except PermissionDenied:
+        return HttpResponseForbidden("Choices not available")
+
+    try:
+        page = int(request.GET.get("page", 1))
+    except ValueError:
+        page = 1
+
+    results, more = page_choices(field, request.GET.get("q", ""), page)
+    return JsonResponse({"results": results, "pagination": {"more": more}})
@@ -0,0 +1,123 @@
+"""
+Warm-up of the pack's templates and render caches at start-up.
+
+The first renders after a process starts pay for loading and compiling every
+``neobrutalist/`` template and for filling crispy's and the pack's lazy caches.
+With ``CRISPY_NEUROBRUTALIST_WARM_UP = True`` that work is done by
+``AppConfig.ready()`` instead, so a server that loads the application before
+forking its workers (``gunicorn --preload``, uWSGI without ``lazy-apps``) hands
+them the compiled state copy-on-write.
+
+``CRISPY_NEUROBRUTALIST_WARM_UP_FORMS`` lists dotted paths of form or formset
+classes to render once, unbound, which also builds their render plans and loads
+the widget templates they use::
+
+    CRISPY_NEUROBRUTALIST_WARM_UP = True
+    CRISPY_NEUROBRUTALIST_WARM_UP_FORMS = ["accounts.forms.LoginForm"]
+
+Rendering a form with model choices queries the database, which Django advises
+against during start-up; leave those forms off the list.
+"""
+
+import logging
+import os
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.template import Context, Template
+from django.template.loader import get_template
+from django.utils.module_loading import import_string
+
+from crispy_neurobrutalist.plan import PACK_TEMPLATES_DIR
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_PACK = "neobrutalist"
+
+# The pack's ``|crispy`` (render plans), crispy's ``|crispy`` and ``{% crispy %}``.
+FILTERS = (
+    "{% load neuro_filters %}{{ form|crispy }}",
+    "{% load crispy_forms_tags %}{{ form|crispy }}",
+)
+TAG = "{% load crispy_forms_tags %}{% crispy form %}"
+
+
+def warm_up_enabled() -> bool:
+    return getattr(settings, "CRISPY_NEUROBRUTALIST_WARM_UP", False)
+
+
+def pack_template_names() -> list[str]:
+    """Return the names of every template shipped with the pack."""
+    root = os.path.join(PACK_TEMPLATES_DIR, TEMPLATE_PACK)
+    names = []
+    for directory, _dirs, files in os.walk(root):
+        for file in files:
+            if file.endswith(".html"):
+                path = os.path.relpath(os.path.join(directory, file), PACK_TEMPLATES_DIR)
+                names.append(path.replace(os.sep, "/"))
+    return sorted(names)
+
+
+def warm_up_templates() -> None:
+    """Load the pack's templates and fill the template caches of crispy and the pack."""
+    from crispy_forms.templatetags import crispy_forms_filters, crispy_forms_tags
+    from django import forms
+
+    from crispy_neurobrutalist.dispatch import widget_templates
+    from crispy_neurobrutalist.formsets import formset_template_in_effect
+    from crispy_neurobrutalist.plan import (
+        MIRRORED_TEMPLATES,
+        neo_field_template,
+        pack_templates_in_effect,
+    )
+    from crispy_neurobrutalist.templatetags import neuro_filters
+
+    for name in pack_template_names():
+        get_template(name)
+
+    crispy_forms_filters.uni_form_template(TEMPLATE_PACK)
+    crispy_forms_filters.uni_formset_template(TEMPLATE_PACK)
+    crispy_forms_tags.whole_uni_form_template(TEMPLATE_PACK)
+    neuro_filters.uni_form_template(TEMPLATE_PACK)
+    neuro_filters.uni_formset_template(TEMPLATE_PACK)
+    pack_templates_in_effect(MIRRORED_TEMPLATES)
+    formset_template_in_effect(TEMPLATE_PACK)
+    neo_field_template()
+    # Also imports the optional widget packages the registry knows about.
+    widget_templates.resolve(forms.TextInput)
+
+
+def warm_up_form(path: str) -> None:
+    """Render the form or formset class at ``path`` once, unbound."""
+    try:
+        form_class = import_string(path)
+    except ImportError as e:
+        raise ImproperlyConfigured(
+            f"CRISPY_NEUROBRUTALIST_WARM_UP_FORMS: can't import {path!r}."
+        ) from e
+    try:
+        form = form_class()
+    except TypeError:
+        logger.warning("Not warming up %s: it requires constructor arguments.", path)
+        return
+    try:
+        for source in FILTERS:
+            Template(source).render(Context({"form": form}))
+        if hasattr(form, "helper"):
+            Template(TAG).render(Context({"form": form}))
+    except Exception:
+        # A form that can't render at start-up fails again on its first request.
+        logger.exception("Warming up %s failed", path)
+
+
+def warm_up(form_paths: list[str] | None = None) -> None:
+    """
+    Load the pack's templates and render the forms at ``form_paths``.
+
+    ``form_paths`` defaults to ``CRISPY_NEUROBRUTALIST_WARM_UP_FORMS``.
+    """
+    if form_paths is None:
+        form_paths = getattr(settings, "CRISPY_NEUROBRUTALIST_WARM_UP_FORMS", ())
+    warm_up_templates()
+    for path in form_paths:
+        warm_up_form(path)
@@ -11,6 +11,7 @@ ALLOWED_HOSTS = ["*"]
 INSTALLED_APPS = [
     "django.contrib.contenttypes",
     "django.contrib.auth",
+    "django.contrib.staticfiles",
     "crispy_forms",
     "crispy_neurobrutalist",
 ]
@@ -22,6 +23,8 @@ DATABASES = {
     }
 }
 
+ROOT_URLCONF = "tests.urls"
+
 # Crispy Forms settings
 CRISPY_ALLOWED_TEMPLATE_PACKS = "neobrutalist"
 CRISPY_TEMPLATE_PACK = "neobrutalist"
@@ -42,4 +45,6 @@ TEMPLATES = [
     },
 ]
 
+STATIC_URL = "/static/"
+
 USE_TZ = True
@@ -0,0 +1,120 @@
+"""Tests for the benchmark suite."""
+
+import json
+
+from crispy_neurobrutalist.bench import (
+    BenchResult,
+    build_scenarios,
+    compare,
+    run_benchmarks,
+    stress,
+)
+from crispy_neurobrutalist.bench.__main__ import main
+from crispy_neurobrutalist.bench.runner import percentile, to_json
+
+
+def make_result(name="text/unbound", mean_ms=1.0, peak=1000, per_field=100.0):
+    return BenchResult(name, mean_ms, mean_ms, peak, int(per_field * 10), per_field)
+
+
+def test_scenarios_cover_widgets_states_formsets_and_selects():
+    """Test that every widget type has unbound, bound and errors scenarios."""
+    names = {scenario.name for scenario in build_scenarios(fields=2, rows=3, options=10)}
+
+    for widget in ("text", "select", "checkbox", "clearablefile", "splitdatetime"):
+        for state in ("unbound", "bound", "errors"):
+            assert f"{widget}/{state}" in names
+    assert "formset/3-rows" in names
+    assert "select/10-options" in names
+
+
+def test_scenario_states_render_as_named():
+    """Test that bound scenarios are valid and errors scenarios are not."""
+    scenarios = {s.name: s for s in build_scenarios(fields=2, rows=1, options=5)}
+
+    for widget in ("text", "file", "splitdatetime", "selectmultiple"):
+        assert scenarios[f"{widget}/bound"].make().is_valid(), widget
+        assert not scenarios[f"{widget}/errors"].make().is_valid(), widget
+        assert not scenarios[f"{widget}/unbound"].make().is_bound, widget
+
+
+def test_run_benchmarks_measures_selected_scenarios():
+    """Test latency, allocation and size measurements."""
+    scenarios = build_scenarios(fields=2, rows=2, options=20)
+
+    results = run_benchmarks(scenarios, repeat=2, warmup=0, only="select/")
+
+    assert [result.name for result in results] == [
+        "select/unbound",
+        "select/bound",
+        "select/errors",
+        "select/20-options",
+    ]
+    for result in results:
+        assert result.mean_ms > 0
+        assert result.p95_ms > 0
+        assert result.peak_alloc_bytes > 0
+        assert result.bytes_per_field * 2 == result.output_bytes
+
+
+def test_percentile_nearest_rank():
+    """Test the nearest-rank percentile."""
+    assert percentile(list(range(1, 101)), 95) == 95
+    assert percentile([3.0], 95) == 3.0
+
+
+def test_compare_flags_regressions_over_threshold():
+    """Test that only gated metrics growing past the threshold are reported."""
+    baseline = to_json([make_result(), make_result("hidden/unbound")], {})
+
+    regressions = compare(
+        baseline,
+        [
+            make_result(mean_ms=1.05, peak=2000),
+            make_result("hidden/unbound", per_field=130.0),
+            make_result("new/scenario", mean_ms=50.0),
+        ],
+        threshold=0.10,
+    )
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith("text/unbound: peak_alloc_bytes 1000 -> 2000")
+    assert regressions[1].startswith("hidden/unbound: bytes_per_field 100.0 -> 130.0")
+
+
+def test_cli_saves_and_compares_baseline(tmp_path, capsys):
+    """Test the ``python -m crispy_neurobrutalist.bench`` entry point."""
+    baseline = tmp_path / "baseline.json"
+    args = ["--fields", "2", "--repeat", "1", "--warmup", "0", "--only", "email/"]
+
+    assert main([*args, "--save", str(baseline)]) == 0
+    report = json.loads(baseline.read_text())
+    assert set(report["results"]) == {"email/unbound", "email/bound", "email/errors"}
+    assert "email/errors" in capsys.readouterr().out
+
+    for result in report["results"].values():
+        result["bytes_per_field"] /= 2
+    baseline.write_text(json.dumps(report))
+
+    assert main([*args, "--baseline", str(baseline)]) == 1
+    assert "regression(s)" in capsys.readouterr().out
+
+
+def test_stress_reports_throughput_per_thread_count():
+    """Test that a shared form renders consistently from several threads."""
+    scenarios = {s.name: s for s in build_scenarios(fields=2, rows=1, options=5)}
+
+    results = stress(scenarios["clearablefile/errors"], threads=(1, 3), renders=3)
+
+    assert [result.threads for result in results] == [1, 3]
+    assert [result.mismatches for result in results] == [0, 0]
+    assert results[0].speedup == 1.0
+    assert all(result.renders_per_s > 0 for result in results)
+
+
+def test_cli_threads(capsys):
+    """Test the ``--threads`` mode of the entry point."""
+    args = ["--fields", "2", "--repeat", "2", "--only", "text/unbound", "--threads", "1,2"]
+
+    assert main(args) == 0
+    assert "renders/s" in capsys.readouterr().out
@@ -0,0 +1,96 @@
+"""Tests for the per-render ``{% neo_field %}`` configuration."""
+
+from django import forms
+from django.template import Context, Template
+from django.test import override_settings
+
+from crispy_neurobrutalist.config import (
+    RENDER_CONFIG,
+    pack_settings,
+    render_config,
+    resolve_render_config,
+)
+from crispy_neurobrutalist.neurobrutalist import CSSContainer
+from crispy_neurobrutalist.templatetags import neuro_filters
+
+
+class NameForm(forms.Form):
+    name = forms.CharField()
+
+
+NEO_FIELD = Template("{% load neo_field %}{% neo_field field %}")
+
+
+def test_settings_snapshot_follows_setting_changes():
+    """Test that the settings snapshot is refreshed when the settings change."""
+    with override_settings(CRISPY_CLASS_CONVERTERS={"textinput": "text-input"}):
+        assert pack_settings().class_converters == {"textinput": "text-input"}
+        with override_settings(CRISPY_NEUROBRUTALIST_NATIVE_WIDGETS=False):
+            assert pack_settings().native_widgets is False
+        assert pack_settings().native_widgets is True
+
+    assert pack_settings().class_converters == {}
+
+
+def test_resolve_render_config_reads_context():
+    """Test that context values end up in the config and missing ones get defaults."""
+    container = CSSContainer({"text": "p-1"})
+
+    config = resolve_render_config(
+        {"template_pack": "neobrutalist", "css_container": container, "html5_required": True}
+    )
+    empty = resolve_render_config({})
+
+    assert (config.template_pack, config.css_container, config.html5_required) == (
+        "neobrutalist",
+        container,
+        True,
+    )
+    assert (empty.css_container, empty.html5_required) == (None, False)
+
+
+def test_render_config_prefers_the_form_config():
+    """Test that fields read the config placed by the form render."""
+    config = resolve_render_config({"html5_required": True})
+    context = Context({RENDER_CONFIG: config, "html5_required": False})
+
+    assert render_config(context) is config
+
+
+def test_neo_field_uses_context_values_without_config():
+    """Test that ``{% neo_field %}`` still honours the context when rendered on its own."""
+    field = NameForm()["name"]
+
+    html = NEO_FIELD.render(
+        Context(
+            {
+                "field": field,
+                "template_pack": "neobrutalist",
+                "css_container": CSSContainer({"text": "custom-text"}),
+            }
+        )
+    )
+
+    assert "custom-text" in html
+
+
+@override_settings(CRISPY_CLASS_CONVERTERS={"textinput": "text-input"})
+def test_crispy_filter_resolves_config_once(monkeypatch):
+    """Test that ``|crispy`` resolves the config once for all of its fields."""
+    calls = []
+    original = neuro_filters.resolve_render_config
+
+    def counting(context):
+        calls.append(context)
+        return original(context)
+
+    class WideForm(forms.Form):
+        first = forms.CharField()
+        second = forms.CharField()
+        third = forms.CharField()
+
+    monkeypatch.setattr(neuro_filters, "resolve_render_config", counting)
+    html = neuro_filters.as_crispy_form(WideForm())
+
+    assert len(calls) == 1
+    assert html.count("text-input") == 3
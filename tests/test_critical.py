@@ -0,0 +1,77 @@
+"""Tests for the critical CSS of form pages."""
+
+from crispy_forms.helper import FormHelper
+from crispy_forms.layout import Layout
+from django import forms
+from django.template import Context, Template
+
+from crispy_neurobrutalist.critical import critical_css, form_styles
+from crispy_neurobrutalist.layout import Card, Submit
+
+
+class SearchForm(forms.Form):
+    query = forms.CharField()
+
+
+class PreferencesForm(forms.Form):
+    newsletter = forms.BooleanField(required=False)
+    color = forms.ChoiceField(choices=[("r", "Red"), ("g", "Green")], widget=forms.RadioSelect)
+
+
+class CardForm(forms.Form):
+    name = forms.CharField()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = FormHelper()
+        self.helper.layout = Layout(Card("name"))
+        self.helper.add_input(Submit("save", "Save"))
+
+
+def test_critical_css_follows_the_widgets():
+    """Test that checkbox and radio rules are only inlined for forms that use them."""
+    search = critical_css([SearchForm()])
+    preferences = critical_css([PreferencesForm()])
+
+    assert ".neo-shadow-sm{" in search
+    assert ".custom-checkbox" not in search
+    assert ".custom-checkbox:checked::after{" in preferences
+    assert ".custom-radio:checked{" in preferences
+    assert ".neo-button" not in preferences
+    assert ".neo-card" not in preferences
+
+
+def test_critical_css_includes_helper_layout_classes():
+    """Test that classes of helper layout objects and inputs are covered."""
+    css = critical_css([CardForm()])
+
+    assert ".neo-shadow{" in css
+    assert ".neo-button:active:not(:disabled){" in css
+
+
+def test_form_styles_are_cached_per_form_class():
+    """Test that the styles of a form class are collected once."""
+    assert form_styles(SearchForm()) is form_styles(SearchForm(data={"query": "x"}))
+
+
+def test_formsets_use_their_form_class():
+    """Test that formsets contribute the classes of their forms."""
+    formset = forms.formset_factory(PreferencesForm)()
+
+    assert ".custom-radio{" in critical_css([formset])
+
+
+def test_tag_renders_style_and_stylesheet_preload():
+    """Test the ``{% neo_critical_css %}`` output."""
+    template = Template("{% load neo_field %}{% neo_critical_css form %}")
+    html = template.render(Context({"form": PreferencesForm()}))
+
+    assert html.startswith("<style>.custom-checkbox{")
+    assert 'content:"✓"' in html
+    assert '<link rel="preload" href="/static/crispy_neurobrutalist/css/neurobrutalist.css"' in html
+    assert "<noscript>" in html
+
+    inline_only = Template(
+        "{% load neo_field %}{% neo_critical_css form other load_stylesheet=False %}"
+    ).render(Context({"form": PreferencesForm(), "other": SearchForm()}))
+    assert inline_only.endswith("</style>")
@@ -0,0 +1,124 @@
+"""Tests for the widget template dispatch registry."""
+
+from django import forms
+from django.template import Context, Template
+
+from crispy_neurobrutalist.dispatch import (
+    WidgetTemplateRegistry,
+    get_widget_template,
+    widget_templates,
+)
+
+
+class TestWidgetTemplateRegistry:
+    """Test suite for WidgetTemplateRegistry."""
+
+    def test_resolves_registered_class(self):
+        """Test that a registered widget class resolves to its template."""
+        registry = WidgetTemplateRegistry({forms.Textarea: "textarea.html"})
+
+        assert registry.resolve(forms.Textarea) == "textarea.html"
+
+    def test_unregistered_class_resolves_to_none(self):
+        """Test that widgets without an entry fall back to neo_field (None)."""
+        registry = WidgetTemplateRegistry({forms.Textarea: "textarea.html"})
+
+        assert registry.resolve(forms.TextInput) is None
+
+    def test_resolution_follows_mro(self):
+        """Test that subclasses use the closest registered base class."""
+        registry = WidgetTemplateRegistry(
+            {forms.FileInput: "file.html", forms.ClearableFileInput: "clearable.html"}
+        )
+
+        class CustomClearable(forms.ClearableFileInput):
+            pass
+
+        assert registry.resolve(forms.FileInput) == "file.html"
+        assert registry.resolve(forms.ClearableFileInput) == "clearable.html"
+        assert registry.resolve(CustomClearable) == "clearable.html"
+
+    def test_none_entry_stops_mro_walk(self):
+        """Test that a None entry shadows templates registered for base classes."""
+
+        class FancySelect(forms.Select):
+            pass
+
+        registry = WidgetTemplateRegistry({forms.Select: "select.html", FancySelect: None})
+
+        assert registry.resolve(FancySelect) is None
+
+    def test_register_invalidates_cache(self):
+        """Test that registering a new entry clears previously resolved templates."""
+
+        class ColorInput(forms.TextInput):
+            pass
+
+        registry = WidgetTemplateRegistry()
+        assert registry.resolve(ColorInput) is None
+
+        registry.register(ColorInput, "color.html")
+        assert registry.resolve(ColorInput) == "color.html"
+
+        registry.unregister(ColorInput)
+        assert registry.resolve(ColorInput) is None
+
+
+class TestDefaultWidgetTemplates:
+    """Test suite for the pack's default widget dispatch table."""
+
+    def test_default_entries_match_field_template_order(self):
+        """Test that built-in widgets resolve like the former is_* filter chain."""
+        expected = {
+            forms.CheckboxInput: "neobrutalist/layout/checkbox.html",
+            forms.ClearableFileInput: "neobrutalist/layout/clearablefileinput.html",
+            forms.FileInput: "neobrutalist/layout/fileinput.html",
+            forms.CheckboxSelectMultiple: "neobrutalist/layout/checkboxselectmultiple.html",
+            forms.RadioSelect: "neobrutalist/layout/radioselect.html",
+            forms.SelectMultiple: "neobrutalist/layout/multiselect.html",
+            forms.NullBooleanSelect: "neobrutalist/layout/select.html",
+            forms.Select: "neobrutalist/layout/select.html",
+            forms.Textarea: "neobrutalist/layout/textarea.html",
+            forms.DateInput: "neobrutalist/layout/dateinput.html",
+            forms.DateTimeInput: "neobrutalist/layout/datetimeinput.html",
+            forms.TimeInput: "neobrutalist/layout/timeinput.html",
+            forms.NumberInput: "neobrutalist/layout/numberinput.html",
+            forms.EmailInput: "neobrutalist/layout/emailinput.html",
+            forms.URLInput: "neobrutalist/layout/urlinput.html",
+            forms.PasswordInput: "neobrutalist/layout/passwordinput.html",
+        }
+
+        for widget_class, template_name in expected.items():
+            assert widget_templates.resolve(widget_class) == template_name
+
+    def test_generic_widgets_use_neo_field(self):
+        """Test that text and multi widgets are rendered through neo_field."""
+        assert widget_templates.resolve(forms.TextInput) is None
+        assert widget_templates.resolve(forms.SplitDateTimeWidget) is None
+
+    def test_get_widget_template_for_bound_field(self):
+        """Test get_widget_template resolves from a bound field."""
+
+        class TestForm(forms.Form):
+            bio = forms.CharField(widget=forms.Textarea)
+
+        assert get_widget_template(TestForm()["bio"]) == "neobrutalist/layout/textarea.html"
+
+    def test_registered_widget_template_used_by_field_template(self):
+        """Test that third-party registrations are picked up by field.html."""
+
+        class ColorInput(forms.TextInput):
+            pass
+
+        class TestForm(forms.Form):
+            color = forms.CharField(widget=ColorInput)
+
+        widget_templates.register(ColorInput, "neobrutalist/layout/textinput.html")
+        try:
+            template = Template("{% load crispy_forms_tags %}{{ form.color|as_crispy_field }}")
+            html = template.render(Context({"form": TestForm()}))
+        finally:
+            widget_templates.unregister(ColorInput)
+
+        assert 'type="text" name="color"' in html
+        assert "caret-black" in html
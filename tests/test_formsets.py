@@ -0,0 +1,154 @@
+"""Tests for formset rendering."""
+
+import pytest
+from django import forms
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.forms import formset_factory
+from django.template import Context, Template
+from django.test import override_settings
+
+from crispy_neurobrutalist import iter_crispy_form
+from crispy_neurobrutalist.plan import clear_plan_cache, plan_cache_info
+from crispy_neurobrutalist.templatetags.neuro_filters import as_crispy_form
+
+
+class RowForm(forms.Form):
+    """Row form with a couple of widget types."""
+
+    title = forms.CharField(help_text="Row title")
+    amount = forms.IntegerField(required=False)
+    kind = forms.ChoiceField(choices=[("a", "Alpha"), ("b", "Beta")])
+    notes = forms.CharField(widget=forms.Textarea, required=False)
+
+
+class BaseCheckedFormSet(forms.BaseFormSet):
+    def clean(self):
+        if any(self.errors):
+            raise ValidationError("Fix the rows first")
+
+
+RowFormSet = formset_factory(RowForm, formset=BaseCheckedFormSet, extra=2)
+DeletableFormSet = formset_factory(RowForm, extra=1, can_delete=True, can_delete_extra=False)
+
+
+class OwnerForm(forms.Form):
+    """Row form choosing a user."""
+
+    owner = forms.ModelChoiceField(queryset=User.objects.order_by("username"))
+
+
+OwnerFormSet = formset_factory(OwnerForm, extra=5)
+
+
+def render_template_path(formset):
+    with override_settings(CRISPY_NEUROBRUTALIST_RENDER_PLANS=False):
+        return as_crispy_form(formset)
+
+
+FORMSET_FACTORIES = [
+    pytest.param(lambda: RowFormSet(), id="unbound"),
+    pytest.param(
+        lambda: RowFormSet(
+            data={
+                "form-TOTAL_FORMS": "2",
+                "form-INITIAL_FORMS": "0",
+                "form-0-title": "First",
+                "form-0-kind": "b",
+                "form-1-amount": "lots",
+            }
+        ),
+        id="errors",
+    ),
+    pytest.param(
+        lambda: DeletableFormSet(initial=[{"title": "Kept", "kind": "a"}], prefix="rows"),
+        id="mixed-rows",
+    ),
+]
+
+
+@pytest.mark.parametrize("make_formset", FORMSET_FACTORIES)
+def test_engine_output_matches_template_output(make_formset):
+    """Test that the row-batched engine renders exactly like uni_formset.html."""
+    assert as_crispy_form(make_formset()) == render_template_path(make_formset())
+
+
+@pytest.mark.parametrize("make_formset", FORMSET_FACTORIES)
+def test_streaming_matches_template_output(make_formset):
+    """Test that streamed formsets join to the uni_formset.html output."""
+    assert "".join(iter_crispy_form(make_formset())) == render_template_path(make_formset())
+
+
+def test_crispy_forms_tags_filter_renders_formsets():
+    """Test that crispy's own ``|crispy`` filter finds the formset template."""
+    html = Template("{% load crispy_forms_tags %}{{ formset|crispy }}").render(
+        Context({"formset": RowFormSet()})
+    )
+
+    assert 'name="form-TOTAL_FORMS"' in html
+    assert html.count('<div class="multiField">') == 2
+    assert 'id="div_id_form-1-title"' in html
+
+
+def test_formset_errors_rendered_once():
+    """Test that formset-level errors appear before the rows."""
+    formset = RowFormSet(
+        data={"form-TOTAL_FORMS": "1", "form-INITIAL_FORMS": "0", "form-0-amount": "x"}
+    )
+
+    html = as_crispy_form(formset)
+
+    assert html.count("Fix the rows first") == 1
+    assert html.index("Fix the rows first") < html.index('<div class="multiField">')
+
+
+def test_row_plan_compiled_once():
+    """Test that all rows of a formset share one compiled plan."""
+    clear_plan_cache()
+
+    as_crispy_form(formset_factory(RowForm, extra=25)())
+
+    # One plan for the management form, one for the rows.
+    assert plan_cache_info().misses == 2
+
+
+def test_rows_with_extra_fields_get_their_own_plan():
+    """Test that rows whose fields differ from empty_form still render their fields."""
+    formset = DeletableFormSet(initial=[{"title": "Kept"}])
+
+    html = as_crispy_form(formset)
+
+    assert 'name="form-0-DELETE"' in html
+    assert 'name="form-1-DELETE"' not in html
+
+
+@pytest.mark.django_db
+def test_model_choices_fetched_once_per_formset(django_assert_num_queries):
+    """Test that rows share the choices of an identical queryset."""
+    for name in ("ann", "bob", "cid"):
+        User.objects.create(username=name)
+    formset = OwnerFormSet(initial=[{"owner": User.objects.get(username="bob").pk}])
+
+    with django_assert_num_queries(1):
+        html = as_crispy_form(formset)
+
+    assert html.count(">cid</option>") == 6
+    assert html.count("selected>bob</option>") == 1
+
+
+def test_overridden_formset_template_is_used(tmp_path):
+    """Test that a project uni_formset.html is rendered instead of the engine."""
+    override = tmp_path / "neobrutalist" / "uni_formset.html"
+    override.parent.mkdir()
+    override.write_text("<p>{{ formset.total_form_count }} rows</p>")
+    templates = [
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "DIRS": [str(tmp_path)],
+            "APP_DIRS": True,
+        }
+    ]
+
+    with override_settings(TEMPLATES=templates):
+        assert as_crispy_form(RowFormSet()) == "<p>2 rows</p>"
+        assert "".join(iter_crispy_form(RowFormSet())) == "<p>2 rows</p>"
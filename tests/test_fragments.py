@@ -0,0 +1,156 @@
+"""Tests for the unbound form fragment cache."""
+
+import pytest
+from crispy_forms.helper import FormHelper
+from crispy_forms.layout import HTML, Layout, Submit
+from django import forms
+from django.template import Context, Template
+from django.test import override_settings
+from django.utils import translation
+
+from crispy_neurobrutalist.fragments import (
+    CSRF_PLACEHOLDER,
+    clear_fragment_cache,
+    fragment_key,
+    fragment_store,
+)
+
+
+class LoginForm(forms.Form):
+    """Small unbound form rendered on every request."""
+
+    username = forms.CharField()
+    password = forms.CharField(widget=forms.PasswordInput)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = FormHelper()
+        self.helper.add_input(Submit("login", "Log in"))
+
+
+CACHED = Template("{% load neo_field %}{% crispy_cached form %}")
+UNCACHED = Template("{% load crispy_forms_tags %}{% crispy form %}")
+
+
+def render(template, form, **context):
+    return template.render(Context({"form": form, **context}))
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_fragment_cache()
+    yield
+    clear_fragment_cache()
+
+
+def test_output_matches_crispy_tag():
+    """Test that misses and hits render exactly like ``{% crispy %}``."""
+    expected = render(UNCACHED, LoginForm(), csrf_token="tok1")
+
+    assert render(CACHED, LoginForm(), csrf_token="tok1") == expected
+    assert render(CACHED, LoginForm(), csrf_token="tok1") == expected
+
+
+def test_csrf_token_filled_on_hit():
+    """Test that each hit gets the current request's CSRF token."""
+    first = render(CACHED, LoginForm(), csrf_token="first-token")
+    second = render(CACHED, LoginForm(), csrf_token="second-token")
+
+    assert 'value="first-token"' in first
+    assert 'value="second-token"' in second
+    assert "first-token" not in second
+    assert CSRF_PLACEHOLDER not in second
+    assert fragment_store().cache.info().hits == 1
+
+
+def test_missing_csrf_token_is_a_separate_entry():
+    """Test that renders without a token don't reuse the tokenized HTML."""
+    render(CACHED, LoginForm(), csrf_token="tok")
+
+    html = render(CACHED, LoginForm())
+
+    assert "csrfmiddlewaretoken" not in html
+    assert CSRF_PLACEHOLDER not in html
+
+
+def test_initial_values_are_part_of_the_key():
+    """Test that forms with different initial values get their own fragments."""
+    ann = render(CACHED, LoginForm(initial={"username": "ann"}))
+    bob = render(CACHED, LoginForm(initial={"username": "bob"}))
+
+    assert 'value="ann"' in ann
+    assert 'value="bob"' in bob
+    assert fragment_store().cache.info().currsize == 2
+
+
+def test_language_is_part_of_the_key():
+    """Test that fragments are cached per active language."""
+    with translation.override("en"):
+        en = fragment_key(LoginForm(), FormHelper(), "neobrutalist", None)
+    with translation.override("pt-br"):
+        pt = fragment_key(LoginForm(), FormHelper(), "neobrutalist", None)
+
+    assert en != pt
+
+
+def test_changed_fields_change_the_key():
+    """Test that per-instance field changes (labels, choices) aren't served stale."""
+    form = LoginForm()
+    form.fields["username"].label = "E-mail"
+
+    assert fragment_key(form, form.helper, "neobrutalist", None) != fragment_key(
+        LoginForm(), LoginForm().helper, "neobrutalist", None
+    )
+
+
+def test_bound_forms_are_not_cached():
+    """Test that bound forms always render fresh."""
+    render(CACHED, LoginForm(data={"username": "ann"}))
+
+    assert fragment_store().cache.info().currsize == 0
+
+
+def test_html_layouts_are_not_cached():
+    """Test that layouts able to render arbitrary context bypass the cache."""
+    form = LoginForm()
+    form.helper.layout = Layout("username", HTML("Hi {{ name }}"), "password")
+
+    html = render(CACHED, form, name="Ann")
+
+    assert "Hi Ann" in html
+    assert fragment_store().cache.info().currsize == 0
+
+
+@override_settings(CRISPY_NEUROBRUTALIST_FRAGMENT_CACHE_TIMEOUT=0)
+def test_ttl_expiry():
+    """Test that expired fragments are rendered again."""
+    render(CACHED, LoginForm())
+    render(CACHED, LoginForm())
+
+    info = fragment_store().cache.info()
+    assert info.hits == 0
+    assert info.misses == 2
+
+
+@override_settings(
+    CACHES={"fragments": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    CRISPY_NEUROBRUTALIST_FRAGMENT_CACHE="fragments",
+)
+def test_django_cache_backend():
+    """Test that fragments can be stored in a configured Django cache."""
+    from django.core.cache import caches
+
+    first = render(CACHED, LoginForm(), csrf_token="a")
+    key = fragment_key(LoginForm(), LoginForm().helper, "neobrutalist", "a")
+
+    assert CSRF_PLACEHOLDER in caches["fragments"].get(key)
+    assert render(CACHED, LoginForm(), csrf_token="b") == first.replace('value="a"', 'value="b"')
+
+
+def test_template_reload_drops_fragments():
+    """Test that template edits invalidate cached fragments."""
+    key = fragment_key(LoginForm(), LoginForm().helper, "neobrutalist", None)
+
+    clear_fragment_cache()
+
+    assert fragment_key(LoginForm(), LoginForm().helper, "neobrutalist", None) != key
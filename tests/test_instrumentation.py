@@ -0,0 +1,139 @@
+"""Tests for render instrumentation hooks."""
+
+import pytest
+from django import forms
+from django.forms import formset_factory
+from django.template import Context, Template
+
+from crispy_neurobrutalist.instrumentation import (
+    add_render_callback,
+    capture_render_spans,
+    instrumented,
+    remove_render_callback,
+    render_callbacks,
+)
+from crispy_neurobrutalist.templatetags.neuro_filters import (
+    as_crispy_errors,
+    as_crispy_field,
+    as_crispy_form,
+)
+
+
+class TracedForm(forms.Form):
+    """Form with a templated widget and a neo_field widget."""
+
+    name = forms.CharField()
+    color = forms.ChoiceField(choices=[("r", "Red")])
+    when = forms.SplitDateTimeField(required=False)
+
+
+@pytest.fixture(autouse=True)
+def no_leftover_callbacks():
+    yield
+    assert render_callbacks == []
+
+
+def test_form_and_field_spans():
+    """Test that rendering a form emits one span per field and one for the form."""
+    with capture_render_spans() as spans:
+        html = as_crispy_form(TracedForm())
+
+    kinds = [span.kind for span in spans]
+    assert kinds.count("field") == 3
+    assert kinds[-1] == "form"
+
+    form_span = spans[-1]
+    assert form_span.form is TracedForm
+    assert form_span.template == "neobrutalist/uni_form.html"
+    assert form_span.output_bytes == len(html.encode())
+    assert form_span.duration >= sum(s.duration for s in spans if s.kind == "field")
+    assert not form_span.has_errors
+
+    fields = {span.field_name: span for span in spans if span.kind == "field"}
+    assert fields["color"].widget is forms.Select
+    assert fields["color"].template == "neobrutalist/field.html"
+
+
+def test_neo_field_widget_spans():
+    """Test that widgets rendered with ``{% neo_field %}`` get their own span."""
+    with capture_render_spans() as spans:
+        as_crispy_form(TracedForm())
+
+    widgets = {span.field_name: span for span in spans if span.kind == "widget"}
+    # ``color`` is rendered by select.html, not ``{% neo_field %}``.
+    assert set(widgets) == {"name", "when"}
+    assert widgets["when"].widget is forms.SplitDateTimeWidget
+    assert widgets["when"].template == "django/forms/widgets/splitdatetime.html"
+
+
+def test_error_state_reported():
+    """Test that spans carry the error state of forms and fields."""
+    with capture_render_spans() as spans:
+        as_crispy_form(TracedForm(data={"color": "r"}))
+
+    fields = {span.field_name: span for span in spans if span.kind == "field"}
+    assert fields["name"].has_errors
+    assert not fields["color"].has_errors
+    assert spans[-1].has_errors
+
+
+def test_formset_errors_and_field_filters():
+    """Test spans of formsets, ``|as_crispy_errors`` and ``|as_crispy_field``."""
+    formset = formset_factory(TracedForm, extra=2)()
+
+    with capture_render_spans() as spans:
+        as_crispy_form(formset)
+        as_crispy_errors(TracedForm())
+        as_crispy_field(TracedForm()["name"])
+
+    formset_span = next(span for span in spans if span.kind == "formset")
+    assert formset_span.template == "neobrutalist/uni_formset.html"
+    errors_span = next(span for span in spans if span.kind == "errors")
+    assert errors_span.template == "neobrutalist/errors.html"
+    assert errors_span.form is TracedForm
+    assert spans[-1].kind == "field"
+    assert spans[-1].field_name == "name"
+
+
+def test_template_path_emits_spans():
+    """Test that ``{% neo_field %}`` is instrumented when used in templates."""
+    template = Template("{% load neo_field %}{% neo_field form.name %}")
+
+    with capture_render_spans() as spans:
+        template.render(Context({"form": TracedForm()}))
+
+    assert [(s.kind, s.field_name) for s in spans] == [("widget", "name")]
+
+
+def test_failing_callback_does_not_break_rendering(caplog):
+    """Test that callback errors are logged instead of raised."""
+
+    def broken(span):
+        raise RuntimeError("tracer down")
+
+    add_render_callback(broken)
+    try:
+        html = as_crispy_form(TracedForm())
+    finally:
+        remove_render_callback(broken)
+
+    assert 'id="div_id_name"' in html
+    assert "tracer down" in caplog.text
+
+
+def test_no_callbacks_skips_describe():
+    """Test that the describe hook is not called without callbacks."""
+    calls = []
+
+    @instrumented(lambda *args: calls.append(args) or {"kind": "form"})
+    def render():
+        return "<p></p>"
+
+    assert render() == "<p></p>"
+    assert calls == []
+
+    with capture_render_spans() as spans:
+        render()
+
+    assert len(calls) == 1
+    assert spans[0].output_bytes == 7
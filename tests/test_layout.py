@@ -397,3 +397,26 @@ class TestLayoutIntegration:
         )
         
         assert len(layout.fields) == 4
+
+
+class TestClassMerging:
+    """Test suite for the merged ``css_class`` of layout components."""
+
+    def test_button_css_class_resolves_conflicts(self):
+        """Test that conflicting utilities in ``css_class`` keep the last one."""
+        button = Button("go", "Go", css_class="px-4 py-2 bg-white p-6 bg-black")
+
+        assert button.field_classes == "p-6 bg-black"
+
+    def test_div_components_merge_css_class(self):
+        """Test that Card, Alert and FormActions merge their css_class."""
+        assert Card(css_class="p-2 p-4").css_class == "p-4"
+        assert FormActions(css_class="gap-2 gap-4 flex").css_class == "gap-4 flex"
+        assert Alert(HTML("x"), css_class="bg-white bg-red-100").css_class == "bg-red-100"
+
+    def test_dismissible_alert_keeps_padding_override(self):
+        """Test that ``pr-12`` of dismissible alerts survives the ``p-4`` before it."""
+        alert = Alert(HTML("x"), dismissible=True)
+
+        assert "p-4" in alert.css_class.split()
+        assert "pr-12" in alert.css_class.split()
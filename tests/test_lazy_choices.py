@@ -0,0 +1,211 @@
+"""Tests for paged, lazily-loaded select choices."""
+
+import json
+import uuid
+
+import pytest
+from django import forms
+from django.contrib.auth.models import AnonymousUser, User
+from django.core import signing
+from django.db import models
+from django.template import Context, Template
+from django.test import RequestFactory
+
+from crispy_neurobrutalist.lazy_choices import (
+    TOKEN_SALT,
+    is_lazy,
+    load_field,
+    make_token,
+    page_choices,
+    register_lazy_form,
+    stub_choices,
+)
+from crispy_neurobrutalist.views import lazy_choices
+
+COUNTRIES = [("", "---")] + [(f"c{i}", f"Country {i}") for i in range(200)]
+
+
+class LazyForm(forms.Form):
+    """Form with selects above and below the lazy threshold."""
+
+    country = forms.ChoiceField(choices=COUNTRIES, required=False)
+    visited = forms.MultipleChoiceField(choices=COUNTRIES[1:], required=False)
+    size = forms.ChoiceField(choices=[("s", "Small"), ("l", "Large")])
+
+
+class UserForm(forms.Form):
+    """Form selecting a user from a queryset."""
+
+    owner = forms.ModelChoiceField(queryset=User.objects.order_by("pk"), required=False)
+
+
+class OwnUserForm(UserForm):
+    """Form narrowing the users to the requesting user in ``__init__``."""
+
+    def __init__(self, *args, user, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["owner"].queryset = User.objects.filter(pk=user.pk)
+
+
+class UnregisteredForm(forms.Form):
+    """Form never registered for lazy choices."""
+
+    country = forms.ChoiceField(choices=COUNTRIES)
+
+
+class Ticket(models.Model):
+    """Model with a UUID primary key (never queried)."""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+
+    class Meta:
+        app_label = "tests"
+        managed = False
+
+
+register_lazy_form(LazyForm, lambda _request: LazyForm())
+register_lazy_form(UserForm, lambda _request: UserForm())
+register_lazy_form(OwnUserForm, lambda request: OwnUserForm(user=request.user))
+
+
+def render(form):
+    return Template("{% load crispy_forms_tags %}{{ form|crispy }}").render(Context({"form": form}))
+
+
+def results(response):
+    assert response.status_code == 200
+    return json.loads(response.content)["results"]
+
+
+@pytest.fixture
+def lazy(settings):
+    settings.CRISPY_NEUROBRUTALIST_LAZY_CHOICES_THRESHOLD = 100
+    settings.CRISPY_NEUROBRUTALIST_LAZY_CHOICES_PAGE_SIZE = 20
+
+
+def test_disabled_by_default():
+    """Test that selects inline all options without the threshold setting."""
+    html = render(LazyForm())
+
+    assert "data-choices-url" not in html
+    assert html.count("Country 199") == 2
+
+
+def test_stub_keeps_blank_and_selected_options(lazy):
+    """Test that a lazy select only inlines the blank and selected options."""
+    html = render(LazyForm(initial={"country": "c150", "visited": ["c3", "c7"]}))
+
+    assert html.count("data-choices-url=") == 2
+    assert 'data-choices-page-size="20"' in html
+    assert 'value=""' in html
+    assert "selected>Country 150</option>" in html
+    assert "selected>Country 3</option>" in html
+    assert "selected>Country 7</option>" in html
+    assert "Country 42" not in html
+    # Small selects are still rendered in full.
+    assert "Large</option>" in html
+
+
+def test_locally_defined_forms_are_not_lazy(lazy):
+    """Test that forms the view can't import keep their full option list."""
+
+    class LocalForm(forms.Form):
+        country = forms.ChoiceField(choices=COUNTRIES)
+
+    assert not is_lazy(LocalForm()["country"])
+
+
+def test_unregistered_forms_are_not_lazy(lazy, client):
+    """Test that unregistered forms keep their options and the endpoint refuses them."""
+    assert not is_lazy(UnregisteredForm()["country"])
+
+    token = signing.dumps(["tests.test_lazy_choices.UnregisteredForm", "country"], salt=TOKEN_SALT)
+    assert client.get("/neo/choices/", {"token": token}).status_code == 403
+
+
+def test_token_round_trip():
+    """Test that the signed token resolves back to the form field."""
+    field = load_field(make_token(LazyForm()["visited"]), RequestFactory().get("/"))
+
+    assert field.choices[0] == ("c0", "Country 0")
+
+
+def test_page_choices_search_and_pagination():
+    """Test searching labels and paging through the matches."""
+    field = LazyForm.base_fields["country"]
+
+    results, more = page_choices(field, "country 1", page=1, page_size=5)
+    assert [r["id"] for r in results] == ["c1", "c10", "c11", "c12", "c13"]
+    assert more
+
+    results, more = page_choices(field, "COUNTRY 19", page=3, page_size=5)
+    assert [r["id"] for r in results] == ["c199"]
+    assert not more
+
+
+def test_view_serves_json_pages(lazy, client):
+    """Test the choices endpoint response format."""
+    token = make_token(LazyForm()["country"])
+
+    response = client.get("/neo/choices/", {"token": token, "q": "Country 19", "page": 1})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["results"][0] == {"id": "c19", "text": "Country 19"}
+    assert len(data["results"]) == 11
+    assert data["pagination"] == {"more": False}
+
+
+def test_view_rejects_tampered_tokens(client):
+    """Test that only signed tokens are accepted."""
+    response = client.get("/neo/choices/", {"token": "tests.test_lazy_choices.LazyForm"})
+
+    assert response.status_code == 400
+
+
+def test_view_unknown_field(client):
+    """Test that a token for a removed field returns 404."""
+    token = signing.dumps(["tests.test_lazy_choices.LazyForm", "gone"], salt=TOKEN_SALT)
+
+    assert client.get("/neo/choices/", {"token": token}).status_code == 404
+
+
+@pytest.mark.django_db
+def test_model_choices_fetch_selected_rows_only(lazy, settings, django_assert_max_num_queries):
+    """Test that a lazy model select queries the selected rows, not the whole table."""
+    settings.CRISPY_NEUROBRUTALIST_LAZY_CHOICES_THRESHOLD = 3
+    users = [User.objects.create(username=f"user{i}") for i in range(6)]
+    form = UserForm(initial={"owner": users[4].pk})
+
+    with django_assert_max_num_queries(3):
+        html = render(form)
+
+    assert "data-choices-url=" in html
+    assert "selected>user4</option>" in html
+    assert "user2" not in html
+    assert '<option value=""' in html
+
+
+@pytest.mark.django_db
+def test_view_serves_the_choices_of_the_requests_form(lazy):
+    """Test that querysets narrowed in ``__init__`` apply to the served choices."""
+    alice, bob = (User.objects.create(username=name) for name in ("alice", "bob"))
+    token = make_token(OwnUserForm(user=alice)["owner"])
+
+    request = RequestFactory().get("/neo/choices/", {"token": token})
+    request.user = bob
+    assert [r["text"] for r in results(lazy_choices(request))] == ["---------", "bob"]
+
+    request.user = AnonymousUser()
+    assert [r["text"] for r in results(lazy_choices(request))] == ["---------"]
+
+
+def test_invalid_uuid_values_are_ignored():
+    """Test that an invalid submitted UUID doesn't break rendering the stub."""
+
+    class TicketForm(forms.Form):
+        ticket = forms.ModelChoiceField(queryset=Ticket.objects.all())
+
+    form = TicketForm(data={"ticket": "not-a-uuid"})
+
+    assert stub_choices(form["ticket"], ["not-a-uuid"]) == [("", "---------")]
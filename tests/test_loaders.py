@@ -0,0 +1,186 @@
+"""Tests for the compiling template loader."""
+
+import pytest
+from crispy_forms.helper import FormHelper
+from crispy_forms.layout import Div, Layout, Submit
+from crispy_forms.templatetags import crispy_forms_filters, crispy_forms_tags
+from django import forms
+from django.forms import formset_factory
+from django.template import Context, Engine, Template
+from django.template.loader import get_template
+from django.template.loader_tags import IncludeNode
+
+from crispy_neurobrutalist.bench.scenarios import build_scenarios
+from crispy_neurobrutalist.loaders import InlinedIncludeNode
+
+LOADER_TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "OPTIONS": {
+            "loaders": [
+                (
+                    "crispy_neurobrutalist.loaders.Loader",
+                    [
+                        (
+                            "django.template.loaders.cached.Loader",
+                            ["django.template.loaders.app_directories.Loader"],
+                        )
+                    ],
+                )
+            ],
+        },
+    }
+]
+
+FILTER = "{% load crispy_forms_tags %}{{ form|crispy }}"
+TAG = "{% load crispy_forms_tags %}{% crispy form %}"
+FIELD = "{% load crispy_forms_tags %}{{ form.name|as_crispy_field }}"
+
+
+class LayoutForm(forms.Form):
+    """Form rendered through the ``{% crispy %}`` tag with a layout and inputs."""
+
+    name = forms.CharField(help_text="<b>Full</b> name")
+    bio = forms.CharField(widget=forms.Textarea, initial="Hello\n   <world>")
+    color = forms.ChoiceField(choices=[("Warm", [("r", "Red")]), ("b", "Blue")])
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = FormHelper()
+        self.helper.layout = Layout(Div("name", "bio", css_class="grid"), "color")
+        self.helper.add_input(Submit("save", "Save"))
+
+
+def clear_crispy_caches():
+    # crispy keeps the compiled pack templates of the previous engine.
+    crispy_forms_filters.uni_form_template.cache_clear()
+    crispy_forms_filters.uni_formset_template.cache_clear()
+    crispy_forms_tags.whole_uni_form_template.cache_clear()
+    crispy_forms_tags.whole_uni_formset_template.cache_clear()
+
+
+def render(source, form):
+    clear_crispy_caches()
+    return Template(source).render(Context({"form": form}))
+
+
+def render_both(settings, source, make_form):
+    expected = render(source, make_form())
+    settings.TEMPLATES = LOADER_TEMPLATES
+    return render(source, make_form()), expected
+
+
+@pytest.fixture(autouse=True)
+def fresh_crispy_caches():
+    yield
+    clear_crispy_caches()
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    build_scenarios(fields=3, rows=3, options=30),
+    ids=lambda scenario: scenario.name,
+)
+def test_filter_output_unchanged(settings, scenario):
+    """Test that ``|crispy`` renders identical HTML for every widget type."""
+    actual, expected = render_both(settings, FILTER, scenario.make)
+
+    assert actual == expected
+
+
+@pytest.mark.parametrize("data", [None, {"name": "", "bio": "x", "color": "g"}])
+def test_crispy_tag_output_unchanged(settings, data):
+    """Test that ``{% crispy %}`` with a layout, inputs and errors renders identical HTML."""
+    actual, expected = render_both(settings, TAG, lambda: LayoutForm(data))
+
+    assert actual == expected
+
+
+def test_formset_output_unchanged(settings):
+    """Test that formsets render identical HTML."""
+    formset_class = formset_factory(LayoutForm, extra=2)
+
+    actual, expected = render_both(settings, FILTER, formset_class)
+
+    assert actual == expected
+
+
+def test_field_output_unchanged(settings):
+    """Test that ``|as_crispy_field`` renders identical HTML."""
+    actual, expected = render_both(settings, FIELD, LayoutForm)
+
+    assert actual == expected
+
+
+def make_engine(templates, **options):
+    return Engine(
+        loaders=[
+            (
+                "crispy_neurobrutalist.loaders.Loader",
+                [("django.template.loaders.locmem.Loader", templates)],
+            )
+        ],
+        **options,
+    )
+
+
+def test_static_pack_includes_are_inlined(settings):
+    """Test that literal includes of pack templates are resolved at load time."""
+    settings.TEMPLATES = LOADER_TEMPLATES
+
+    field = get_template("neobrutalist/field.html").template
+    whole = get_template("neobrutalist/whole_uni_form.html").template
+
+    [help_and_errors] = field.nodelist.get_nodes_by_type(InlinedIncludeNode)
+    assert help_and_errors.template.name == "neobrutalist/layout/help_text_and_errors.html"
+    # ``{% include widget_template %}`` is only known at render time.
+    assert len(field.nodelist.get_nodes_by_type(IncludeNode)) == 1
+    assert not whole.nodelist.get_nodes_by_type(IncludeNode)
+
+
+def test_inlined_include_context():
+    """Test that inlined includes keep ``with``/``only`` and don't leak assignments."""
+    engine = make_engine(
+        {
+            "neobrutalist/parent.html": (
+                '{% include "neobrutalist/child.html" with b=2 %}|'
+                '{% include "neobrutalist/child.html" with b=3 only %}|{{ c }}'
+            ),
+            "neobrutalist/child.html": "{{ a }}{{ b }}{% firstof b as c %}",
+        }
+    )
+
+    template = engine.get_template("neobrutalist/parent.html")
+
+    assert template.nodelist.get_nodes_by_type(InlinedIncludeNode)
+    assert template.render(Context({"a": 1})) == "12|3|"
+
+
+def test_recursive_include_is_inlined_once():
+    """Test that a template including itself compiles and renders."""
+    engine = make_engine(
+        {
+            "neobrutalist/tree.html": (
+                "{{ node.name }}{% for node in node.children %}"
+                '{% include "neobrutalist/tree.html" %}{% endfor %}'
+            )
+        }
+    )
+    tree = {"name": "a", "children": [{"name": "b", "children": [{"name": "c"}]}]}
+
+    template = engine.get_template("neobrutalist/tree.html")
+
+    assert template.render(Context({"node": tree})) == "abc"
+
+
+def test_inlining_can_be_disabled(settings):
+    """Test that the debug switch keeps the original include structure."""
+    settings.CRISPY_NEUROBRUTALIST_INLINE_INCLUDES = False
+    engine = make_engine(
+        {"neobrutalist/a.html": '{% include "neobrutalist/b.html" %}', "neobrutalist/b.html": "b"}
+    )
+
+    template = engine.get_template("neobrutalist/a.html")
+
+    assert not template.nodelist.get_nodes_by_type(InlinedIncludeNode)
+    assert template.render(Context()) == "b"
@@ -3,7 +3,7 @@
 import pytest
 from django import forms
 
-from crispy_neurobrutalist.neurobrutalist import CSSContainer
+from crispy_neurobrutalist.neurobrutalist import CSSContainer, error_variant
 
 
 class TestCSSContainer:
@@ -65,13 +65,15 @@ class TestCSSContainer:
         assert "border-2" in css.text
         assert "focus:ring-2" in css.text
 
-    def test_add_operator_returns_self(self):
-        """Test that + operator returns self for chaining."""
+    def test_add_operator_returns_new_container(self):
+        """Test that + operator returns a new container and leaves the original intact."""
         css = CSSContainer({"text": "border-2"})
         
         result = css + {"text": "rounded"}
         
-        assert result is css
+        assert result is not css
+        assert css.text == "border-2"
+        assert set(result.text.split()) == {"border-2", "rounded"}
 
     def test_subtract_operator_removes_classes(self):
         """Test that the - operator removes CSS classes."""
@@ -84,13 +86,15 @@ class TestCSSContainer:
         assert "rounded-lg" not in css.text
         assert "bg-white" not in css.text
 
-    def test_subtract_operator_returns_self(self):
-        """Test that - operator returns self for chaining."""
+    def test_subtract_operator_returns_new_container(self):
+        """Test that - operator returns a new container and leaves the original intact."""
         css = CSSContainer({"text": "border-2 rounded"})
         
         result = css - {"text": "rounded"}
         
-        assert result is css
+        assert result is not css
+        assert set(css.text.split()) == {"border-2", "rounded"}
+        assert result.text == "border-2"
 
     def test_subtract_nonexistent_class(self):
         """Test that subtracting non-existent class doesn't cause error."""
@@ -114,7 +118,7 @@ class TestCSSContainer:
         assert "border-2" not in css.text
 
     def test_repr_method(self):
-        """Test __repr__ returns string representation of dict."""
+        """Test __repr__ includes the widget type mapping."""
         css = CSSContainer({"text": "border-2", "checkbox": "w-5"})
         
         repr_str = repr(css)
@@ -243,7 +247,7 @@ class TestCSSContainer:
         
         for widget_type in widget_types:
             assert hasattr(css, widget_type)
-            assert css.__dict__[widget_type] == "test"
+            assert getattr(css, widget_type) == "test"
 
     def test_duplicate_classes_not_added(self):
         """Test that duplicate classes are not added when using + operator."""
@@ -257,6 +261,87 @@ class TestCSSContainer:
         assert "rounded" in text_classes
         assert "focus:ring-2" in text_classes
 
+    def test_container_is_immutable(self):
+        """Test that attributes cannot be assigned or deleted."""
+        css = CSSContainer({"text": "border-2"})
+
+        with pytest.raises(AttributeError, match="immutable"):
+            css.text = "rounded"
+        with pytest.raises(AttributeError, match="immutable"):
+            del css.text
+
+        assert css.text == "border-2"
+
+    def test_in_place_add_rebinds_name_only(self):
+        """Test that += on a shared container does not change other references."""
+        shared = CSSContainer({"text": "border-2"})
+        alias = shared
+
+        alias += {"text": "rounded"}
+
+        assert shared.text == "border-2"
+        assert "rounded" in alias.text
+
+    def test_identical_styles_share_instance(self):
+        """Test that containers with identical styles are hash-consed."""
+        first = CSSContainer({"base": "border-2", "text": "p-3 rounded"})
+        second = CSSContainer({"base": "border-2", "text": "rounded p-3"})
+
+        assert first is second
+
+    def test_derived_containers_are_memoized(self):
+        """Test that repeating the same + or - returns the same container."""
+        css = CSSContainer({"text": "border-2 rounded"})
+
+        assert css + {"text": "p-3"} is css + {"text": "p-3"}
+        assert css - {"text": "rounded"} is css - {"text": "rounded"}
+        assert css + {"text": "p-3"} - {"text": "p-3"} is css
+
+    def test_unknown_widget_type_raises_attribute_error(self):
+        """Test that missing widget types raise AttributeError."""
+        css = CSSContainer({})
+
+        with pytest.raises(AttributeError):
+            css.nonexistent  # noqa: B018
+
+    def test_as_dict_returns_copy(self):
+        """Test that as_dict returns a detached mapping of all widget types."""
+        css = CSSContainer({"text": "border-2"})
+
+        styles = css.as_dict()
+        styles["text"] = "changed"
+
+        assert css.text == "border-2"
+        assert "error_border" in styles
+
+    def test_copy_and_pickle_preserve_identity(self):
+        """Test that copying or pickling returns the interned container."""
+        import copy
+        import pickle
+
+        css = CSSContainer({"text": "border-2"})
+
+        assert copy.copy(css) is css
+        assert copy.deepcopy(css) is css
+        assert pickle.loads(pickle.dumps(css)) is css
+
+    def test_get_input_class_is_cached_per_widget_class(self):
+        """Test that get_input_class resolves each widget class only once."""
+        from unittest.mock import patch
+
+        from crispy_neurobrutalist import neurobrutalist
+
+        class TestForm(forms.Form):
+            name = forms.CharField()
+
+        field = TestForm()["name"]
+        css = CSSContainer({"text": "w-full p-4 cached-lookup"})
+
+        assert css.get_input_class(field) == css.text
+        with patch.object(neurobrutalist, "widget_style_key") as style_key:
+            assert css.get_input_class(field) == css.text
+        style_key.assert_not_called()
+
 
 class TestSelect2Support:
     """Test suite for django-select2 support in CSSContainer."""
@@ -279,7 +364,7 @@ class TestSelect2Support:
 
         for widget_type in self.SELECT2_WIDGET_TYPES:
             assert hasattr(css, widget_type), f"Missing widget type: {widget_type}"
-            assert css.__dict__[widget_type] == "test-class"
+            assert getattr(css, widget_type) == "test-class"
 
     def test_select2_widget_types_initialized_empty(self):
         """Test that Select2 widget types exist with empty base."""
@@ -287,7 +372,7 @@ class TestSelect2Support:
 
         for widget_type in self.SELECT2_WIDGET_TYPES:
             assert hasattr(css, widget_type), f"Missing widget type: {widget_type}"
-            assert css.__dict__[widget_type] == ""
+            assert getattr(css, widget_type) == ""
 
     def test_select2_specific_styles_override(self):
         """Test that specific Select2 styles merge with base."""
@@ -656,3 +741,170 @@ class TestFileInputAndClearableFileInputRendering:
 
 
 
+
+
+class TestNeoFieldAttributes:
+    """Test suite for the attribute arguments of ``{% neo_field %}``."""
+
+    class AttrsForm(forms.Form):
+        name = forms.CharField(label="Name")
+        bio = forms.CharField(widget=forms.Textarea)
+
+    def test_literal_attributes_are_resolved_at_parse_time(self):
+        """Test that literal names and values need no lookup per render."""
+        from django.template import Template
+
+        from crispy_neurobrutalist.templatetags.neo_field import CrispyNeuroBrutaListFieldNode
+
+        template = Template(
+            "{% load neo_field %}"
+            '{% neo_field form.bio "placeholder" "About you" "rows" 3 "title" form.name.label %}'
+        )
+        [node] = template.nodelist.get_nodes_by_type(CrispyNeuroBrutaListFieldNode)
+
+        assert node.attrs['"placeholder"'] == ("placeholder", "About you")
+        assert node.attrs['"rows"'] == ("rows", 3)
+        assert not isinstance(node.attrs['"title"'][1], str)
+
+    def test_attribute_values_are_rendered(self):
+        """Test that literal, variable and filtered values end up in the widget."""
+        from django.template import Context, Template
+
+        template = Template(
+            "{% load neo_field %}"
+            '{% neo_field form.name "placeholder" form.name.label|upper "data-x" "y" %}'
+        )
+
+        html = template.render(Context({"form": self.AttrsForm()}))
+
+        assert 'placeholder="NAME"' in html
+        assert 'data-x="y"' in html
+
+    def test_class_attribute_replaces_pack_styles(self):
+        """Test that an explicit ``"class"`` skips the pack's input classes."""
+        from django.template import Context, Template
+
+        template = Template('{% load neo_field %}{% neo_field form.name "class" "my-input" %}')
+
+        html = template.render(Context({"form": self.AttrsForm()}))
+
+        assert 'class="textinput my-input"' in html
+        assert "neo-shadow-sm" not in html
+
+
+class TestErrorVariants:
+    """Test suite for the precomputed error state of widget classes."""
+
+    ERROR = "bg-red-100 border-red-500 border-2"
+
+    def test_error_variant_replaces_border_utilities_once(self):
+        """Test that the error classes take the place of the border color, not the width."""
+        result = error_variant("w-full border-4 border-black rounded-lg", self.ERROR)
+
+        assert result == "w-full bg-red-100 border-red-500 border-4 rounded-lg"
+
+    def test_error_variant_applies_error_width_to_widgets_without_one(self):
+        """Test that the width of the error class is used when the widget sets none."""
+        result = error_variant("p-3 border-black", self.ERROR)
+
+        assert result == "p-3 bg-red-100 border-red-500 border-2"
+
+    def test_error_variant_replaces_conflicting_background(self):
+        """Test that the error background replaces the widget's, leaving one bg utility."""
+        result = error_variant("w-full bg-white border-2 border-black", self.ERROR)
+
+        assert result == "w-full bg-red-100 border-red-500 border-2"
+
+    def test_error_variant_keeps_groups_it_does_not_set(self):
+        """Test that a color-only error class keeps the widget's border width and style."""
+        result = error_variant("border-4 border-dashed border-black", "border-red-500")
+
+        assert result == "border-red-500 border-4 border-dashed"
+
+    def test_error_variant_leaves_variants_and_borderless_classes(self):
+        """Test that prefixed utilities and classes without borders are untouched."""
+        assert error_variant("file:border-2 focus:border-blue-500", self.ERROR) == (
+            "file:border-2 focus:border-blue-500"
+        )
+        assert error_variant("select w-full", self.ERROR) == "select w-full"
+
+    def test_get_input_class_returns_error_state(self):
+        """Test that the container serves the precomputed error state per widget."""
+
+        class TestForm(forms.Form):
+            name = forms.CharField()
+
+        css = CSSContainer({"text": "border-2 border-black p-3", "error_border": "border-red-500"})
+        field = TestForm()["name"]
+
+        assert set(css.get_input_class(field).split()) == {"border-2", "border-black", "p-3"}
+        assert set(css.get_input_class(field, errors=True).split()) == {
+            "border-2",
+            "border-red-500",
+            "p-3",
+        }
+
+    def test_neo_field_renders_error_state(self):
+        """Test that a field with errors gets the error classes instead of its border color."""
+        from django.template import Context, Template
+
+        class TestForm(forms.Form):
+            name = forms.CharField()
+
+        form = TestForm(data={})
+        form.is_valid()
+
+        html = Template("{% load neo_field %}{% neo_field form.name %}").render(
+            Context({"form": form})
+        )
+
+        assert "border-red-500" in html
+        assert "border-black" not in html
+        assert "bg-white" not in html
+        assert html.count("bg-red-100") == 1
+
+    def test_neo_field_merges_widget_classes_in_error_state(self):
+        """Test that a widget's own classes and the error classes are merged, not appended."""
+        from django.template import Context, Template
+
+        class TestForm(forms.Form):
+            name = forms.CharField(
+                widget=forms.TextInput(attrs={"class": "border-4 border-blue-500 p-2"})
+            )
+
+        form = TestForm(data={})
+        form.is_valid()
+
+        html = Template("{% load neo_field %}{% neo_field form.name %}").render(
+            Context({"form": form})
+        )
+        classes = html.split('class="')[1].split('"')[0].split()
+
+        assert classes[:4] == ["bg-red-100", "border-red-500", "border-4", "p-2"]
+        assert len(classes) == len(set(classes))
+        assert "border-2" not in classes
+        assert "p-3" not in classes
+        assert "border-blue-500" not in classes
+
+
+class TestClassOrdering:
+    """Test suite for deterministic, conflict-aware container classes."""
+
+    def test_widget_style_overrides_conflicting_base(self):
+        """Test that a widget style replaces the base utilities it conflicts with."""
+        css = CSSContainer({"base": "p-3 bg-white border-2", "text": "p-4 bg-red-100"})
+
+        assert css.text == "bg-red-100 border-2 p-4"
+        assert css.email == "bg-white border-2 p-3"
+
+    def test_add_replaces_conflicting_utilities(self):
+        """Test that + replaces conflicting utilities instead of keeping both."""
+        css = CSSContainer({"text": "p-3 rounded"}) + {"text": "p-6"}
+
+        assert css.text == "p-6 rounded"
+
+    def test_classes_are_sorted(self):
+        """Test that equal class sets render the same string whatever the input order."""
+        css = CSSContainer({"text": "w-full neo-shadow border-2 a-class"})
+
+        assert css.text == "a-class border-2 neo-shadow w-full"
@@ -0,0 +1,218 @@
+"""Tests for cached select option fragments."""
+
+import pytest
+from django import forms
+from django.contrib.auth.models import User
+from django.template import Context, Template
+from django.utils import translation
+from django.utils.translation import gettext_lazy
+
+from crispy_neurobrutalist.cache import LRUCache
+from crispy_neurobrutalist.options import (
+    identity_cache,
+    model_options_cache,
+    options_cache,
+    render_options,
+)
+
+# The option loop previously inlined in select.html and multiselect.html.
+REFERENCE_LOOP = Template("""{% for widget in field.subwidgets %}
+        <option value="{{ widget.data.value }}"
+                {% if widget.data.selected %}selected{% endif %}>{{ widget.data.label }}</option>
+    {% endfor %}""")
+
+GROUPED = [
+    ("", "---"),
+    ("Fruit", [("apple", "Apple & Pear"), ("kiwi", "Kiwi")]),
+    ("Veg", (("leek", "<Leek>"), (None, "Nothing"))),
+    (3, "Three"),
+    ("kiwi", "Kiwi again"),
+]
+
+
+class OptionsForm(forms.Form):
+    """Form with single and multiple selects over grouped choices."""
+
+    single = forms.ChoiceField(choices=GROUPED, required=False)
+    multiple = forms.MultipleChoiceField(choices=GROUPED, required=False)
+    lazy = forms.ChoiceField(choices=[("y", gettext_lazy("Yes")), ("n", gettext_lazy("No"))])
+    number = forms.TypedChoiceField(choices=[(1, 1000), (2, 2.5)], coerce=int)
+
+
+def reference(field):
+    return REFERENCE_LOOP.render(Context({"field": field}))
+
+
+@pytest.mark.parametrize(
+    "initial",
+    [
+        {},
+        {"single": "kiwi", "multiple": ["kiwi", "3", "None"], "lazy": "n", "number": 2},
+        {"single": "missing", "multiple": ["leek"]},
+        {"single": "", "multiple": []},
+    ],
+)
+def test_render_options_matches_template_loop(initial):
+    """Test that cached fragments render exactly like the former template loop."""
+    form = OptionsForm(initial=initial)
+
+    for field in form:
+        assert render_options(field) == reference(field), field.name
+
+
+def test_bound_values_are_selected():
+    """Test that submitted data selects the matching options."""
+    form = OptionsForm(data={"single": "3", "multiple": ["apple", "leek"]})
+
+    for name in ("single", "multiple"):
+        assert render_options(form[name]) == reference(form[name])
+    assert render_options(form["single"]).count("selected>") == 1
+    assert render_options(form["multiple"]).count("selected>") == 2
+
+
+@pytest.mark.parametrize("initial", [None, True, False])
+def test_null_boolean_value_is_selected(initial):
+    """Test that the single string value of NullBooleanSelect selects its option."""
+
+    class NullBooleanForm(forms.Form):
+        answer = forms.NullBooleanField()
+
+    field = NullBooleanForm(initial={"answer": initial})["answer"]
+
+    assert render_options(field) == reference(field)
+    assert render_options(field).count("selected>") == 1
+
+
+def test_fragment_is_shared_across_forms():
+    """Test that identical choices reuse one cached fragment."""
+    options_cache.clear()
+
+    render_options(OptionsForm()["single"])
+    render_options(OptionsForm(initial={"single": "kiwi"})["single"])
+
+    info = options_cache.info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_fragment_cached_per_language():
+    """Test that lazy labels are rendered for the active language."""
+    options_cache.clear()
+
+    with translation.override("en"):
+        render_options(OptionsForm()["lazy"])
+    with translation.override("pt-br"):
+        render_options(OptionsForm()["lazy"])
+
+    assert options_cache.info().misses == 2
+
+
+def test_same_choices_skip_the_key():
+    """Test that rendering the same choices object again is an identity hit."""
+    options_cache.clear()
+    identity_cache.clear()
+    form = OptionsForm()
+
+    render_options(form["single"])
+    render_options(form["single"])
+
+    assert options_cache.info().misses == 1
+    assert options_cache.info().hits == 0
+    assert identity_cache.info().hits == 1
+
+
+class OwnerForm(forms.Form):
+    """Form choosing a user."""
+
+    owner = forms.ModelChoiceField(queryset=User.objects.order_by("username"), required=False)
+
+
+@pytest.mark.django_db
+def test_model_choices_cached_by_query(django_assert_num_queries):
+    """Test that model choices are keyed by their SQL, not by fetching them."""
+    model_options_cache.clear()
+    ann = User.objects.create(username="ann")
+    render_options(OwnerForm()["owner"])
+
+    with django_assert_num_queries(0):
+        html = render_options(OwnerForm(initial={"owner": ann.pk})["owner"])
+
+    assert html == reference(OwnerForm(initial={"owner": ann.pk})["owner"])
+
+
+@pytest.mark.django_db
+def test_model_choices_refreshed_on_save():
+    """Test that saving a row drops the cached model options."""
+    render_options(OwnerForm()["owner"])
+    User.objects.create(username="bob")
+
+    assert ">bob</option>" in render_options(OwnerForm()["owner"])
+
+
+def test_unhashable_choices_render_without_cache():
+    """Test that unhashable choice values are rendered but not cached."""
+
+    class ListValueSelect(forms.Select):
+        pass
+
+    widget = ListValueSelect(choices=[(["a"], "A")])
+
+    class UnhashableForm(forms.Form):
+        pick = forms.Field(widget=widget, required=False)
+
+    field = UnhashableForm()["pick"]
+
+    assert render_options(field) == reference(field)
+
+
+def test_select_templates_use_cached_options():
+    """Test that select.html renders selected options through the cache."""
+    form = OptionsForm(initial={"single": "kiwi", "multiple": ["apple"]})
+    template = Template(
+        "{% load crispy_forms_tags %}{{ form.single|as_crispy_field }}"
+        "{{ form.multiple|as_crispy_field }}"
+    )
+
+    html = template.render(Context({"form": form}))
+
+    assert "selected>Kiwi</option>" in html
+    assert "selected>Kiwi again</option>" not in html
+    assert "selected>Apple &amp; Pear</option>" in html
+
+
+class TestLRUCache:
+    """Test suite for the shared LRUCache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted first."""
+        cache = LRUCache(maxsize=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+    def test_bounded_by_weight(self):
+        """Test that total weight stays under maxweight."""
+        cache = LRUCache(maxsize=10, maxweight=5)
+        cache.set("a", "xxx")
+        cache.set("b", "yyy")
+        cache.set("huge", "z" * 10)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == "yyy"
+        assert cache.get("huge") is None
+        assert cache.info().weight == 3
+
+    def test_stats(self):
+        """Test hit and miss counters."""
+        cache = LRUCache()
+        cache.get("missing")
+        cache.set("k", "v")
+        cache.get("k")
+
+        info = cache.info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
@@ -0,0 +1,170 @@
+"""Tests for compiled form render plans."""
+
+import pytest
+from django import forms
+from django.core.exceptions import ValidationError
+from django.template import Context, Template
+from django.test import override_settings
+
+from crispy_neurobrutalist.plan import (
+    clear_plan_cache,
+    get_form_plan,
+    plan_cache_info,
+)
+from crispy_neurobrutalist.templatetags.neuro_filters import as_crispy_form
+
+
+class MockFile:
+    """File-like initial value for clearable file inputs."""
+
+    url = "/media/report.pdf"
+
+    def __str__(self):
+        return "report.pdf"
+
+
+class PackWidgetsForm(forms.Form):
+    """Form exercising every layout template of the pack."""
+
+    name = forms.CharField(help_text="Your <em>full</em> name")
+    nickname = forms.CharField(required=False, label="")
+    email = forms.EmailField(label="E-mail <b>address</b>")
+    website = forms.URLField(required=False)
+    password = forms.CharField(widget=forms.PasswordInput)
+    age = forms.IntegerField(required=False)
+    bio = forms.CharField(widget=forms.Textarea, required=False)
+    born = forms.DateField(widget=forms.DateInput, required=False)
+    seen = forms.DateTimeField(widget=forms.DateTimeInput, required=False)
+    alarm = forms.TimeField(widget=forms.TimeInput, required=False)
+    agree = forms.BooleanField()
+    avatar = forms.FileField(required=False)
+    resume = forms.FileField(widget=forms.FileInput, required=False)
+    color = forms.ChoiceField(choices=[("r", "Red"), ("g", "Green")])
+    tags = forms.MultipleChoiceField(choices=[("a", "A"), ("b", "B")], required=False)
+    size = forms.ChoiceField(choices=[("s", "S"), ("m", "M")], widget=forms.RadioSelect)
+    toppings = forms.MultipleChoiceField(
+        choices=[("x", "X"), ("y", "Y")], widget=forms.CheckboxSelectMultiple, required=False
+    )
+    when = forms.SplitDateTimeField(required=False)
+    token = forms.CharField(widget=forms.HiddenInput, required=False)
+
+    def clean(self):
+        raise ValidationError("Something is off")
+
+
+def render_template_path(form):
+    with override_settings(CRISPY_NEUROBRUTALIST_RENDER_PLANS=False):
+        return as_crispy_form(form)
+
+
+FORM_FACTORIES = [
+    pytest.param(lambda: PackWidgetsForm(), id="unbound"),
+    pytest.param(
+        lambda: PackWidgetsForm(
+            initial={"avatar": MockFile(), "color": "g", "bio": "hello", "born": "2024-02-01"}
+        ),
+        id="initial",
+    ),
+    pytest.param(lambda: PackWidgetsForm(data={"age": "x", "tags": ["b"]}), id="errors"),
+    pytest.param(
+        lambda: PackWidgetsForm(
+            data={"name": "Ann", "email": "a@b.co", "agree": "on", "size": "m", "toppings": ["y"]},
+            prefix="p",
+        ),
+        id="prefixed",
+    ),
+]
+
+
+@pytest.mark.parametrize("make_form", FORM_FACTORIES)
+def test_plan_output_matches_template_output(make_form):
+    """Test that the compiled plan renders exactly what uni_form.html renders."""
+    assert as_crispy_form(make_form()) == render_template_path(make_form())
+
+
+def test_plan_output_matches_with_custom_field_class():
+    """Test that the wrapper class follows the field_class argument."""
+    html = as_crispy_form(PackWidgetsForm(), "neobrutalist", "", "col-span-2")
+
+    with override_settings(CRISPY_NEUROBRUTALIST_RENDER_PLANS=False):
+        expected = as_crispy_form(PackWidgetsForm(), "neobrutalist", "", "col-span-2")
+
+    assert html == expected
+    assert "col-span-2" in html
+
+
+def test_crispy_filter_uses_plan():
+    """Test that {{ form|crispy }} goes through the plan cache."""
+    clear_plan_cache()
+    template = Template("{% load neuro_filters %}{{ form|crispy }}")
+
+    template.render(Context({"form": PackWidgetsForm()}))
+    template.render(Context({"form": PackWidgetsForm()}))
+
+    info = plan_cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_plan_recompiled_when_fields_change():
+    """Test that instances with different fields get their own plan."""
+
+    def make_changed_form():
+        form = PackWidgetsForm()
+        del form.fields["bio"]
+        return form
+
+    plan = get_form_plan(PackWidgetsForm(), "neobrutalist", "", "mb-3")
+    other = get_form_plan(make_changed_form(), "neobrutalist", "", "mb-3")
+
+    assert plan is not other
+    assert len(other.fields) == len(plan.fields) - 1
+    assert as_crispy_form(make_changed_form()) == render_template_path(make_changed_form())
+
+
+def test_plan_cache_is_bounded():
+    """Test that the plan cache is an LRU with a maximum size."""
+    assert plan_cache_info().maxsize is not None
+
+
+def test_no_plan_for_other_template_packs():
+    """Test that only the neobrutalist pack is compiled."""
+    assert get_form_plan(PackWidgetsForm(), "bootstrap5", "", "mb-3") is None
+
+
+def test_overridden_templates_disable_plans(tmp_path):
+    """Test that a project override of field.html falls back to the template path."""
+    override = tmp_path / "neobrutalist" / "field.html"
+    override.parent.mkdir()
+    override.write_text("<p>{{ field.name }}</p>")
+    templates = [
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "DIRS": [str(tmp_path)],
+            "APP_DIRS": True,
+        }
+    ]
+
+    with override_settings(TEMPLATES=templates):
+        assert get_form_plan(PackWidgetsForm(), "neobrutalist", "", "mb-3") is None
+        assert "<p>name</p>" in as_crispy_form(PackWidgetsForm())
+
+    assert get_form_plan(PackWidgetsForm(), "neobrutalist", "", "mb-3") is not None
+
+
+def test_template_change_clears_plan_cache():
+    """Test that editing a pack template invalidates compiled plans."""
+    from pathlib import Path
+
+    from django.utils.autoreload import file_changed
+
+    from crispy_neurobrutalist.plan import PACK_TEMPLATES_DIR
+
+    get_form_plan(PackWidgetsForm(), "neobrutalist", "", "mb-3")
+    assert plan_cache_info().currsize > 0
+
+    file_changed.send(
+        sender=None, file_path=Path(PACK_TEMPLATES_DIR) / "neobrutalist" / "field.html"
+    )
+
+    assert plan_cache_info().currsize == 0
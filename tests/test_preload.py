@@ -0,0 +1,119 @@
+"""Tests for the preload headers of rendered form assets."""
+
+from django import forms
+from django.http import HttpResponse, StreamingHttpResponse
+from django.template import Context, Template
+from django.test import override_settings
+from django.urls import path
+
+from crispy_neurobrutalist import iter_crispy_form
+from crispy_neurobrutalist.preload import AssetRecorder, asset_recorder, record_form_assets
+
+STYLESHEET_LINK = "</static/crispy_neurobrutalist/css/neurobrutalist.css>; rel=preload; as=style"
+
+
+class ColorWidget(forms.TextInput):
+    class Media:
+        css = {"all": ["colors/picker.css"]}
+        js = ["colors/picker.js", "https://cdn.example.com/shared.js"]
+
+
+class ColorForm(forms.Form):
+    color = forms.CharField(widget=ColorWidget)
+
+
+class NameForm(forms.Form):
+    name = forms.CharField()
+
+
+def render(template_code, **context):
+    return Template("{% load crispy_forms_tags neuro_filters neo_field %}" + template_code).render(
+        Context(context)
+    )
+
+
+def crispy_filter_view(request):
+    return HttpResponse(render("{{ form|crispy }}", form=ColorForm()))
+
+
+def crispy_tag_view(request):
+    return HttpResponse(render("{% crispy form %}", form=NameForm()))
+
+
+def plain_view(request):
+    response = HttpResponse("<p>No form</p>")
+    response["Link"] = "</static/app.css>; rel=preload; as=style"
+    return response
+
+
+def streaming_view(request):
+    return StreamingHttpResponse(iter_crispy_form(NameForm()))
+
+
+urlpatterns = [
+    path("filter/", crispy_filter_view),
+    path("tag/", crispy_tag_view),
+    path("plain/", plain_view),
+    path("streaming/", streaming_view),
+]
+
+preload_settings = override_settings(
+    ROOT_URLCONF="tests.test_preload",
+    MIDDLEWARE=["crispy_neurobrutalist.preload.PreloadMiddleware"],
+)
+
+
+@preload_settings
+def test_filter_render_preloads_stylesheet_and_media(client):
+    """Test that ``|crispy`` records the stylesheet and the form media."""
+    response = client.get("/filter/")
+
+    assert response["Link"] == ", ".join(
+        [
+            STYLESHEET_LINK,
+            "</static/colors/picker.css>; rel=preload; as=style",
+            "</static/colors/picker.js>; rel=preload; as=script",
+            "<https://cdn.example.com/shared.js>; rel=preload; as=script",
+        ]
+    )
+
+
+@preload_settings
+def test_crispy_tag_and_streaming_renders_are_recorded(client):
+    """Test that ``{% crispy %}`` and ``iter_crispy_form`` record their assets."""
+    assert client.get("/tag/")["Link"] == STYLESHEET_LINK
+    assert client.get("/streaming/")["Link"] == STYLESHEET_LINK
+
+
+@preload_settings
+def test_existing_link_header_is_kept(client):
+    """Test that responses without forms keep their own Link header untouched."""
+    assert client.get("/plain/")["Link"] == "</static/app.css>; rel=preload; as=style"
+
+
+@preload_settings
+@override_settings(CRISPY_NEUROBRUTALIST_PRELOAD_STYLESHEET=None)
+def test_stylesheet_preload_can_be_disabled(client):
+    """Test that only form media is preloaded without a stylesheet."""
+    assert "neurobrutalist.css" not in client.get("/filter/")["Link"]
+    assert not client.get("/tag/").has_header("Link")
+
+
+def test_recording_is_a_no_op_outside_the_middleware():
+    """Test that renders outside a request record nothing."""
+    recorder = AssetRecorder()
+    record_form_assets(ColorForm())
+
+    token = asset_recorder.set(recorder)
+    try:
+        render("{{ form.color|as_crispy_field }}", form=ColorForm())
+    finally:
+        asset_recorder.reset(token)
+
+    assert asset_recorder.get() is None
+    assert list(recorder.assets) == [
+        "/static/crispy_neurobrutalist/css/neurobrutalist.css",
+        "/static/colors/picker.css",
+        "/static/colors/picker.js",
+        "https://cdn.example.com/shared.js",
+    ]
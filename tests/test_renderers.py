@@ -0,0 +1,269 @@
+"""Tests for native widget HTML emission."""
+
+import copy
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django import forms
+from django.forms.renderers import DjangoTemplates
+from django.template import Context, Template
+from django.test import override_settings
+from django.utils.safestring import mark_safe
+
+from crispy_neurobrutalist.renderers import (
+    NativeWidgetRenderer,
+    copy_widget,
+    emit,
+    render_bound_field,
+    uses_stock_templates,
+)
+
+
+class AllWidgetsForm(forms.Form):
+    """Form covering the widgets emitted natively."""
+
+    text = forms.CharField(max_length=20, widget=forms.TextInput(attrs={"data-x": "<&>"}))
+    number = forms.IntegerField(required=False)
+    decimal = forms.DecimalField(required=False, localize=True)
+    email = forms.EmailField()
+    url = forms.URLField(required=False)
+    password = forms.CharField(widget=forms.PasswordInput(render_value=True))
+    bio = forms.CharField(widget=forms.Textarea, required=False)
+    date = forms.DateField(widget=forms.DateInput)
+    when = forms.DateTimeField(widget=forms.DateTimeInput)
+    time = forms.TimeField(widget=forms.TimeInput)
+    agree = forms.BooleanField(required=False)
+    hidden = forms.CharField(widget=forms.HiddenInput, required=False)
+    choice = forms.ChoiceField(choices=[("a", "A & B"), ("b", "B")])
+    grouped = forms.ChoiceField(
+        choices=[("Fruit", [("apple", "Apple"), ("pear", "Pear")]), ("other", "Other")]
+    )
+    many = forms.MultipleChoiceField(choices=[(1, "One"), (2, "Two"), (3, "Three")])
+    nullable = forms.NullBooleanField()
+    split = forms.SplitDateTimeField()
+    split_hidden = forms.SplitDateTimeField(widget=forms.SplitHiddenDateTimeWidget)
+    multiple_hidden = forms.MultipleChoiceField(
+        choices=[("x", "X"), ("y", "Y")], widget=forms.MultipleHiddenInput, required=False
+    )
+    birthday = forms.DateField(widget=forms.SelectDateWidget(years=[2000, 2001]))
+    upload = forms.FileField(widget=forms.FileInput, required=False)
+
+
+BOUND_DATA = {
+    "text": 'quote " and <tag>',
+    "number": "12",
+    "decimal": "1234.5",
+    "email": "not-an-email",
+    "password": "secret",
+    "bio": "line one\nline <two>",
+    "date": "2024-01-31",
+    "when": "2024-01-31 10:30",
+    "time": "10:30",
+    "agree": "on",
+    "hidden": "h",
+    "choice": "b",
+    "grouped": "pear",
+    "many": ["1", "3"],
+    "nullable": "true",
+    "split_0": "2024-01-31",
+    "split_1": "10:30",
+    "multiple_hidden": ["x", "y"],
+    "birthday_day": "3",
+    "birthday_month": "4",
+    "birthday_year": "2001",
+}
+
+
+@pytest.mark.parametrize(
+    "form",
+    [
+        pytest.param(lambda: AllWidgetsForm(), id="unbound"),
+        pytest.param(
+            lambda: AllWidgetsForm(initial={"choice": "a", "many": [2], "bio": mark_safe("<b>")}),
+            id="initial",
+        ),
+        pytest.param(lambda: AllWidgetsForm(data=BOUND_DATA), id="bound"),
+        pytest.param(lambda: AllWidgetsForm(data={}), id="errors"),
+        pytest.param(lambda: AllWidgetsForm(data=BOUND_DATA, prefix="p"), id="prefixed"),
+    ],
+)
+def test_render_bound_field_matches_template_output(form):
+    """Test that native emission is byte-identical to Django's widget templates."""
+    form = form()
+    form.is_bound and form.is_valid()
+
+    for bound_field in form:
+        assert render_bound_field(bound_field) == str(bound_field), bound_field.name
+
+
+def test_unknown_template_falls_back():
+    """Test that widgets with other templates are delegated to the wrapped renderer."""
+
+    class Fallback:
+        def render(self, template_name, context, request=None):
+            return "fallback:" + template_name
+
+    renderer = NativeWidgetRenderer(Fallback())
+
+    assert renderer.render("custom/widget.html", {"widget": {}}) == "fallback:custom/widget.html"
+    assert emit("django/forms/widgets/radio.html", {}) is None
+
+
+def test_callable_attribute_falls_back():
+    """Test that callable attribute values are left to the template engine."""
+    widget = {"type": "text", "name": "x", "value": None, "attrs": {"data-x": lambda: "y"}}
+
+    assert emit("django/forms/widgets/text.html", widget) is None
+
+
+def test_show_hidden_initial_uses_str():
+    """Test that fields rendering a hidden initial input use the regular path."""
+
+    class HiddenInitialForm(forms.Form):
+        name = forms.CharField(show_hidden_initial=True)
+
+    field = HiddenInitialForm(initial={"name": "x"})["name"]
+
+    assert render_bound_field(field) == str(field)
+    assert "initial-name" in render_bound_field(field)
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_neo_field_output_independent_of_setting(enabled):
+    """Test that the neo_field tag renders the same HTML with and without the fast path."""
+    template = Template(
+        "{% load neo_field %}{% for field in form %}{% neo_field field %}{% endfor %}"
+    )
+
+    with override_settings(CRISPY_NEUROBRUTALIST_NATIVE_WIDGETS=enabled):
+        html = template.render(Context({"form": AllWidgetsForm(data=BOUND_DATA)}))
+    with override_settings(CRISPY_NEUROBRUTALIST_NATIVE_WIDGETS=not enabled):
+        other = template.render(Context({"form": AllWidgetsForm(data=BOUND_DATA)}))
+
+    assert html == other
+    assert 'type="email"' in html
+    assert "<optgroup" in html
+
+
+def test_datetime_values_render_like_templates():
+    """Test that aware datetimes in attrs are rendered like the template engine does."""
+
+    class DateForm(forms.Form):
+        when = forms.DateTimeField(
+            widget=forms.DateTimeInput(attrs={"data-min": datetime.date(2024, 1, 1)})
+        )
+
+    field = DateForm()["when"]
+
+    assert render_bound_field(field) == str(field)
+
+
+class SharedForm(AllWidgetsForm):
+    """``AllWidgetsForm`` with a clearable file input and attributes set by the tag."""
+
+    resume = forms.FileField(required=False)
+
+
+SHARED = Template(
+    "{% load neo_field %}"
+    '{% for field in form %}{% neo_field field "data-role" "input" %}{% endfor %}'
+)
+
+
+def widget_state(form):
+    return {
+        name: copy.deepcopy(
+            (field.widget.attrs, field.widget.template_name, getattr(field.widget, "widgets", []))
+        )
+        for name, field in form.fields.items()
+    }
+
+
+def assert_same_widget_state(before, after):
+    for name, (attrs, template_name, subwidgets) in before.items():
+        new_attrs, new_template_name, new_subwidgets = after[name]
+        assert new_attrs == attrs, name
+        assert new_template_name == template_name, name
+        assert [w.attrs for w in new_subwidgets] == [w.attrs for w in subwidgets], name
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_neo_field_leaves_widgets_untouched(enabled):
+    """Test that rendering a form twice gives the same HTML and doesn't change its widgets."""
+    form = SharedForm(data={})
+    before = widget_state(form)
+
+    with override_settings(CRISPY_NEUROBRUTALIST_NATIVE_WIDGETS=enabled):
+        first = SHARED.render(Context({"form": form}))
+        second = SHARED.render(Context({"form": form}))
+
+    assert first == second
+    assert first.count('data-role="input"') >= len(form.fields)
+    assert 'type="file"' in first
+    assert_same_widget_state(before, widget_state(form))
+
+
+def test_neo_field_concurrent_renders():
+    """Test that threads rendering one shared form all get the same HTML."""
+    form = SharedForm(data=BOUND_DATA)
+    expected = SHARED.render(Context({"form": form}))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: SHARED.render(Context({"form": form})), range(64)))
+
+    assert results == [expected] * 64
+
+
+def test_copy_widget_copies_attrs_and_subwidgets():
+    """Test that copies own their attributes and sub-widgets but share choices."""
+    widget = forms.SplitDateTimeWidget(attrs={"class": "x"})
+    select = forms.Select(choices=[("a", "A")])
+
+    clone = copy_widget(widget)
+    clone.widgets[0].attrs["class"] = "y"
+
+    assert widget.widgets[0].attrs == {"class": "x"}
+    assert clone.widgets[0] is not widget.widgets[0]
+    assert copy_widget(select).choices is select.choices
+
+
+def test_overridden_widget_templates_fall_back(tmp_path, settings):
+    """Test that project overrides of Django's widget templates are rendered."""
+    widgets_dir = tmp_path / "django" / "forms" / "widgets"
+    widgets_dir.mkdir(parents=True)
+    (widgets_dir / "text.html").write_text('<input data-override name="{{ widget.name }}">')
+    settings.FORM_RENDERER = "django.forms.renderers.TemplatesSetting"
+    settings.TEMPLATES = [
+        {"BACKEND": "django.template.backends.django.DjangoTemplates", "DIRS": [tmp_path]}
+    ]
+
+    class NameForm(forms.Form):
+        name = forms.CharField()
+
+    field = NameForm()["name"]
+
+    assert not uses_stock_templates(field.form.renderer)
+    assert render_bound_field(field) == str(field) == '<input data-override name="name">'
+
+
+def test_default_renderer_uses_stock_templates():
+    """Test that the fast path is used with Django's own widget templates."""
+    assert uses_stock_templates(AllWidgetsForm().renderer)
+
+
+def test_stock_templates_are_checked_once_per_renderer_class():
+    """Test that renderers built per request reuse the result of their class."""
+
+    class CountingRenderer(DjangoTemplates):
+        lookups = 0
+
+        def get_template(self, template_name):
+            CountingRenderer.lookups += 1
+            return super().get_template(template_name)
+
+    assert uses_stock_templates(CountingRenderer())
+    lookups = CountingRenderer.lookups
+
+    assert uses_stock_templates(CountingRenderer())
+    assert CountingRenderer.lookups == lookups
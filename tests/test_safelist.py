@@ -0,0 +1,76 @@
+"""Tests for the Tailwind safelist of the pack's classes."""
+
+import json
+from io import StringIO
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.test import override_settings
+
+from crispy_neurobrutalist.neurobrutalist import CSSContainer
+from crispy_neurobrutalist.safelist import collect_classes, template_classes
+
+compact_styles = CSSContainer({"text": "px-1 safelist-compact", "error_border": "border-pink-500"})
+
+
+def test_template_classes_skip_classes_built_by_tags():
+    """Test that only static classes come out of ``class`` attributes."""
+    source = (
+        '<label class="sr-only{% if required %} requiredField{% endif %} bg-{{ color }}">'
+        "<p class='text-xs'>{{ text }}</p>"
+    )
+
+    assert list(template_classes(source)) == ["sr-only", "requiredField", "text-xs"]
+
+
+def test_collect_classes_covers_templates_styles_and_layout():
+    """Test that template, container, error and layout classes are all listed."""
+    classes = collect_classes()
+
+    assert classes == sorted(set(classes))
+    assert "custom-checkbox" in classes  # checkbox.html
+    assert "file:bg-gray-200" in classes  # default_styles
+    assert "bg-red-100" in classes  # error_border
+    assert "bg-purple-400" in classes  # Button(color="purple")
+    assert "pr-12" in classes  # dismissible Alert
+    assert "safelist-compact" not in classes
+
+
+@override_settings(CRISPY_NEUROBRUTALIST_SAFELIST_CONTAINERS=["tests.test_safelist.compact_styles"])
+def test_collect_classes_includes_configured_containers():
+    """Test that containers from the setting contribute their styles and error variants."""
+    classes = collect_classes()
+
+    assert "safelist-compact" in classes
+    assert "border-pink-500" in classes
+
+
+def test_collect_classes_rejects_non_containers():
+    """Test that a path to something else than a CSSContainer is reported."""
+    with pytest.raises(ImproperlyConfigured, match="not a CSSContainer"):
+        collect_classes(["tests.test_safelist.collect_classes"])
+
+
+def test_command_writes_text_and_json(tmp_path):
+    """Test the ``neurobrutalist_safelist`` command output formats."""
+    stdout = StringIO()
+    call_command("neurobrutalist_safelist", stdout=stdout)
+    lines = stdout.getvalue().splitlines()
+
+    output = tmp_path / "safelist.json"
+    call_command(
+        "neurobrutalist_safelist",
+        "--format",
+        "json",
+        "--output",
+        str(output),
+        "--container",
+        "tests.test_safelist.compact_styles",
+        stdout=StringIO(),
+    )
+
+    assert "neo-shadow-sm" in lines
+    assert json.loads(output.read_text()) == sorted(
+        {*lines, "px-1", "safelist-compact", "border-pink-500"}
+    )
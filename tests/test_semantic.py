@@ -0,0 +1,109 @@
+"""Tests for the semantic class mode."""
+
+from io import StringIO
+
+from django import forms
+from django.core.management import call_command
+from django.template import Context, Template
+from django.test import override_settings
+
+from crispy_neurobrutalist.neurobrutalist import CSSContainer
+from crispy_neurobrutalist.semantic import (
+    TEMPLATE_STYLES,
+    compact_class,
+    semantic_css,
+    semantic_rules,
+)
+from crispy_neurobrutalist.templatetags.neo_field import CrispyNeuroBrutaListFieldNode
+
+
+class ProfileForm(forms.Form):
+    name = forms.CharField()
+    avatar = forms.FileField(required=False)
+    agree = forms.BooleanField()
+    color = forms.ChoiceField(choices=[("r", "Red"), ("g", "Green")], widget=forms.RadioSelect)
+
+
+def render_form(form):
+    return Template("{% load neuro_filters %}{{ form|crispy }}").render(Context({"form": form}))
+
+
+def test_compact_class_keeps_pack_classes():
+    """Test that only the pack's plain CSS classes stay next to the semantic class."""
+    assert compact_class("neo-check", TEMPLATE_STYLES["neo-check"]) == "neo-check custom-checkbox"
+    assert (
+        compact_class("neo-file", CrispyNeuroBrutaListFieldNode.FILE_INPUT_CLASSES)
+        == "neo-file file:neo-shadow-sm"
+    )
+
+
+def test_default_output_keeps_tailwind_classes():
+    """Test that the default mode renders the Tailwind classes inline."""
+    html = render_form(ProfileForm())
+
+    assert TEMPLATE_STYLES["neo-radio"] in html
+    assert "neo-input" not in html
+    assert "neo-radio" not in html
+
+
+@override_settings(CRISPY_NEUROBRUTALIST_SEMANTIC_CLASSES=True)
+def test_semantic_output():
+    """Test that widgets and template inputs get semantic classes, with error variants."""
+    html = render_form(ProfileForm())
+
+    assert 'class="textinput neo-input neo-shadow-sm"' in html
+    assert "neo-file file:neo-shadow-sm" in html
+    assert 'class="neo-radio custom-radio"' in html
+    assert "focus:ring-blue-400" not in html
+
+    bound = render_form(ProfileForm(data={}))
+    assert "neo-input-error neo-shadow-sm" in bound
+
+
+def test_semantic_output_is_smaller():
+    """Test that switching the setting drops cached output and shrinks it."""
+    default_html = render_form(ProfileForm())
+    with override_settings(CRISPY_NEUROBRUTALIST_SEMANTIC_CLASSES=True):
+        semantic_html = render_form(ProfileForm())
+
+    assert len(semantic_html) < len(default_html)
+    assert render_form(ProfileForm()) == default_html
+
+
+@override_settings(CRISPY_NEUROBRUTALIST_SEMANTIC_CLASSES=True)
+def test_custom_container_keeps_tailwind_classes():
+    """Test that a custom css_container is rendered as configured."""
+    container = CSSContainer({"text": "px-1 bg-lime-200"})
+    html = Template("{% load neo_field %}{% neo_field field %}").render(
+        Context({"field": ProfileForm()["name"], "css_container": container})
+    )
+
+    assert "bg-lime-200" in html
+    assert "neo-input" not in html
+
+
+def test_semantic_rules_match_the_style_tables():
+    """Test that each semantic class applies the utilities of its style."""
+    rules = semantic_rules(CrispyNeuroBrutaListFieldNode.default_container)
+
+    assert set(rules["neo-input"].split()) == set(
+        CrispyNeuroBrutaListFieldNode.BASE_INPUT_CLASSES.split()
+    ) - {"neo-shadow-sm"}
+    assert "bg-red-100" in rules["neo-input-error"].split()
+    assert "border-black" not in rules["neo-input-error"].split()
+    assert rules["neo-check"] == "w-5 h-5 border-2 border-black rounded-md appearance-none"
+    assert "neo-radio" in rules and "neo-file-error" in rules
+
+
+def test_command_writes_the_css(tmp_path):
+    """Test the ``neurobrutalist_semantic_css`` command."""
+    stdout = StringIO()
+    call_command("neurobrutalist_semantic_css", stdout=stdout)
+
+    output = tmp_path / "semantic.css"
+    call_command("neurobrutalist_semantic_css", "-o", str(output), stdout=StringIO())
+
+    assert stdout.getvalue() == output.read_text() == semantic_css()
+    assert "  .neo-check { @apply w-5 h-5 border-2 border-black rounded-md appearance-none; }" in (
+        stdout.getvalue()
+    )
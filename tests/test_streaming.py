@@ -0,0 +1,99 @@
+"""Tests for streaming form and formset rendering."""
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.forms import formset_factory
+from django.http import StreamingHttpResponse
+from django.test import override_settings
+
+from crispy_neurobrutalist import iter_crispy_form
+from crispy_neurobrutalist.templatetags.neuro_filters import as_crispy_form
+
+
+class ItemForm(forms.Form):
+    """Simple row form."""
+
+    name = forms.CharField(help_text="Item name")
+    quantity = forms.IntegerField(required=False)
+    color = forms.ChoiceField(choices=[("r", "Red"), ("g", "Green")])
+    active = forms.BooleanField(required=False)
+
+
+class BaseItemFormSet(forms.BaseFormSet):
+    def clean(self):
+        raise ValidationError("Check the items")
+
+
+ItemFormSet = formset_factory(ItemForm, formset=BaseItemFormSet, extra=3)
+
+
+class TestIterCrispyForm:
+    """Test suite for iter_crispy_form with forms."""
+
+    def test_chunks_join_to_crispy_output(self):
+        """Test that the streamed chunks are identical to the crispy filter output."""
+        assert "".join(iter_crispy_form(ItemForm())) == as_crispy_form(ItemForm())
+
+    def test_chunks_join_to_crispy_output_with_errors(self):
+        """Test that bound forms with errors stream identical HTML."""
+        data = {"quantity": "many"}
+
+        assert "".join(iter_crispy_form(ItemForm(data))) == as_crispy_form(ItemForm(data))
+
+    def test_form_is_streamed_field_by_field(self):
+        """Test that each field is yielded as its own chunk."""
+        chunks = [chunk for chunk in iter_crispy_form(ItemForm()) if chunk.strip()]
+
+        assert len(chunks) == len(ItemForm.base_fields)
+        assert 'id="div_id_name"' in chunks[0]
+        assert 'id="div_id_active"' in chunks[-1]
+
+    def test_template_path_fallback(self):
+        """Test that streaming still works with render plans disabled."""
+        with override_settings(CRISPY_NEUROBRUTALIST_RENDER_PLANS=False):
+            html = "".join(iter_crispy_form(ItemForm()))
+
+        assert html == as_crispy_form(ItemForm())
+
+
+class TestIterCrispyFormset:
+    """Test suite for iter_crispy_form with formsets."""
+
+    def test_formset_rows_streamed(self):
+        """Test that management form and each row are rendered."""
+        html = "".join(iter_crispy_form(ItemFormSet()))
+
+        assert 'name="form-TOTAL_FORMS"' in html
+        assert html.count('<div class="multiField">') == 3
+        assert 'id="div_id_form-2-name"' in html
+
+    def test_formset_rows_built_lazily(self):
+        """Test that unbound formsets don't keep every form alive."""
+        formset = ItemFormSet()
+
+        chunks = list(iter_crispy_form(formset))
+
+        assert "forms" not in formset.__dict__
+        assert len(chunks) > 3 * len(ItemForm.base_fields)
+
+    def test_formset_non_form_errors(self):
+        """Test that formset-level errors are rendered before the rows."""
+        data = {
+            "form-TOTAL_FORMS": "1",
+            "form-INITIAL_FORMS": "0",
+            "form-0-name": "Pen",
+            "form-0-color": "r",
+        }
+
+        html = "".join(iter_crispy_form(ItemFormSet(data)))
+
+        assert "Check the items" in html
+        assert html.index("Check the items") < html.index('<div class="multiField">')
+
+    def test_streaming_http_response(self):
+        """Test that the generator can feed a StreamingHttpResponse directly."""
+        response = StreamingHttpResponse(iter_crispy_form(ItemFormSet()))
+
+        body = b"".join(response.streaming_content).decode()
+
+        assert body.count('<div class="multiField">') == 3
@@ -0,0 +1,58 @@
+"""Tests for the tree-shaken build of ``neurobrutalist.css``."""
+
+import gzip
+from io import StringIO
+
+from django.core.management import call_command
+
+from crispy_neurobrutalist.stylesheet import (
+    build_stylesheet,
+    parse_rules,
+    read_stylesheet,
+    serialize,
+    shake,
+)
+
+
+def test_shake_drops_unused_selectors_and_empty_blocks():
+    """Test that selectors with unknown classes go, and so do blocks left empty."""
+    rules = parse_rules(
+        ".a, .b:hover { color: red; }"
+        ".c .a { margin: 0 }"
+        "@media print { .c { color: blue } }"
+        "@media (max-width: 640px) { .a { box-shadow: 1px 1px 0 0 rgba(0, 0, 0, 1) !important; } }"
+    )
+
+    assert serialize(shake(rules, {"a"}, ())) == (
+        ".a{color:red}@media (max-width:640px){.a{box-shadow:1px 1px 0 0 rgba(0,0,0,1)!important}}"
+    )
+    assert serialize(shake(rules, {"b"}, ("c",))) == (
+        ".b:hover{color:red}@media print{.c{color:blue}}"
+    )
+
+
+def test_build_keeps_reachable_rules_only():
+    """Test the size of the build and which optional rules it keeps."""
+    source = read_stylesheet()
+    css = build_stylesheet()
+
+    assert ".custom-checkbox:checked::after{" in css
+    assert ".neo-shadow-sm{box-shadow:2px 2px 0px 0px rgba(0,0,0,1)}" in css
+    assert ".neo-card" not in css
+    assert "@keyframes" not in css
+    assert len(css) < len(source) * 0.6
+    assert len(gzip.compress(css.encode())) < 2048
+
+    kept = build_stylesheet(keep=["neo-card", "neo-pop"])
+    assert ".neo-card{" in kept
+    assert "@keyframes neo-pop{0%{transform:scale(1)}" in kept
+
+
+def test_command_writes_hashed_and_precompressed_files(tmp_path):
+    """Test that the command writes the hashed stylesheet and its gzip sibling."""
+    call_command("neurobrutalist_css", "--output-dir", str(tmp_path), stdout=StringIO())
+
+    (css_path,) = tmp_path.glob("neurobrutalist.*.min.css")
+    content = css_path.read_text(encoding="utf-8")
+    assert content == build_stylesheet()
+    assert gzip.decompress((tmp_path / f"{css_path.name}.gz").read_bytes()).decode() == content
@@ -0,0 +1,48 @@
+"""Tests for the Tailwind class merge engine."""
+
+import pytest
+
+from crispy_neurobrutalist.tailwind import merge_classes, parse_class
+
+
+@pytest.mark.parametrize(
+    ("classes", "expected"),
+    [
+        (("p-3 bg-white border-2", "p-4 bg-red-100"), "border-2 p-4 bg-red-100"),
+        (("px-2 p-4",), "p-4"),
+        (("p-4 px-2",), "p-4 px-2"),
+        (("text-sm text-gray-500 text-black text-center",), "text-sm text-black text-center"),
+        (("font-bold font-mono font-semibold",), "font-mono font-semibold"),
+        (("border-2 border-black border-4 border-red-500",), "border-4 border-red-500"),
+        (("border-t-4 border-2",), "border-2"),
+        (("border-2 border-t-4",), "border-2 border-t-4"),
+        (("ring-2 ring-blue-400 ring-4",), "ring-blue-400 ring-4"),
+        (("block flex flex-1 flex-col",), "flex flex-1 flex-col"),
+        (("-mt-2 mt-4",), "mt-4"),
+        (("w-[10px] w-full min-h-[52px]",), "w-full min-h-[52px]"),
+    ],
+)
+def test_merge_resolves_conflicts(classes, expected):
+    """Test that later utilities replace the conflicting ones before them."""
+    assert merge_classes(*classes) == expected
+
+
+def test_merge_keeps_modifiers_apart():
+    """Test that utilities only conflict under the same variants."""
+    assert merge_classes("bg-white hover:bg-white hover:focus:bg-black focus:hover:bg-red-500") == (
+        "bg-white hover:bg-white focus:hover:bg-red-500"
+    )
+    assert merge_classes("p-2 !p-3 p-4") == "!p-3 p-4"
+
+
+def test_merge_deduplicates_unknown_classes():
+    """Test that non-Tailwind classes are kept in order and only de-duplicated."""
+    assert (
+        merge_classes("neo-shadow textinput", "neo-shadow custom") == "textinput neo-shadow custom"
+    )
+
+
+def test_parse_class_ignores_colons_in_arbitrary_values():
+    """Test that ``:`` inside brackets isn't taken for a variant separator."""
+    assert parse_class("hover:[mask-type:luminance]") == (":hover", "mask-type")
+    assert parse_class("neo-shadow-sm") == ("", None)
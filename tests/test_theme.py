@@ -0,0 +1,132 @@
+"""Tests for the CSS-variable theming mode."""
+
+import pytest
+from django import forms
+from django.template import Context, Template
+from django.test import override_settings
+
+from crispy_neurobrutalist.config import pack_settings
+from crispy_neurobrutalist.fragments import class_mode
+from crispy_neurobrutalist.layout import Alert, Button
+from crispy_neurobrutalist.semantic import semantic_css
+from crispy_neurobrutalist.theme import THEME_DEFAULTS, theme_css, themed_classes
+
+
+class ContactForm(forms.Form):
+    name = forms.CharField()
+    message = forms.CharField(widget=forms.Textarea)
+
+    def clean(self):
+        raise forms.ValidationError("Try again later.")
+
+
+def render_form(form):
+    return Template("{% load neuro_filters %}{{ form|crispy }}").render(Context({"form": form}))
+
+
+def test_themed_classes():
+    """Test that only the pack's colors are replaced."""
+    assert themed_classes("p-4 bg-blue-400 hover:bg-blue-500 bg-lime-200") == (
+        "p-4 bg-[color:var(--neo-primary)] hover:bg-[color:var(--neo-primary-hover)] bg-lime-200"
+    )
+
+
+def test_theme_css():
+    """Test that ``theme_css`` renders every variable, with overrides."""
+    css = theme_css({"primary": "#ff00aa"}, selector=".tenant")
+
+    assert css.startswith(".tenant{--neo-primary:#ff00aa;")
+    assert css.count("--neo-") == len(THEME_DEFAULTS)
+    assert "--neo-focus:#60a5fa" in theme_css()
+
+
+@pytest.mark.parametrize(
+    "colors", [{"primay": "red"}, {"primary": "red;}body{display:none"}], ids=["unknown", "unsafe"]
+)
+def test_theme_css_rejects_invalid_colors(colors):
+    """Test that unknown variables and values breaking out of the declaration raise."""
+    with pytest.raises(ValueError):
+        theme_css(colors)
+
+
+def test_default_mode_keeps_tailwind_colors():
+    """Test that colors stay baked in by default."""
+    assert "bg-red-400" in Button("delete", "Delete", color="danger").field_classes
+    assert "focus:ring-blue-400" in render_form(ContactForm())
+
+
+@override_settings(CRISPY_NEUROBRUTALIST_THEME_VARIABLES=True)
+def test_themed_layout_components():
+    """Test that Button and Alert colors read CSS variables, custom classes don't."""
+    button = Button("delete", "Delete", color="danger")
+    alert = Alert(alert_type="warning")
+
+    assert "bg-[color:var(--neo-danger)]" in button.field_classes
+    assert "bg-red-400" not in button.field_classes
+    assert "bg-[color:var(--neo-warning-bg)]" in alert.css_class
+    assert "text-[color:var(--neo-warning-text)]" in alert.css_class
+    assert Button("x", "X", css_class="bg-red-400").field_classes == "bg-red-400"
+
+
+@override_settings(CRISPY_NEUROBRUTALIST_THEME_VARIABLES=True)
+def test_themed_form_output():
+    """Test that widgets, error variants and the error box read CSS variables."""
+    html = render_form(ContactForm())
+
+    assert "focus:ring-[color:var(--neo-focus)]" in html
+    assert "focus:ring-[color:var(--neo-focus-text)]" in html
+    assert "ring-blue-400" not in html and "ring-yellow-400" not in html
+
+    bound = render_form(ContactForm(data={}))
+    assert "bg-[color:var(--neo-field-error-bg)]" in bound
+    assert "border-[color:var(--neo-field-error-border)]" in bound
+    assert "bg-[color:var(--neo-form-error-bg)]" in bound
+    assert "text-[color:var(--neo-field-error-text)]" in bound
+    assert "bg-red-" not in bound
+    assert "text-red-" not in bound
+
+
+@override_settings(CRISPY_NEUROBRUTALIST_THEME_VARIABLES=True)
+def test_themed_field_template():
+    """Test that the error text of ``field.html`` and its error block read CSS variables."""
+    form = ContactForm(data={})
+    html = Template("{% load neuro_filters %}{{ form.name|as_crispy_field }}").render(
+        Context({"form": form})
+    )
+
+    assert html.count("text-[color:var(--neo-field-error-text)]") == 3
+    assert "text-red-" not in html
+
+
+def test_themed_output_is_theme_independent():
+    """Test that switching the setting drops cached output and restores it."""
+    default_html = render_form(ContactForm())
+    with override_settings(CRISPY_NEUROBRUTALIST_THEME_VARIABLES=True):
+        themed_html = render_form(ContactForm())
+        assert class_mode(pack_settings()) == "tailwind:themed"
+
+    assert themed_html != default_html
+    assert render_form(ContactForm()) == default_html
+
+
+@override_settings(
+    CRISPY_NEUROBRUTALIST_THEME_VARIABLES=True, CRISPY_NEUROBRUTALIST_SEMANTIC_CLASSES=True
+)
+def test_themed_semantic_css():
+    """Test that the semantic component classes apply the CSS-variable colors."""
+    css = semantic_css()
+
+    assert "focus:ring-[color:var(--neo-focus)]" in css
+    assert "bg-[color:var(--neo-field-error-bg)]" in css
+    assert "focus:ring-blue-400" not in css
+
+
+def test_neo_theme_css_tag():
+    """Test that ``{% neo_theme_css %}`` renders a style element."""
+    html = Template("{% load neo_field %}{% neo_theme_css colors selector='.dark' %}").render(
+        Context({"colors": {"focus": "rgb(250 204 21)"}})
+    )
+
+    assert html.startswith("<style>.dark{--neo-primary:#60a5fa;")
+    assert "--neo-focus:rgb(250 204 21);" in html
+    assert html.endswith("}</style>")
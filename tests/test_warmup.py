@@ -0,0 +1,138 @@
+"""Tests for the start-up warm-up of templates and render caches."""
+
+import logging
+
+import pytest
+from crispy_forms.helper import FormHelper
+from crispy_forms.templatetags import crispy_forms_filters, crispy_forms_tags
+from django import forms
+from django.apps import apps
+from django.core.exceptions import ImproperlyConfigured
+from django.forms import formset_factory
+from django.template.loader import get_template
+
+from crispy_neurobrutalist.plan import clear_plan_cache, pack_templates_in_effect, plan_cache_info
+from crispy_neurobrutalist.templatetags import neuro_filters
+from crispy_neurobrutalist.warmup import pack_template_names, warm_up
+
+
+class ContactForm(forms.Form):
+    """Form rendered with ``|crispy``."""
+
+    name = forms.CharField()
+    message = forms.CharField(widget=forms.Textarea)
+
+
+class HelperForm(ContactForm):
+    """Form rendered with ``{% crispy %}``."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper = FormHelper()
+
+
+ContactFormSet = formset_factory(ContactForm)
+
+
+class UserForm(ContactForm):
+    """Form that can't be built without arguments."""
+
+    def __init__(self, user, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+
+class BrokenForm(ContactForm):
+    """Form whose render raises."""
+
+    def __iter__(self):
+        raise RuntimeError("broken")
+
+
+TEMPLATE_CACHES = [
+    crispy_forms_filters.uni_form_template,
+    crispy_forms_filters.uni_formset_template,
+    crispy_forms_tags.whole_uni_form_template,
+    neuro_filters.uni_form_template,
+    neuro_filters.uni_formset_template,
+]
+
+
+@pytest.fixture(autouse=True)
+def cold_caches():
+    for cache in TEMPLATE_CACHES:
+        cache.cache_clear()
+    clear_plan_cache()
+    yield
+    clear_plan_cache()
+
+
+def test_pack_template_names():
+    """Test that every shipped template is listed and loadable."""
+    names = pack_template_names()
+
+    assert "neobrutalist/field.html" in names
+    assert "neobrutalist/layout/select.html" in names
+    for name in names:
+        get_template(name)
+
+
+def test_warm_up_fills_template_caches():
+    """Test that warming up fills crispy's and the pack's template caches."""
+    warm_up([])
+
+    for cache in TEMPLATE_CACHES:
+        assert cache.cache_info().currsize == 1
+    assert pack_templates_in_effect.cache_info().currsize == 2
+
+
+def test_warm_up_renders_forms():
+    """Test that listed forms and formsets are rendered, building their render plans."""
+    warm_up(
+        [
+            "tests.test_warmup.ContactForm",
+            "tests.test_warmup.HelperForm",
+            "tests.test_warmup.ContactFormSet",
+        ]
+    )
+
+    assert plan_cache_info().currsize == 3
+    assert crispy_forms_tags.whole_uni_form_template.cache_info().hits
+
+
+def test_warm_up_forms_setting(settings):
+    """Test that the forms default to ``CRISPY_NEUROBRUTALIST_WARM_UP_FORMS``."""
+    settings.CRISPY_NEUROBRUTALIST_WARM_UP_FORMS = ["tests.test_warmup.ContactForm"]
+
+    warm_up()
+
+    assert plan_cache_info().currsize == 1
+
+
+def test_unknown_form_path():
+    """Test that a wrong dotted path is reported as a configuration error."""
+    with pytest.raises(ImproperlyConfigured, match="tests.test_warmup.Missing"):
+        warm_up(["tests.test_warmup.Missing"])
+
+
+def test_forms_that_cant_be_warmed_up_are_skipped(caplog):
+    """Test that forms needing arguments or failing to render only log."""
+    with caplog.at_level(logging.WARNING, logger="crispy_neurobrutalist.warmup"):
+        warm_up(["tests.test_warmup.UserForm", "tests.test_warmup.BrokenForm"])
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages == [
+        "Not warming up tests.test_warmup.UserForm: it requires constructor arguments.",
+        "Warming up tests.test_warmup.BrokenForm failed",
+    ]
+
+
+@pytest.mark.parametrize("enabled", [False, True])
+def test_ready_warms_up_when_enabled(settings, enabled):
+    """Test that ``AppConfig.ready()`` only warms up with the setting on."""
+    settings.CRISPY_NEUROBRUTALIST_WARM_UP = enabled
+    settings.CRISPY_NEUROBRUTALIST_WARM_UP_FORMS = ["tests.test_warmup.ContactForm"]
+
+    apps.get_app_config("crispy_neurobrutalist").ready()
+
+    assert neuro_filters.uni_form_template.cache_info().currsize == enabled
+    assert plan_cache_info().currsize == enabled
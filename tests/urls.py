@@ -0,0 +1,9 @@
+"""
+URL configuration for running tests.
+"""
+
+from django.urls import include, path
+
+urlpatterns = [
+    path("neo/", include("crispy_neurobrutalist.urls")),
+]